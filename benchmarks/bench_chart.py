@@ -0,0 +1,100 @@
+# ============================================================================
+# benchmarks/bench_chart.py
+# ============================================================================
+
+"""
+Benchmark - Chart redraw time for large rate histories
+Usage: python benchmarks/bench_chart.py [points]
+
+Downsampling is always measured; canvas redraws need a display and are
+skipped (reported as None) without one.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from view.rate_chart import RateChart, minmax_downsample  # noqa: E402
+
+
+def synthetic_history(points, seed=7):
+    """Random-walk rates sampled every five minutes"""
+    rng = np.random.default_rng(seed)
+    timestamps = time.time() - 300.0 * np.arange(points)[::-1]
+    rates = 0.9 * np.exp(np.cumsum(rng.normal(0, 0.0005, points)))
+    return timestamps, rates
+
+
+def best_ms(func, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def measure_canvas(timestamps, rates):
+    """(full redraw ms, naive redraw ms, incremental append ms) or Nones without a display"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None, None, None
+    try:
+        root.withdraw()
+        chart = RateChart(root, width=800, height=320)
+        chart.set_series(timestamps, rates)
+
+        full = best_ms(chart.redraw)
+
+        # Every point as one polyline, as a chart without level-of-detail would draw it
+        coords = np.empty(len(timestamps) * 2)
+        coords[0::2] = np.linspace(0, 800, len(timestamps))
+        coords[1::2] = (rates - rates.min()) / np.ptp(rates) * 320
+
+        def naive():
+            chart.canvas.delete("all")
+            chart.canvas.create_line(*coords.tolist())
+            root.update_idletasks()
+
+        naive_ms = best_ms(naive, repeat=2)
+
+        chart.set_series(timestamps, rates)
+        step = timestamps[-1] - timestamps[-2]
+        start = time.perf_counter()
+        for i in range(1, 101):
+            chart.append(timestamps[-1] + i * step, rates[-1])
+        append = (time.perf_counter() - start) / 100 * 1000
+        return full, naive_ms, append
+    finally:
+        root.destroy()
+
+
+def run(points=100_000, buckets=800):
+    timestamps, rates = synthetic_history(points)
+    downsample = best_ms(lambda: minmax_downsample(timestamps, rates, buckets))
+    drawn = len(minmax_downsample(timestamps, rates, buckets)[0])
+    full, naive, append = measure_canvas(timestamps, rates)
+    return {
+        'points': points,
+        'drawn_points': drawn,
+        'downsample_ms': downsample,
+        'redraw_ms': full,
+        'naive_redraw_ms': naive,
+        'append_ms': append,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for key, value in run(n).items():
+        if value is None:
+            print(f"{key:>18}: n/a (no display)")
+        else:
+            print(f"{key:>18}: {value:,.3f}" if isinstance(value, float) else f"{key:>18}: {value:,}")
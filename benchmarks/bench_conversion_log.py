@@ -0,0 +1,94 @@
+# ============================================================================
+# benchmarks/bench_conversion_log.py
+# ============================================================================
+
+"""
+Benchmark - Conversion log: batched ingest and aggregate queries over many rows
+Usage: python benchmarks/bench_conversion_log.py [rows]
+
+Rows are spread over 90 days and ~300 pairs. `scan_top_pairs_ms` runs the same
+query as top_pairs against the raw table, to show what the rollup saves.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from model.conversion_log import ConversionLog  # noqa: E402
+
+CODES = ("USD", "EUR", "GBP", "JPY", "CHF", "CAD", "AUD", "GHS", "NGN", "INR",
+         "CNY", "MXN", "BRL", "ZAR", "SEK", "KES", "PLN", "TRY")
+
+
+def fill(log, rows, chunk=10000, days=90, seed=17):
+    rng = np.random.default_rng(seed)
+    codes = np.array(CODES)
+    now = time.time()
+    for start in range(0, rows, chunk):
+        n = min(chunk, rows - start)
+        # Skewed pair popularity, like real usage
+        src = codes[np.minimum(rng.zipf(1.6, n) - 1, len(codes) - 1)]
+        dst = codes[rng.integers(0, len(codes), n)]
+        amounts = rng.uniform(1, 1000, n).round(2)
+        ts = now - (rows - start) / rows * days * 86400
+        log.record_many(amounts.tolist(), src.tolist(), dst.tolist(), (amounts * 1.1).tolist(),
+                        ts=ts, wait=True)
+
+
+def best_ms(func, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def run(rows=300_000) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        log = ConversionLog(os.path.join(tmp, "history.db")).start()
+        start = time.perf_counter()
+        fill(log, rows)
+        log.flush()
+        ingest = time.perf_counter() - start
+
+        # Cost on the caller's thread for one GUI conversion
+        count = 2000
+        start = time.perf_counter()
+        for i in range(count):
+            log.record(100.0, "USD", "EUR", 92.0, 0.92)
+        record_ns = (time.perf_counter() - start) / count * 1e9
+        log.flush()
+
+        reader = log._reader()
+        results = {
+            'rows': rows,
+            'ingest_rows_per_sec': rows / ingest,
+            'record_call_ns': record_ns,
+            'top_pairs_ms': best_ms(lambda: log.top_pairs(10)),
+            'top_pairs_7d_ms': best_ms(lambda: log.top_pairs(10, days=7)),
+            'daily_totals_30d_ms': best_ms(lambda: log.daily_totals(30)),
+            'daily_pair_ms': best_ms(lambda: log.daily_totals(None, "USD", "EUR")),
+            'recent_pair_ms': best_ms(lambda: log.recent(50, "USD", "EUR")),
+            'scan_top_pairs_ms': best_ms(lambda: reader.execute(
+                "SELECT from_curr, to_curr, COUNT(*) AS n FROM conversions "
+                "GROUP BY from_curr, to_curr ORDER BY n DESC LIMIT 10").fetchall(), repeat=2),
+            'write_batches': log.batches,
+        }
+        reader.close()
+        log.close()
+        results['db_kb'] = os.path.getsize(log.path) / 1024
+    return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    for key, value in run(n).items():
+        print(f"{key:>22}: {value:,.3f}" if isinstance(value, float) else f"{key:>22}: {value:,}")
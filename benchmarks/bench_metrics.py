@@ -0,0 +1,63 @@
+# ============================================================================
+# benchmarks/bench_metrics.py
+# ============================================================================
+
+"""
+Benchmark - Cost of instrumentation on hot paths, with metrics enabled and disabled
+Usage: python benchmarks/bench_metrics.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_model  # noqa: E402
+from model import metrics  # noqa: E402
+
+
+def per_call_ns(func, number=200_000, repeat=7) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def measure(enabled: bool, model, counter, histogram) -> dict:
+    metrics.set_enabled(enabled)
+
+    def timed_block():
+        with histogram.time():
+            pass
+
+    return {
+        'counter_inc_ns': per_call_ns(counter.inc),
+        'histogram_observe_ns': per_call_ns(lambda: histogram.observe(0.001)),
+        'histogram_time_ns': per_call_ns(timed_block),
+        'get_rate_ns': per_call_ns(lambda: model.get_rate("EUR", "GHS")),
+    }
+
+
+def run() -> dict:
+    model = load_fixture_model()
+    counter = metrics.counter("bench_counter_total", "Benchmark counter")
+    histogram = metrics.histogram("bench_seconds", "Benchmark histogram")
+    previous = metrics.REGISTRY.enabled
+    try:
+        # Interleave so machine noise hits both modes alike
+        on, off = {}, {}
+        for _ in range(2):
+            for name, value in measure(True, model, counter, histogram).items():
+                on[name] = min(on.get(name, value), value)
+            for name, value in measure(False, model, counter, histogram).items():
+                off[name] = min(off.get(name, value), value)
+    finally:
+        metrics.set_enabled(previous)
+
+    result = {f"enabled_{name}": value for name, value in on.items()}
+    result.update({f"disabled_{name}": value for name, value in off.items()})
+    return result
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>32}: {value:,.1f}")
@@ -0,0 +1,65 @@
+# ============================================================================
+# benchmarks/bench_parallel.py
+# ============================================================================
+
+"""
+Benchmark - Bulk conversion throughput from 1 to N worker processes
+Usage: python benchmarks/bench_parallel.py [rows] [max_workers]
+"""
+
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_model  # noqa: E402
+from model.bulk_converter import ConversionSpec, convert_csv  # noqa: E402
+from model.parallel_converter import convert_file_parallel  # noqa: E402
+
+
+def write_ledger(path, rows, codes):
+    rng = random.Random(7)
+    with open(path, 'w') as f:
+        f.write("id,amount,from,to\n")
+        for i in range(rows):
+            f.write(f"{i},{rng.uniform(1, 10000):.2f},{rng.choice(codes)},{rng.choice(codes)}\n")
+
+
+def run(rows=1_000_000, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    model = load_fixture_model()
+    spec = ConversionSpec()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = os.path.join(tmp, "ledger.csv")
+        output = os.path.join(tmp, "out.csv")
+        write_ledger(ledger, rows, list(model.matrix.codes))
+
+        start = time.perf_counter()
+        with open(ledger, newline="") as src:
+            convert_csv(model, src, io.StringIO(), spec)
+        single = time.perf_counter() - start
+        results = {'rows': rows, 'single_process_rows_per_sec': rows / single}
+
+        workers = 1
+        while workers <= max_workers:
+            start = time.perf_counter()
+            convert_file_parallel(model, ledger, output, "csv", spec, workers)
+            elapsed = time.perf_counter() - start
+            results[f'workers_{workers}_rows_per_sec'] = rows / elapsed
+            results[f'workers_{workers}_speedup'] = single / elapsed
+            workers *= 2
+        return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    w = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    for key, value in run(n, w).items():
+        print(f"{key:>32}: {value:,.2f}")
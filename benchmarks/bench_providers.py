@@ -0,0 +1,82 @@
+# ============================================================================
+# benchmarks/bench_providers.py
+# ============================================================================
+
+"""
+Benchmark - Hedged requests and provider selection against local stub providers
+Usage: python benchmarks/bench_providers.py [slow_latency_seconds]
+"""
+
+import socket
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import FIXTURE  # noqa: E402
+from benchmarks.stub_rates_server import StubRatesServer  # noqa: E402
+from model.rate_fetcher import RateFetcher  # noqa: E402
+from model.rate_providers import FixtureProvider, HttpJsonProvider  # noqa: E402
+
+
+def timed_fetch(fetcher, base="USD") -> float:
+    start = time.perf_counter()
+    fetcher.fetch(base)
+    return time.perf_counter() - start
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run(slow_latency=1.0, fast_latency=0.02, hedge_after=0.1, fetches=5):
+    slow = StubRatesServer(latency=slow_latency).start()
+    fast = StubRatesServer(latency=fast_latency).start()
+    try:
+        # One slow provider: every fetch waits for it
+        single = RateFetcher(providers=[HttpJsonProvider("slow", slow.api_url)])
+        single_ms = timed_fetch(single) * 1000
+        single.close()
+
+        # Slow listed first: the first fetch is hedged, later ones go to the fast one
+        fetcher = RateFetcher(providers=[HttpJsonProvider("slow", slow.api_url),
+                                         HttpJsonProvider("fast", fast.api_url)],
+                              hedge_after=hedge_after)
+        first_ms = timed_fetch(fetcher) * 1000
+        time.sleep(slow_latency)  # let the losing request finish and report its latency
+        steady_ms = min(timed_fetch(fetcher) for _ in range(fetches)) * 1000
+        chosen = fetcher.ranked_providers()[0].name
+        stats = fetcher.stats()
+        fetcher.close()
+
+        # Dead HTTP provider in front of a fixture: failover without waiting for the hedge
+        dead = RateFetcher(providers=[
+            HttpJsonProvider("dead", f"http://127.0.0.1:{unused_port()}/v4/latest/"),
+            FixtureProvider.from_file("fixture", FIXTURE),
+        ], hedge_after=5.0, retries=0)
+        failover_ms = timed_fetch(dead) * 1000
+        dead.close()
+    finally:
+        slow.stop()
+        fast.stop()
+
+    return {
+        'single_slow_ms': single_ms,
+        'hedged_first_ms': first_ms,
+        'steady_state_ms': steady_ms,
+        'failover_ms': failover_ms,
+        'chosen_provider': chosen,
+        'hedged_requests': stats['hedged'],
+        'slow_requests': slow.requests_served,
+        'fast_requests': fast.requests_served,
+    }
+
+
+if __name__ == "__main__":
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    for key, value in run(latency).items():
+        print(f"{key:>18}: {value:,.1f}" if isinstance(value, float) else f"{key:>18}: {value}")
@@ -0,0 +1,89 @@
+# ============================================================================
+# benchmarks/bench_rate_matrix.py
+# ============================================================================
+
+"""
+Benchmark - Per-call dict conversion vs. precomputed rate matrix, float and exact
+Usage: python benchmarks/bench_rate_matrix.py [conversions]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_model  # noqa: E402
+
+
+def legacy_convert(rates, base, amount, from_curr, to_curr):
+    """The original dict-based get_rate + convert path, kept for comparison"""
+    if not rates:
+        return 0.0
+    if from_curr not in rates and from_curr != base:
+        return 0.0
+    if to_curr not in rates:
+        return 0.0
+    if from_curr == base:
+        rate = rates[to_curr]
+    else:
+        rate = rates[to_curr] / rates[from_curr]
+    return round(amount * round(rate, 6), 2)
+
+
+def run(conversions=200_000):
+    model = load_fixture_model()
+    codes = np.array(model.matrix.codes)
+    rng = np.random.default_rng(42)
+    amounts = rng.uniform(1, 10_000, conversions).round(2)
+    from_codes = codes[rng.integers(0, len(codes), conversions)]
+    to_codes = codes[rng.integers(0, len(codes), conversions)]
+
+    amount_list = amounts.tolist()
+    from_list = from_codes.tolist()
+    to_list = to_codes.tolist()
+
+    start = time.perf_counter()
+    for a, f, t in zip(amount_list, from_list, to_list):
+        legacy_convert(model.rates, model.base_currency, a, f, t)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for a, f, t in zip(amount_list, from_list, to_list):
+        model.convert(a, f, t)
+    per_call = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.convert_many(amounts, from_codes, to_codes)
+    batch = time.perf_counter() - start
+
+    table = model.fixed  # built once per snapshot, outside the timed region
+    start = time.perf_counter()
+    for a, f, t in zip(amount_list[:20_000], from_list, to_list):
+        table.convert_exact(a, f, t)
+    exact_per_call = (time.perf_counter() - start) / min(conversions, 20_000)
+
+    start = time.perf_counter()
+    minor, _ = table.to_minor(amounts, from_codes)
+    table.convert_minor(minor, from_codes, to_codes)
+    exact_batch = time.perf_counter() - start
+
+    return {
+        'conversions': conversions,
+        'legacy_per_call_ns': legacy / conversions * 1e9,
+        'matrix_per_call_ns': per_call / conversions * 1e9,
+        'matrix_batch_ns': batch / conversions * 1e9,
+        'batch_conversions_per_sec': conversions / batch,
+        'exact_per_call_ns': exact_per_call * 1e9,
+        'exact_batch_ns': exact_batch / conversions * 1e9,
+        'exact_batch_conversions_per_sec': conversions / exact_batch,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for key, value in run(n).items():
+        print(f"{key:>32}: {value:,.1f}")
@@ -0,0 +1,84 @@
+# ============================================================================
+# benchmarks/bench_rebase.py
+# ============================================================================
+
+"""
+Benchmark - Base switches by local rebasing vs. a download, and provider reconciliation
+Usage: python benchmarks/bench_rebase.py [provider_latency_seconds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import FIXTURE, load_fixture_payload  # noqa: E402
+from model.currency_model import CurrencyModel  # noqa: E402
+from model.rate_providers import FixtureProvider  # noqa: E402
+
+BASES = ("EUR", "GBP", "JPY", "GHS", "CHF")
+
+
+def make_model(tmp, latency, reconcile=False, providers=1, skew=None):
+    payload = load_fixture_payload()
+    sources = [FixtureProvider.from_file(f"fixture{i}", FIXTURE, latency) for i in range(providers)]
+    if skew:
+        rates = dict(payload["rates"])
+        rates[skew] *= 1.02
+        sources.append(FixtureProvider("skewed", rates, payload["base"], latency))
+    model = CurrencyModel(providers=sources, history_dir=None, reconcile=reconcile)
+    model.cache_file = os.path.join(tmp, "rates.fxrs")
+    return model
+
+
+def run(latency=0.05) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        return measure(tmp, latency)
+
+
+def measure(tmp, latency) -> dict:
+    # Download per base: what every base switch used to cost
+    model = make_model(tmp, latency)
+    model.fetch_rates("USD")
+    start = time.perf_counter()
+    for base in BASES:
+        model.refresh_rates(base)
+    download_ms = (time.perf_counter() - start) / len(BASES) * 1000
+    model.fetcher.close()
+
+    # Rebase the snapshot already held
+    model = make_model(tmp, latency)
+    model.fetch_rates("USD")
+    sent = model.fetcher.requests_sent
+    start = time.perf_counter()
+    for base in BASES:
+        model.fetch_rates(base)
+    rebase_ms = (time.perf_counter() - start) / len(BASES) * 1000
+    rebase_requests = model.fetcher.requests_sent - sent
+    model.fetcher.close()
+
+    # Three providers queried at once, one of them 2% off on GBP
+    model = make_model(tmp, latency, reconcile=True, providers=2, skew="GBP")
+    start = time.perf_counter()
+    model.refresh_rates("USD")
+    reconcile_ms = (time.perf_counter() - start) * 1000
+    outliers = len(model.last_reconciliation.outliers)
+    model.fetcher.close()
+
+    return {
+        'download_switch_ms': download_ms,
+        'rebase_switch_ms': rebase_ms,
+        'rebase_requests': rebase_requests,
+        'reconcile_3_providers_ms': reconcile_ms,
+        'outliers_found': outliers,
+    }
+
+
+if __name__ == "__main__":
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    for key, value in run(latency).items():
+        print(f"{key:>26}: {value:,.3f}" if isinstance(value, float) else f"{key:>26}: {value}")
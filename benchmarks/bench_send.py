@@ -0,0 +1,95 @@
+# ============================================================================
+# benchmarks/bench_send.py
+# ============================================================================
+
+"""
+Benchmark - Send tab: parsing, batch quoting and table scrolling for many recipients
+Usage: python benchmarks/bench_send.py [recipients]
+
+Table scrolling needs a display and is skipped (reported as None) without one.
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_model  # noqa: E402
+from model.transfer_quotes import COLUMNS, parse_recipients, quote_transfers  # noqa: E402
+
+
+def recipient_lines(codes, count, seed=11):
+    rng = np.random.default_rng(seed)
+    amounts = rng.uniform(1, 5000, count).round(2)
+    sources = np.asarray(codes)[rng.integers(0, len(codes), count)]
+    targets = np.asarray(codes)[rng.integers(0, len(codes), count)]
+    return ["recipient,amount,from,to"] + [
+        f"Recipient {i},{a:.2f},{f},{t}"
+        for i, (a, f, t) in enumerate(zip(amounts.tolist(), sources.tolist(), targets.tolist()))]
+
+
+def best_ms(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def measure_table(quotes):
+    """(ms per scroll step, rows materialized) or Nones without a display"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None, None
+    try:
+        from view.virtual_table import VirtualTable
+        root.withdraw()
+        table = VirtualTable(root, COLUMNS, visible_rows=15)
+        table.frame.pack()
+        table.set_source(len(quotes), quotes.rows)
+        steps = 200
+        start = time.perf_counter()
+        for i in range(steps):
+            table.scroll_to(i * len(quotes) // steps)
+            root.update_idletasks()
+        return (time.perf_counter() - start) / steps * 1000, table.materialized
+    finally:
+        root.destroy()
+
+
+def run(count=50_000):
+    model = load_fixture_model()
+    matrix = model.matrix
+    lines = recipient_lines(matrix.codes, count)
+    recipients = parse_recipients(lines)
+
+    quotes = quote_transfers(matrix, recipients)
+    buffer = io.StringIO()
+    scroll, materialized = measure_table(quotes)
+    return {
+        'recipients': count,
+        'parse_ms': best_ms(lambda: parse_recipients(lines)),
+        'quote_ms': best_ms(lambda: quote_transfers(matrix, recipients)),
+        'exact_quote_ms': best_ms(lambda: quote_transfers(matrix, recipients, exact=True)),
+        'visible_rows_ms': best_ms(lambda: quotes.rows(count // 2, count // 2 + 15)),
+        'export_ms': best_ms(lambda: quotes.write_csv(buffer), repeat=1),
+        'scroll_step_ms': scroll,
+        'rows_materialized': materialized,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    for key, value in run(n).items():
+        if value is None:
+            print(f"{key:>18}: n/a (no display)")
+        else:
+            print(f"{key:>18}: {value:,.3f}" if isinstance(value, float) else f"{key:>18}: {value:,}")
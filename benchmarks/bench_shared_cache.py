@@ -0,0 +1,97 @@
+# ============================================================================
+# benchmarks/bench_shared_cache.py
+# ============================================================================
+
+"""
+Benchmark - Upstream requests when several processes refresh the same base
+Usage: python benchmarks/bench_shared_cache.py [processes]
+
+Every process refreshes USD `rounds` times against the local stub server,
+first each on its own, then through one SharedRateCache directory.
+"""
+
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.stub_rates_server import StubRatesServer  # noqa: E402
+from model.currency_model import CurrencyModel  # noqa: E402
+from model.rate_providers import HttpJsonProvider  # noqa: E402
+from model.shared_cache import FileLock, SharedRateCache  # noqa: E402
+
+
+def refresh_worker(api_url, cache_dir, rounds, barrier, results):
+    shared = SharedRateCache(cache_dir, max_age=60) if cache_dir else None
+    model = CurrencyModel(providers=[HttpJsonProvider("stub", api_url)], history_dir=None,
+                          shared_cache=shared)
+    barrier.wait()
+    start = time.perf_counter()
+    ok = all(model.refresh_rates("USD") for _ in range(rounds))
+    results.put((ok, time.perf_counter() - start))
+    model.fetcher.close()
+
+
+def run_processes(api_url, processes, rounds, cache_dir=None):
+    ctx = multiprocessing.get_context("spawn")
+    barrier, results = ctx.Barrier(processes), ctx.Queue()
+    workers = [ctx.Process(target=refresh_worker,
+                           args=(api_url, cache_dir, rounds, barrier, results))
+               for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    outcomes = [results.get(timeout=60) for _ in workers]
+    for worker in workers:
+        worker.join()
+    assert all(ok for ok, _ in outcomes), "a refresh failed"
+    return max(seconds for _, seconds in outcomes)
+
+
+def per_call_ms(func, number=200):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1000
+
+
+def run(processes=6, rounds=3, latency=0.05) -> dict:
+    server = StubRatesServer(latency=latency).start()
+    try:
+        independent = run_processes(server.api_url, processes, rounds)
+        independent_requests = server.requests_served
+
+        with tempfile.TemporaryDirectory() as tmp:
+            shared = run_processes(server.api_url, processes, rounds, cache_dir=tmp)
+            shared_requests = server.requests_served - independent_requests
+
+            cache = SharedRateCache(tmp, max_age=60)
+            lock = FileLock(f"{tmp}/bench.lock")
+
+            def lock_cycle():
+                lock.acquire()
+                lock.release()
+
+            hit_ms = per_call_ms(lambda: cache.get_or_fetch("USD", None))
+            lock_ms = per_call_ms(lock_cycle)
+    finally:
+        server.stop()
+
+    return {
+        'processes': processes,
+        'independent_requests': independent_requests,
+        'shared_requests': shared_requests,
+        'independent_ms': independent * 1000,
+        'shared_ms': shared * 1000,
+        'shared_hit_ms': hit_ms,
+        'lock_cycle_ms': lock_ms,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    for key, value in run(n).items():
+        print(f"{key:>22}: {value:,.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
@@ -0,0 +1,140 @@
+# ============================================================================
+# benchmarks/bench_snapshot_delta.py
+# ============================================================================
+
+"""
+Benchmark - Delta snapshot updates: disk bytes, change detection and alert work per refresh
+Usage: python benchmarks/bench_snapshot_delta.py [refreshes]
+
+Refreshes move a handful of currencies each; every third one returns identical rates.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_rates  # noqa: E402
+from model import snapshot_delta  # noqa: E402
+from model.alert_engine import AlertEngine  # noqa: E402
+from model.rate_cache import RateSnapshot  # noqa: E402
+from model.snapshot_store import write_snapshot  # noqa: E402
+
+
+def refreshes(rates, count, moved=5, seed=3):
+    """Successive rate dicts: `moved` codes change, except every third refresh"""
+    rng = np.random.default_rng(seed)
+    codes = sorted(rates)
+    current = dict(rates)
+    for i in range(count):
+        if i % 3:
+            current = dict(current)
+            for j in rng.choice(len(codes), moved, replace=False):
+                current[codes[j]] *= 1 + rng.normal(0, 1e-4)
+        yield current
+
+
+def directory_bytes(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def measure_disk(tmp, snapshots):
+    full_dir, journal_dir = os.path.join(tmp, "full"), os.path.join(tmp, "journal")
+    os.makedirs(full_dir)
+    os.makedirs(journal_dir)
+    full_path = os.path.join(full_dir, "rates.fxrs")
+    journal = snapshot_delta.SnapshotJournal(os.path.join(journal_dir, "rates.fxrs"))
+
+    full_bytes = journal_bytes = 0
+    full_seconds = journal_seconds = 0.0
+    for i, rates in enumerate(snapshots):
+        start = time.perf_counter()
+        write_snapshot(full_path, rates, "USD", float(i))
+        full_seconds += time.perf_counter() - start
+        full_bytes += os.path.getsize(full_path)
+
+        before = directory_bytes(journal_dir)
+        start = time.perf_counter()
+        kind = journal.record(rates, "USD", float(i))
+        journal_seconds += time.perf_counter() - start
+        after = directory_bytes(journal_dir)
+        # A checkpoint rewrites the snapshot file and empties the log
+        journal_bytes += after if kind == "checkpoint" else after - before
+
+    start = time.perf_counter()
+    snapshot_delta.SnapshotJournal(journal.path).load()
+    replay = time.perf_counter() - start
+    n = len(snapshots)
+    return {
+        'full_write_bytes': full_bytes / n,
+        'journal_write_bytes': journal_bytes / n,
+        'full_write_ms': full_seconds / n * 1000,
+        'journal_write_ms': journal_seconds / n * 1000,
+        'journal_load_ms': replay * 1000,
+    }
+
+
+def measure_alerts(snapshots, rules=2000):
+    engine = AlertEngine(path=None)
+    codes = sorted(snapshots[0])
+    rng = np.random.default_rng(5)
+    for _ in range(rules):
+        a, b = rng.choice(len(codes), 2, replace=False)
+        engine.add_rule(codes[a], codes[b], "above", 1e12, save=False)
+
+    held = [RateSnapshot("USD", rates, None) for rates in snapshots]
+    timings = {}
+    for mode in ("full", "delta"):
+        previous = None
+        start = time.perf_counter()
+        for snapshot in held:
+            delta = snapshot_delta.diff(previous, snapshot)
+            if not delta.unchanged:
+                engine.evaluate(snapshot, delta if mode == "delta" else None)
+            previous = snapshot
+        timings[mode] = (time.perf_counter() - start) / len(held) * 1000
+    return timings
+
+
+def run(count=150) -> dict:
+    snapshots = list(refreshes(load_fixture_rates(), count))
+    with tempfile.TemporaryDirectory() as tmp:
+        results = measure_disk(tmp, snapshots)
+
+    a, b = RateSnapshot("USD", snapshots[1], None), RateSnapshot("USD", snapshots[2], None)
+    same = RateSnapshot("USD", dict(snapshots[1]), None)
+    alerts = measure_alerts(snapshots)
+    repeat = 2000
+    start = time.perf_counter()
+    for _ in range(repeat):
+        snapshot_delta.diff(a, b)
+    diff_ms = (time.perf_counter() - start) / repeat * 1000
+    start = time.perf_counter()
+    for _ in range(repeat):
+        snapshot_delta.diff(a, same)
+    unchanged_ms = (time.perf_counter() - start) / repeat * 1000
+    start = time.perf_counter()
+    for _ in range(200):
+        snapshot_delta.content_hash(snapshots[1], "USD")
+    hash_ms = (time.perf_counter() - start) / 200 * 1000
+
+    results.update({
+        'content_hash_ms': hash_ms,
+        'diff_ms': diff_ms,
+        'unchanged_diff_ms': unchanged_ms,
+        'alerts_full_ms': alerts['full'],
+        'alerts_delta_ms': alerts['delta'],
+    })
+    return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    for key, value in run(n).items():
+        print(f"{key:>22}: {value:,.4f}")
@@ -0,0 +1,82 @@
+# ============================================================================
+# benchmarks/bench_snapshot_store.py
+# ============================================================================
+
+"""
+Benchmark - JSON cache vs. memory-mapped binary snapshot loading
+Usage: python benchmarks/bench_snapshot_store.py [processes]
+"""
+
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_rates  # noqa: E402
+from model.snapshot_store import read_snapshot, write_snapshot  # noqa: E402
+
+
+def synthetic_rates(count):
+    """Fixture rates padded with synthetic codes to exaggerate parse costs"""
+    rates = load_fixture_rates()
+    for i in range(max(0, count - len(rates))):
+        rates[f"X{i:05d}"] = 1.0 + i / 1000
+    return rates
+
+
+def load_json(path):
+    start = time.perf_counter()
+    with open(path) as f:
+        data = json.load(f)
+    total = sum(data['rates'].values())
+    return time.perf_counter() - start, total
+
+
+def load_binary(path):
+    start = time.perf_counter()
+    view = read_snapshot(path)
+    total = float(view.rates.sum())
+    return time.perf_counter() - start, total
+
+
+def timed_min(loader, path, repeat=20):
+    return min(loader(path)[0] for _ in range(repeat))
+
+
+def run(processes=8, count=5000):
+    rates = synthetic_rates(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "rates.json"
+        bin_path = Path(tmp) / "rates.fxrs"
+        with open(json_path, 'w') as f:
+            json.dump({'rates': rates, 'base_currency': 'USD', 'last_updated': None}, f)
+        write_snapshot(bin_path, rates, 'USD', time.time())
+
+        results = {
+            'currencies': len(rates),
+            'json_bytes': json_path.stat().st_size,
+            'binary_bytes': bin_path.stat().st_size,
+            'json_load_ms': timed_min(load_json, json_path) * 1000,
+            'binary_load_ms': timed_min(load_binary, bin_path) * 1000,
+        }
+
+        # Fresh processes each load the same file; binary pages are shared via the page cache
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes) as pool:
+            json_times = pool.map(load_json, [json_path] * processes)
+            bin_times = pool.map(load_binary, [bin_path] * processes)
+        results['json_multi_process_ms'] = max(t for t, _ in json_times) * 1000
+        results['binary_multi_process_ms'] = max(t for t, _ in bin_times) * 1000
+        results['processes'] = processes
+        return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    for key, value in run(n).items():
+        print(f"{key:>26}: {value:,.3f}" if isinstance(value, float) else f"{key:>26}: {value}")
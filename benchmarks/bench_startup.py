@@ -0,0 +1,95 @@
+# ============================================================================
+# benchmarks/bench_startup.py
+# ============================================================================
+
+"""
+Benchmark - Cold start (fresh interpreter) to rates ready and first render
+Usage: python benchmarks/bench_startup.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def child(api_url):
+    """Runs in the fresh interpreter: time the real startup path against the stub"""
+    started = time.perf_counter()
+    from model.currency_model import CurrencyModel
+    from model.rate_refresher import RateRefresher
+    imported = time.perf_counter()
+    # Networking is imported by the first fetch, not at startup
+    requests_at_import = int("requests" in sys.modules)
+
+    model = CurrencyModel()
+    model.api_url = api_url
+    refresher = RateRefresher(model, interval=3600).start()
+    refresher.ready.wait()
+    ready = time.perf_counter()
+
+    first_render = view_build = None
+    try:
+        import tkinter as tk
+        from view.currency_view import CurrencyView
+        from controller.currency_controller import CurrencyController
+        root = tk.Tk()
+        build_start = time.perf_counter()
+        CurrencyController(model, CurrencyView(root), refresher=refresher, started_at=started)
+        view_build = (time.perf_counter() - build_start) * 1000
+        root.update()
+        first_render = (time.perf_counter() - started) * 1000
+        root.destroy()
+    except Exception:  # no display available
+        pass
+
+    import resource
+    result = {
+        'import_ms': (imported - started) * 1000,
+        'rates_ready_ms': (ready - started) * 1000,
+        'first_render_ms': first_render,
+        'view_build_ms': view_build,
+        'requests_at_import': requests_at_import,
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    sys.stderr.flush()
+    print("RESULT " + json.dumps(result))
+
+
+def run(repeat=3):
+    from benchmarks.stub_rates_server import StubRatesServer
+
+    server = StubRatesServer().start()
+    best = {}
+    try:
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as tmp:
+                start = time.perf_counter()
+                output = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", server.api_url],
+                    cwd=tmp, capture_output=True, text=True, check=True,
+                    env={**os.environ, "PYTHONPATH": str(ROOT)}).stdout
+                wall = (time.perf_counter() - start) * 1000
+            line = next(l for l in output.splitlines() if l.startswith("RESULT "))
+            result = json.loads(line[len("RESULT "):])
+            result['process_wall_ms'] = wall
+            for key, value in result.items():
+                if value is not None:
+                    best[key] = min(best.get(key, value), value)
+    finally:
+        server.stop()
+    return best
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        for key, value in run().items():
+            print(f"{key:>22}: {value:,.1f}")
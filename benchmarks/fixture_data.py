@@ -0,0 +1,37 @@
+# ============================================================================
+# benchmarks/fixture_data.py
+# ============================================================================
+
+"""
+Fixture Data - Offline rate payload shared by the benchmarks and the stub server
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+FIXTURE = ROOT / "benchmarks" / "fixtures" / "rates_usd.json"
+
+
+def load_fixture_payload(path=FIXTURE) -> dict:
+    """The fixture in the upstream API's response shape: {base, date, rates}"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_fixture_rates(path=FIXTURE) -> dict:
+    return load_fixture_payload(path)['rates']
+
+
+def load_fixture_model(**kwargs):
+    """A CurrencyModel holding the fixture snapshot, without touching network or disk"""
+    from model.currency_model import CurrencyModel
+
+    payload = load_fixture_payload()
+    kwargs.setdefault('history_dir', None)
+    model = CurrencyModel(**kwargs)
+    model.set_rates(payload['rates'], payload['base'], f"{payload['date']} 00:00:00")
+    return model
@@ -0,0 +1,111 @@
+# ============================================================================
+# benchmarks/load_test_service.py
+# ============================================================================
+
+"""
+Load Test - Keep-alive / pipelined clients against the conversion service
+Usage: python benchmarks/load_test_service.py [--url http://127.0.0.1:8080]
+       (without --url an in-process service is started on fixture rates)
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_model  # noqa: E402
+from controller.http_service import RateService  # noqa: E402
+
+CODES = ["USD", "EUR", "GBP", "JPY", "GHS", "CAD", "CHF", "INR", "NGN", "ZAR"]
+
+
+def build_request(host, batch_size):
+    if batch_size:
+        body = json.dumps([{"amount": round(random.uniform(1, 1000), 2),
+                            "from": random.choice(CODES), "to": random.choice(CODES)}
+                           for _ in range(batch_size)]).encode()
+        return (f"POST /convert HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode() + body
+    target = f"/convert?from={random.choice(CODES)}&to={random.choice(CODES)}&amount=100"
+    return f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+
+
+async def client(host, port, requests, pipeline, batch_size, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    sent = 0
+    while sent < requests:
+        depth = min(pipeline, requests - sent)
+        start = time.perf_counter()
+        # Send `depth` requests back to back, then read the answers in order
+        writer.write(b"".join(build_request(host, batch_size) for _ in range(depth)))
+        await writer.drain()
+        for _ in range(depth):
+            await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+        sent += depth
+    writer.close()
+
+
+async def load(host, port, connections, requests, pipeline, batch_size):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests, pipeline, batch_size, latencies)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'requests_per_sec': len(latencies) / elapsed,
+        'conversions_per_sec': len(latencies) * max(batch_size, 1) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def start_local_service():
+    """Run the service on fixture rates in a background thread; returns the port"""
+    service = RateService(load_fixture_model(), port=0)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(service.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return service.port
+
+
+def run(url=None, connections=16, requests=500, pipeline=1, batch_size=0):
+    if url:
+        parts = urlsplit(url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", start_local_service()
+    return asyncio.run(load(host, port, connections, requests, pipeline, batch_size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per connection")
+    parser.add_argument("--pipeline", type=int, default=1, help="Requests in flight per connection")
+    parser.add_argument("--batch", type=int, default=0, help="Items per POST /convert (0 = GET)")
+    args = parser.parse_args()
+    results = run(args.url, args.connections, args.requests, args.pipeline, args.batch)
+    for key, value in results.items():
+        print(f"{key:>20}: {value:,.2f}")
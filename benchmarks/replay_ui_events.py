@@ -0,0 +1,228 @@
+# ============================================================================
+# benchmarks/replay_ui_events.py
+# ============================================================================
+
+"""
+Replay - Scripted convert/swap/tab events through the real controller, without Tk
+Usage: python benchmarks/replay_ui_events.py [--events 5000] [--script events.jsonl]
+       [--save-script events.jsonl] [--seed 7]
+
+The controller runs on a HeadlessView over fixture rates. A script is JSON
+lines such as {"event": "key", "value": "12.5"} or {"event": "tab",
+"value": "Charts"}. Each event is fired, then the headless loop is pumped
+(idle callbacks, worker results) until the controller is idle again; that
+wall time is the event's latency, reported per event kind. Any error dialog
+fails the run.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import FIXTURE, load_fixture_model  # noqa: E402
+from controller.currency_controller import CurrencyController  # noqa: E402
+from model.alert_engine import AlertEngine  # noqa: E402
+from model.rate_providers import FixtureProvider  # noqa: E402
+from view.headless_view import HeadlessView  # noqa: E402
+
+ACTIONS = {
+    "key": lambda view, value: view.type_amount(value),
+    "from": lambda view, value: view.select_from(value),
+    "to": lambda view, value: view.select_to(value),
+    "swap": lambda view, value: view.click_swap(),
+    "convert": lambda view, value: view.click_convert(),
+    "tab": lambda view, value: view.open_tab(value),
+    "chart": lambda view, value: view.charts_panel.select(range_name=value),
+    "send": lambda view, value: send_quote(view.send_panel, value),
+    "refresh": lambda view, value: view.press_refresh(),
+}
+
+# Relative frequency of each action in generated scripts; typing is one event per keystroke
+MIX = {"key": 10, "from": 10, "to": 10, "swap": 10, "convert": 18,
+       "tab": 6, "chart": 3, "send": 2, "refresh": 1}
+TABS = ("Convert", "Send", "Charts", "Alerts")
+RANGES = ("24 hours", "7 days", "30 days", "1 year", "All")
+
+
+def send_quote(panel, text):
+    panel.text = text
+    panel.click_quote()
+
+
+def build_app(cache_dir):
+    """(controller, view) on fixture rates; refreshes are served by a fixture provider"""
+    model = load_fixture_model(providers=[FixtureProvider.from_file("fixture", FIXTURE)])
+    # Refreshes save the rate cache; keep it out of the working directory
+    model.cache_file = os.path.join(cache_dir, "rates.fxrs")
+    alerts = AlertEngine(path=None)
+    model.add_snapshot_listener(alerts.evaluate)
+    view = HeadlessView()
+    return CurrencyController(model, view, alerts=alerts), view
+
+
+def generate_script(count, currencies, seed=7, recipients=50):
+    """`count` events drawn from MIX; `currencies` are picker display strings"""
+    rng = random.Random(seed)
+    codes = [text.split(' - ')[0] for text in currencies]
+    kinds, weights = list(MIX), list(MIX.values())
+    events = []
+    while len(events) < count:
+        kind = rng.choices(kinds, weights)[0]
+        if kind == "key":
+            amount = f"{rng.uniform(1, 5000):.2f}"
+            # One event per keystroke, as the amount field sees them
+            events.extend({"event": "key", "value": amount[:i]}
+                          for i in range(1, len(amount) + 1))
+            continue
+        if kind in ("from", "to"):
+            value = rng.choice(currencies)
+        elif kind == "tab":
+            value = rng.choice(TABS)
+        elif kind == "chart":
+            value = rng.choice(RANGES)
+        elif kind == "send":
+            value = "\n".join(f"r{i}, {rng.uniform(10, 900):.2f}, {rng.choice(codes)}, "
+                              f"{rng.choice(codes)}" for i in range(recipients))
+        else:
+            value = None
+        events.append({"event": kind, "value": value})
+    return events[:count]
+
+
+def load_script(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_script(path, events):
+    with open(path, "w", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+class EventReplayer:
+    """Fires script events at a HeadlessView and times each one until the controller settles"""
+
+    def __init__(self, controller, view, timeout=10.0):
+        self.controller = controller
+        self.view = view
+        self.timeout = timeout
+        self.latencies = {}
+
+    def settle(self):
+        """Run UI-thread work until no callback is queued and no task is in flight"""
+        deadline = time.perf_counter() + self.timeout
+        tasks = self.controller.tasks
+        while True:
+            self.view.loop.pump()
+            tasks.drain()
+            if tasks.idle() and not self.view.loop.idle_pending:
+                return
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"Controller still busy after {self.timeout}s: {tasks.stats()}")
+            time.sleep(0.0002)
+
+    def fire(self, event):
+        action = ACTIONS.get(event["event"])
+        if action is None:
+            raise ValueError(f"Unknown event: {event['event']!r}")
+        start = time.perf_counter()
+        action(self.view, event.get("value"))
+        self.settle()
+        self.latencies.setdefault(event["event"], []).append(time.perf_counter() - start)
+
+    def replay(self, events):
+        self.settle()
+        for event in events:
+            self.fire(event)
+        return self.stats()
+
+    def stats(self) -> dict:
+        """{kind: {events, mean_ms, p50_ms, p90_ms, p99_ms, max_ms}}, plus "all" """
+        kinds = dict(self.latencies)
+        kinds["all"] = [seconds for samples in self.latencies.values() for seconds in samples]
+        return {kind: latency_stats(samples) for kind, samples in kinds.items() if samples}
+
+
+def latency_stats(samples) -> dict:
+    samples = sorted(samples)
+    count = len(samples)
+    return {
+        'events': count,
+        'mean_ms': statistics.fmean(samples) * 1000,
+        'p50_ms': samples[count // 2] * 1000,
+        'p90_ms': samples[max(0, int(count * 0.9) - 1)] * 1000,
+        'p99_ms': samples[max(0, int(count * 0.99) - 1)] * 1000,
+        'max_ms': samples[-1] * 1000,
+    }
+
+
+def replay(events):
+    with tempfile.TemporaryDirectory() as tmp:
+        controller, view = build_app(tmp)
+        replayer = EventReplayer(controller, view)
+        try:
+            start = time.perf_counter()
+            stats = replayer.replay(events)
+            elapsed = time.perf_counter() - start
+        finally:
+            controller.tasks.shutdown()
+            controller.model.fetcher.close()
+    return stats, elapsed, view
+
+
+def check_errors(view):
+    """A replay that raised error dialogs did not measure what it claims to"""
+    if view.errors:
+        title, message = view.errors[0]
+        raise RuntimeError(f"{len(view.errors)} error dialogs during replay, "
+                           f"first: {title}: {message}")
+
+
+def run(events=5000, seed=7) -> dict:
+    currencies = list(load_fixture_model().currency_index.display)
+    stats, elapsed, view = replay(generate_script(events, currencies, seed))
+    check_errors(view)
+    results = {'events': events, 'events_per_sec': events / elapsed}
+    for kind, entry in stats.items():
+        results[f'{kind}_p50_ms'] = entry['p50_ms']
+        results[f'{kind}_p99_ms'] = entry['p99_ms']
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5000, help="Events to generate")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--script", help="Replay this JSONL script instead of generating one")
+    parser.add_argument("--save-script", help="Write the generated script here")
+    args = parser.parse_args()
+
+    if args.script:
+        script = load_script(args.script)
+    else:
+        currencies = list(load_fixture_model().currency_index.display)
+        script = generate_script(args.events, currencies, args.seed)
+        if args.save_script:
+            save_script(args.save_script, script)
+
+    stats, elapsed, view = replay(script)
+    print(f"{len(script):,} events in {elapsed:.2f} s ({len(script) / elapsed:,.0f}/s), "
+          f"{len(view.errors)} error dialogs")
+    print(f"{'event':>8} {'count':>7} {'mean':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  (ms)")
+    for kind, entry in sorted(stats.items(), key=lambda item: item[0] == "all"):
+        print(f"{kind:>8} {entry['events']:>7,} {entry['mean_ms']:>8.3f} {entry['p50_ms']:>8.3f} "
+              f"{entry['p90_ms']:>8.3f} {entry['p99_ms']:>8.3f} {entry['max_ms']:>8.3f}")
+    for title, message in view.errors:
+        print(f"[ERROR] {title}: {message}", file=sys.stderr)
+    sys.exit(1 if view.errors else 0)
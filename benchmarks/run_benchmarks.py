@@ -0,0 +1,290 @@
+# ============================================================================
+# benchmarks/run_benchmarks.py
+# ============================================================================
+
+"""
+Benchmark Suite - Runs offline against fixture rates and the stub server,
+saves results as JSON and flags regressions against a stored baseline.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # compare with baseline.json
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --save-baseline      # overwrite baseline.json
+    python benchmarks/run_benchmarks.py --only conversion cache
+    python benchmarks/run_benchmarks.py --only chart            # needs a display for redraws
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks import (bench_chart, bench_conversion_log, bench_fetcher,  # noqa: E402
+                        bench_metrics, bench_providers, bench_rate_matrix, bench_rebase,
+                        bench_send, bench_shared_cache, bench_snapshot_delta, bench_startup,
+                        replay_ui_events)
+from benchmarks.fixture_data import load_fixture_model, load_fixture_payload  # noqa: E402
+from model.snapshot_delta import content_hash  # noqa: E402
+
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+# Changes smaller than this are timer and scheduler noise, whatever their percentage
+NOISE_FLOOR_SECONDS = 1e-6
+UNIT_SECONDS = {"_ns": 1e-9, "_ms": 1e-3}
+REFERENCE = "reference.work_ms"
+
+
+def per_call_ns(func, number=20000, repeat=5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def bench_conversion():
+    model = load_fixture_model()
+    batch = bench_rate_matrix.run(200_000)
+    return {
+        'get_rate_ns': per_call_ns(lambda: model.get_rate("EUR", "GHS")),
+        'convert_ns': per_call_ns(lambda: model.convert(125.5, "EUR", "GHS")),
+        'get_currency_list_ns': per_call_ns(model.get_currency_list, number=500),
+        'batch_conversions_per_sec': batch['batch_conversions_per_sec'],
+    }
+
+
+def bench_cache():
+    model = load_fixture_model()
+    payload = load_fixture_payload()
+    with tempfile.TemporaryDirectory() as tmp:
+        model.cache_file = os.path.join(tmp, "rates.fxrs")
+        model.legacy_cache_file = os.path.join(tmp, "rates.json")
+        with open(model.legacy_cache_file, 'w') as f:
+            json.dump({'rates': payload['rates'], 'base_currency': payload['base'],
+                       'last_updated': f"{payload['date']} 00:00:00"}, f)
+
+        start = time.perf_counter()
+        model.load_rates_from_cache()  # first load imports the JSON
+        json_import = time.perf_counter() - start
+
+        # Saving the snapshot that was just loaded is a no-op; time real writes separately
+        snapshot, journal = model.snapshot, model.journal
+        rates, base = snapshot.rates, snapshot.base
+        moved = dict(rates, EUR=rates["EUR"] * 1.0001)
+        variants = itertools.cycle([(moved, content_hash(moved, base)), (rates, snapshot.digest)])
+        journal.checkpoint_every = float("inf")
+
+        def save_delta():
+            changed, digest = next(variants)
+            return journal.record(changed, base, time.time(), digest)
+
+        kinds = [journal.record(rates, base, time.time(), snapshot.digest), save_delta(), save_delta()]
+        assert kinds == ["unchanged", "delta", "delta"], kinds
+        return {
+            'json_import_ms': json_import * 1000,
+            'unchanged_save_ms': per_call_ns(model.save_rates_to_cache, number=20) / 1e6,
+            'delta_save_ms': per_call_ns(save_delta, number=20) / 1e6,
+            'checkpoint_ms': per_call_ns(
+                lambda: journal.checkpoint(rates, base, time.time(), snapshot.digest),
+                number=20) / 1e6,
+            'load_ms': per_call_ns(model.load_rates_from_cache, number=20) / 1e6,
+        }
+
+
+def bench_fetch():
+    result = bench_fetcher.run(callers=100, latency=0.0)
+    return {
+        'sequential_fetch_ms': result['sequential_fetch_ms'],
+        'burst_ms': result['burst_seconds'] * 1000,
+        'upstream_requests': result['upstream_requests'],
+    }
+
+
+def bench_providers_suite():
+    result = bench_providers.run(slow_latency=0.5)
+    return {name: value for name, value in result.items() if name != 'chosen_provider'}
+
+
+def bench_memory():
+    tracemalloc.start()
+    model = load_fixture_model()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'model_bytes': current,
+        'model_peak_bytes': peak,
+        'matrix_bytes': model.matrix.cross.nbytes,
+    }
+
+
+SUITES = {
+    'conversion': bench_conversion,
+    'cache': bench_cache,
+    'fetch': bench_fetch,
+    'providers': bench_providers_suite,
+    'memory': bench_memory,
+    'startup': bench_startup.run,
+    'chart': bench_chart.run,
+    'metrics': bench_metrics.run,
+    'rebase': bench_rebase.run,
+    'send': bench_send.run,
+    'delta': bench_snapshot_delta.run,
+    'shared': bench_shared_cache.run,
+    'history': bench_conversion_log.run,
+    'ui': replay_ui_events.run,
+}
+
+
+def higher_is_better(metric: str):
+    """True/False for comparable metrics, None for plain counts"""
+    if metric.endswith("_per_sec"):
+        return True
+    if metric.endswith(("_ms", "_ns", "_bytes", "_kb")):
+        return False
+    return None
+
+
+def best(name: str, values: list):
+    """Best of repeated measurements (min time, max throughput); counts keep the last"""
+    direction = higher_is_better(name)
+    numbers = [value for value in values if isinstance(value, (int, float))]
+    if direction is None or not numbers:
+        return values[-1]
+    return max(numbers) if direction else min(numbers)
+
+
+def spread(name: str, values: list) -> float:
+    """Relative gap between the best and worst repeat; how far this metric jitters"""
+    numbers = [value for value in values if isinstance(value, (int, float))]
+    if higher_is_better(name) is None or not numbers or not min(numbers):
+        return 0.0
+    return (max(numbers) - min(numbers)) / min(numbers)
+
+
+def noise_floor(metric: str) -> float:
+    """Absolute change below which a timing metric is never flagged"""
+    for suffix, seconds in UNIT_SECONDS.items():
+        if metric.endswith(suffix):
+            return NOISE_FLOOR_SECONDS / seconds
+    return 0.0
+
+
+def machine_speed(metrics: dict, baseline: dict) -> float:
+    """How much slower this run's machine is than the baseline's (1.0 without a reference)"""
+    now, then = metrics.get(REFERENCE), baseline.get(REFERENCE)
+    return now / then if now and then else 1.0
+
+
+def compare(metrics: dict, baseline: dict, threshold: float, spreads: dict = None) -> list:
+    """Return (metric, baseline, current, change) for metrics worse than threshold.
+
+    When the reference workload ran slower than in the baseline, timings are
+    scaled by that slowdown first, so a machine that is slower across the board
+    does not flag everything. A faster reference never tightens the check. A metric's threshold is
+    widened by its repeat-to-repeat spread (the larger of the two runs').
+    """
+    spreads = spreads or {}
+    slowdown = max(1.0, machine_speed(metrics, baseline))
+    regressions = []
+    for name, value in metrics.items():
+        direction = higher_is_better(name)
+        old = baseline.get(name)
+        if direction is None or not old or value is None or name == REFERENCE:
+            continue
+        if name.endswith(tuple(UNIT_SECONDS)):
+            old *= slowdown
+        elif direction:
+            old /= slowdown
+        change = (value - old) / old
+        worse = -change if direction else change
+        if worse > threshold + spreads.get(name, 0.0) and abs(value - old) > noise_floor(name):
+            regressions.append((name, old, value, change))
+    return regressions
+
+
+def bench_reference():
+    """Fixed CPU work, timed alongside the suites to measure how fast the machine is right now"""
+    data = list(range(20000))
+
+    def work():
+        sorted(data, key=lambda x: -x)
+        return sum(x * x for x in data)
+
+    return {'work_ms': per_call_ns(work, number=20) / 1e6}
+
+
+def run(only=None, repeat=3) -> dict:
+    suites = {'reference': bench_reference}
+    suites.update((suite, func) for suite, func in SUITES.items() if not only or suite in only)
+    samples = {}
+    # Rounds go through every suite in turn, so a slow spell hits one run of each, not all of one
+    for i in range(repeat):
+        for suite, func in suites.items():
+            print(f"[BENCH] {suite} ({i + 1}/{repeat})...", file=sys.stderr)
+            # Keep model status messages out of the results table
+            with contextlib.redirect_stdout(sys.stderr):
+                suite_metrics = func()
+            for name, value in suite_metrics.items():
+                samples.setdefault(f"{suite}.{name}", []).append(value)
+    metrics = {name: best(name, values) for name, values in samples.items()}
+    return {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'metrics': metrics,
+        'spread': {name: spread(name, values) for name, values in samples.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITES))
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.30,
+                        help="Allowed relative slowdown before flagging (default 0.30)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per suite; each metric keeps its best run (default 3)")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.only, max(1, args.repeat))
+    for name, value in results['metrics'].items():
+        print(f"{name:>40}: {value:,.3f}" if isinstance(value, float) else f"{name:>40}: {value}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"[BENCH] Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("[BENCH] No baseline to compare against")
+        return 0
+    with open(args.baseline) as f:
+        stored = json.load(f)
+    baseline = stored['metrics']
+    spreads = {name: max(value, stored.get('spread', {}).get(name, 0.0))
+               for name, value in results['spread'].items()}
+    print(f"[BENCH] Reference workload: {machine_speed(results['metrics'], baseline):.2f}x "
+          f"the baseline's time; slower runs scale baseline timings by it")
+    regressions = compare(results['metrics'], baseline, args.threshold, spreads)
+    for name, old, new, change in regressions:
+        print(f"[REGRESSION] {name}: {old:,.3f} -> {new:,.3f} ({change:+.0%})")
+    if not regressions:
+        print("[BENCH] No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# ============================================================================
+# benchmarks/startup_profile.py
+# ============================================================================
+
+"""
+Startup Profile - Import-time breakdown of the GUI entry point plus startup phases
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter, ranks the
+slowest imports, flags heavy modules that should not load at startup, and adds
+the phase timings from bench_startup (imports, rates ready, first render).
+
+Usage:
+    python benchmarks/startup_profile.py             # text report
+    python benchmarks/startup_profile.py --top 25
+    python benchmarks/startup_profile.py --json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks import bench_startup  # noqa: E402
+
+# Modules that are only needed once a download starts
+DEFERRED_MODULES = ("requests", "urllib3", "charset_normalizer", "idna", "certifi")
+
+
+def import_times(module="main") -> list:
+    """[(name, self_us, cumulative_us, depth)] for `module` and everything it imports.
+
+    Interpreter startup (site, .pth files) is excluded: importtime lists each
+    top-level import after its children, so the subtree is the run of rows
+    since the previous top-level entry.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": str(ROOT)})
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+
+    end = max(i for i, row in enumerate(rows) if row[0] == module and row[3] == 0)
+    start = max((i + 1 for i, row in enumerate(rows[:end]) if row[3] == 0), default=0)
+    return rows[start:end + 1]
+
+
+def profile(top=15) -> dict:
+    rows = import_times()
+    loaded = {name for name, *_ in rows}
+    first_party = [row for row in rows if row[0].split(".")[0] in
+                   ("main", "model", "view", "controller")]
+    return {
+        'total_import_ms': sum(self_us for _, self_us, _, _ in rows) / 1000,
+        'modules': len(rows),
+        'slowest_cumulative': [(name, cum / 1000) for name, _, cum, _ in
+                               sorted(rows, key=lambda r: -r[2])[:top]],
+        'slowest_self': [(name, s / 1000) for name, s, _, _ in
+                         sorted(rows, key=lambda r: -r[1])[:top]],
+        'first_party': [(name, cum / 1000) for name, _, cum, _ in first_party],
+        'deferred_but_loaded': [name for name in DEFERRED_MODULES if name in loaded],
+        'phases': bench_startup.run(repeat=3),
+    }
+
+
+def print_report(report: dict):
+    print(f"Importing main: {report['total_import_ms']:.1f} ms across {report['modules']} modules\n")
+    for title, key in (("Slowest imports (cumulative)", 'slowest_cumulative'),
+                       ("Slowest imports (self)", 'slowest_self'),
+                       ("Application modules (cumulative)", 'first_party')):
+        print(title)
+        for name, ms in report[key]:
+            print(f"  {ms:8.1f} ms  {name}")
+        print()
+
+    loaded = report['deferred_but_loaded']
+    print("Deferred modules loaded at startup: " + (", ".join(loaded) if loaded else "none"))
+    print("\nStartup phases (best of 3)")
+    for name, value in report['phases'].items():
+        print(f"  {name:>20}: {value:,.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile application startup")
+    parser.add_argument("--top", type=int, default=15, help="Modules listed per table")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = profile(args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    # A deferred module at startup is a regression worth failing CI over
+    return 1 if report['deferred_but_loaded'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
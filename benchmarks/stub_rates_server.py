@@ -0,0 +1,95 @@
+# ============================================================================
+# benchmarks/stub_rates_server.py
+# ============================================================================
+
+"""
+Stub Rates Server - Local stand-in for api.exchangerate-api.com
+Usage: python benchmarks/stub_rates_server.py [port]
+"""
+
+import json
+import sys
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_data import load_fixture_rates  # noqa: E402
+
+
+class StubRatesServer(ThreadingHTTPServer):
+    """Serves /v4/latest/<BASE> from a fixture, with optional latency and failures"""
+
+    daemon_threads = True
+
+    def __init__(self, port=0, rates=None, latency=0.0, fail_first=0):
+        super().__init__(("127.0.0.1", port), StubRatesHandler)
+        self.rates = rates or load_fixture_rates()
+        self.latency = latency
+        self.fail_first = fail_first
+        self.requests_served = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def api_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v4/latest/"
+
+    def payload(self, base):
+        if base not in self.rates:
+            return None
+        pivot = self.rates[base]
+        rates = {code: value / pivot for code, value in self.rates.items()}
+        return {"base": base, "date": date.today().isoformat(), "rates": rates}
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class StubRatesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server._lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        server = self.server
+        with server._lock:
+            server.requests_served += 1
+            failing = server.requests_served <= server.fail_first
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        base = self.path.rstrip('/').rsplit('/', 1)[-1].upper()
+        payload = None if failing else server.payload(base)
+        status = 503 if failing else (200 if payload else 404)
+        body = json.dumps(payload or {"result": "error"}).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    server = StubRatesServer(port)
+    print(f"[STUB] Serving rates at {server.api_url}")
+    server.serve_forever()
@@ -7,37 +7,201 @@
 Currency Controller - Connects Model ↔ View and handles application logic
 """
 
-import threading
+import logging
+import os
 import time
+from collections import deque
+from datetime import datetime
+
+from controller.task_executor import TaskExecutor
+from model import metrics, snapshot_delta
+from model.fixed_point import minor_units
+from model.transfer_quotes import load_recipients, parse_recipients, quote_transfers
+
+FRAME_BUDGET = 1 / 60  # seconds
+# A live result left unchanged this long is logged as a conversion
+LIVE_RECORD_DELAY = 1.5  # seconds
+
+log = logging.getLogger(__name__)
+
+UI_CALLBACKS = metrics.histogram("fx_ui_callback_seconds", "Tk callback run time", ("callback",))
+INPUT_LATENCY = metrics.histogram("fx_ui_input_latency_seconds", "Keystroke to rendered result")
+SLOW_UPDATES = metrics.counter("fx_ui_slow_updates_total", "Live updates slower than one frame")
+STARTUP = metrics.gauge("fx_startup_seconds", "Time from launch to a startup milestone", ("event",))
 
 
 class CurrencyController:
-    """Controller: Manages interactions between Model and View"""
+    """Controller: Manages interactions between Model and View
+
+    `view` is anything implementing view_protocol.CurrencyViewProtocol:
+    CurrencyView in the app, HeadlessView in benchmarks and scripted runs.
+    """
 
-    def __init__(self, model, view):
+    def __init__(self, model, view, refresher=None, started_at=None, alerts=None):
         self.model = model
         self.view = view
+        self.refresher = refresher
+        self.alerts = alerts
+
+        # Startup timing (perf_counter based), reported once each
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.startup_metrics = {}
+        self._populated_snapshot = None
+        self._populated_index = None
 
-        self.view.convert_btn.config(command=self.handle_convert)
-        self.view.swap_btn.config(command=self.handle_swap)
+        # Live conversion state
+        self._live_pending = None
+        self._input_at = None
+        self.live_latency = deque(maxlen=1000)
+        # Latest live result as (amount, from, to, result, rate), logged once it settles
+        self.live_record_delay = LIVE_RECORD_DELAY
+        self._live_result = None
+        self._user_input = False
+        self._live_changed_at = 0.0
+        self._live_record_pending = False
+        self._last_recorded = None
+
+        # Pair currently plotted in the Charts tab, as (from, to)
+        self._chart_pair = None
+        # Latest batch of Send tab quotes (TransferQuotes)
+        self._send_quotes = None
+        # Alerts fired before the Alerts tab was first opened, as (time, messages)
+        self._fired_backlog = deque(maxlen=200)
+
+        # Bounded worker pool; its results are applied on the UI thread
+        self.tasks = TaskExecutor(self.view.after).start()
+
+        self.view.bind_convert(self.handle_convert)
+        self.view.bind_swap(self.handle_swap)
+        self.view.bind_input_changed(self.on_user_input)
+        self.view.bind_refresh(self.handle_refresh)
+        self.view.bind_page_built("Send", self.setup_send_panel)
+        self.view.bind_page_built("Charts", self.setup_charts_panel)
+        if self.alerts is not None:
+            self.bind_alerts()
         self.initialize_app()
 
     def initialize_app(self):
-        """Fetch rates and populate currencies"""
-        if self.model.fetch_rates():
-            currency_list = self.model.get_currency_list()
-            self.view.populate_currencies(currency_list)
-            
-            if self.model.is_offline:
-                self.view.update_status("⚠️ OFFLINE MODE - Using cached rates from " + self.model.last_updated)
-            else:
-                self.view.update_status("✅ ONLINE - Rates loaded successfully")
+        """Populate currencies from loaded rates, fetching synchronously only without a refresher"""
+        if self.refresher is None:
+            if not self.model.fetch_rates():
+                self.show_connection_error()
+                return
+            self.apply_rates()
+            return
+
+        self.refresher.add_listener(
+            lambda ok: self.tasks.post(lambda: self.on_rates_refreshed(ok))
+        )
+        if self.model.snapshot is not None:
+            self.apply_rates()
+        elif self.refresher.ready.is_set():
+            self.show_connection_error()
+        else:
+            # Nothing to convert with until the network answers
+            self.view.show_spinner()
+            self.view.update_status("Loading exchange rates...")
+
+    def on_rates_refreshed(self, ok):
+        """Called on the Tk thread after each background refresh"""
+        if self.model.snapshot is not None:
+            self.apply_rates()
+        elif not ok:
+            self.show_connection_error()
+
+    def handle_refresh(self):
+        """Manual refresh (F5); repeated presses supersede each other"""
+        if not self.view.spinner_active:
+            self.view.show_spinner()
+        self.view.update_status("Refreshing exchange rates...")
+        if not self.tasks.submit("refresh", self.model.refresh_rates, self.finish_refresh,
+                                 self.on_refresh_failed):
+            self.finish_refresh(False)
+
+    def on_refresh_failed(self, error):
+        log.error("Manual refresh failed: %s", error)
+        self.finish_refresh(False)
+
+    def finish_refresh(self, ok):
+        if self.view.spinner_active:
+            self.view.hide_spinner()
+        if ok:
+            self.apply_rates()
+        elif self.model.snapshot is not None:
+            self.view.update_status(f"⚠️ Refresh failed - using rates from {self.model.last_updated}")
+        else:
+            self.show_connection_error()
+
+    @metrics.timed(UI_CALLBACKS.labels("apply_rates"))
+    def apply_rates(self):
+        """Show the active snapshot, redrawing only what its rates changed.
+
+        Pickers are rebuilt when the currency list changes; the live result and
+        the chart only when their pair moved since the snapshot last shown.
+        """
+        snapshot = self.model.snapshot
+        shown = self._populated_snapshot
+        if snapshot is not shown:
+            if self.view.spinner_active:
+                self.view.hide_spinner()
+            self._populated_snapshot = snapshot
+            # Diffed against what is on screen, so refreshes coalesced on the way count too
+            delta = snapshot_delta.diff(shown, snapshot)
+            # The model keeps one index per currency list
+            index = self.model.currency_index
+            repopulate = index is not self._populated_index
+            charts_panel = self.view.page_panel("Charts")
+            if repopulate:
+                self._populated_index = index
+                self.view.populate_currencies(list(index.display), index,
+                                              self.favorite_pairs(index))
+                # Tabs that were never opened are filled in when they are built
+                alerts_panel = self.view.page_panel("Alerts")
+                if alerts_panel is not None:
+                    alerts_panel.set_currencies(list(index.display))
+                if charts_panel is not None:
+                    charts_panel.set_currencies(list(index.display))
+                self.record_startup("rates_ready")
+            if repopulate or delta.affects(self.view.get_from_currency(),
+                                           self.view.get_to_currency()):
+                self.on_input_changed()
+            if charts_panel is not None:
+                if self._chart_pair is None:
+                    self.load_chart()
+                elif delta.affects(*self._chart_pair):
+                    self.extend_chart()
+
+        if self.model.is_offline:
+            self.view.update_status("⚠️ OFFLINE MODE - Using cached rates from " + self.model.last_updated)
         else:
-            self.view.show_error("Connection Error", 
-                               "Failed to fetch currency rates and no cached data available.")
+            self.view.update_status("✅ ONLINE - Rates loaded successfully")
 
+    def favorite_pairs(self, index, limit=5):
+        """The most converted pairs as (from, to) display strings, offered first in the pickers"""
+        pairs = []
+        for from_curr, to_curr, _ in self.model.top_pairs(limit):
+            from_text, to_text = index.display_for(from_curr), index.display_for(to_curr)
+            if from_text and to_text:
+                pairs.append((from_text, to_text))
+        return pairs
+
+    def show_connection_error(self):
+        if self.view.spinner_active:
+            self.view.hide_spinner()
+        self.view.show_error("Connection Error",
+                             "Failed to fetch currency rates and no cached data available.")
+
+    def record_startup(self, event, at=None):
+        """Record the first occurrence of a startup milestone (perf_counter `at`, default now)"""
+        if event not in self.startup_metrics:
+            elapsed = ((at if at is not None else time.perf_counter()) - self.started_at) * 1000
+            self.startup_metrics[event] = elapsed
+            STARTUP.labels(event).set(elapsed / 1000)
+            log.info("Startup %s: %.0f ms", event, elapsed)
+
+    @metrics.timed(UI_CALLBACKS.labels("handle_convert"))
     def handle_convert(self):
-        """Handles conversion logic with spinner animation"""
+        """Convert on button press; rates are in memory, so this is synchronous"""
         amount = self.view.get_amount()
         from_curr = self.view.get_from_currency()
         to_curr = self.view.get_to_currency()
@@ -51,40 +215,309 @@ class CurrencyController:
             self.view.show_error("Missing Selection", "Please select both currencies.")
             return
 
-        # Show spinner
-        self.view.show_spinner()
-        self.view.update_status("Converting...")
-        
-        # Simulate processing delay (remove in production or keep for UX)
-        def perform_conversion():
-            time.sleep(0.5)  # Simulated delay
-            
-            rate = self.model.get_rate(from_curr, to_curr)
-            
-            # Update UI in main thread
-            self.view.root.after(0, lambda: self.finish_conversion(amount, from_curr, to_curr, rate))
-        
-        # Run conversion in background thread
-        threading.Thread(target=perform_conversion, daemon=True).start()
+        result, rate = self.model.quote(amount, from_curr, to_curr)
+        self.finish_conversion(amount, from_curr, to_curr, result, rate)
 
-    def finish_conversion(self, amount, from_curr, to_curr, rate):
+    def finish_conversion(self, amount, from_curr, to_curr, result, rate):
         """Complete the conversion and update UI"""
-        self.view.hide_spinner()
-        
-        if rate is None:
+        if result is None:
             self.view.show_error("Error", 
                                f"Could not retrieve rate for {from_curr} → {to_curr}.")
             self.view.update_status("Conversion failed")
             return
 
-        result = amount * rate
-        self.view.display_result(amount, from_curr, to_curr, result, rate)
+        self.view.display_result(amount, from_curr, to_curr, result, rate,
+                                 minor_units(to_curr))
+        self.model.record_conversion(amount, from_curr, to_curr, result, rate)
+        # The same live result must not be logged a second time when it settles
+        self._live_result, self._last_recorded = None, (amount, from_curr, to_curr)
+        self.record_startup("first_conversion")
         
         if self.model.is_offline:
             self.view.update_status(f"⚠️ OFFLINE MODE - Using cached rates from {self.model.last_updated}")
         else:
             self.view.update_status(f"✅ Last updated: {self.model.last_updated}")
 
+    def on_user_input(self):
+        """Input from the user; only these live results are logged as conversions"""
+        self._user_input = True
+        self.on_input_changed()
+
+    def on_input_changed(self):
+        """Keystroke / combobox change: coalesce bursts into one update per Tk idle cycle"""
+        if self._input_at is None:
+            self._input_at = time.perf_counter()
+        if self._live_pending is None:
+            self._live_pending = self.view.after_idle(self.update_live_result)
+
+    @metrics.timed(UI_CALLBACKS.labels("update_live_result"))
+    def update_live_result(self):
+        """Recompute the result from the in-memory snapshot without dialogs"""
+        self._live_pending = None
+        input_at, self._input_at = self._input_at, None
+        user_input, self._user_input = self._user_input, False
+        if user_input:
+            # Whatever the user changed replaces the result waiting to be logged
+            self._live_result = None
+
+        amount = self.view.get_amount()
+        from_curr = self.view.get_from_currency()
+        to_curr = self.view.get_to_currency()
+        if self.model.snapshot is None:
+            return
+        if not from_curr or not to_curr:
+            self.view.display_hint("Select both currencies")
+            return
+        if amount is None or amount <= 0:
+            self.view.display_hint("Enter an amount to convert")
+            return
+
+        result, rate = self.model.quote(amount, from_curr, to_curr)
+        if result is None:
+            self.view.display_hint(f"No rate for {from_curr} → {to_curr}")
+            return
+        self.view.display_result(amount, from_curr, to_curr, result, rate, minor_units(to_curr))
+        self.record_startup("first_conversion")
+        if user_input:
+            self.settle_live_result(amount, from_curr, to_curr, result, rate)
+
+        if input_at is not None:
+            self.record_live_latency(time.perf_counter() - input_at)
+
+    def settle_live_result(self, amount, from_curr, to_curr, result, rate):
+        """Log a live result once the user stops typing, not every keystroke's"""
+        self._live_result = (amount, from_curr, to_curr, result, rate)
+        self._live_changed_at = time.monotonic()
+        if not self._live_record_pending:
+            self._live_record_pending = True
+            self.view.after(int(self.live_record_delay * 1000), self.record_live_result)
+
+    def record_live_result(self):
+        remaining = self.live_record_delay - (time.monotonic() - self._live_changed_at)
+        if remaining > 0:
+            self.view.after(int(remaining * 1000) + 1, self.record_live_result)
+            return
+        self._live_record_pending = False
+        live, self._live_result = self._live_result, None
+        # A rate refresh recomputes the same conversion; that is not a new one
+        if live is None or live[:3] == self._last_recorded:
+            return
+        self._last_recorded = live[:3]
+        self.model.record_conversion(*live, source="live")
+
+    def record_live_latency(self, seconds):
+        """Track input-to-render latency; anything over one 60 Hz frame is reported"""
+        self.live_latency.append(seconds)
+        INPUT_LATENCY.observe(seconds)
+        if seconds > FRAME_BUDGET:
+            SLOW_UPDATES.inc()
+            log.debug("Slow live update: %.1f ms", seconds * 1000)
+
+    def live_latency_stats(self) -> dict:
+        samples = sorted(self.live_latency)
+        if not samples:
+            return {}
+        return {
+            'samples': len(samples),
+            'p50_ms': samples[len(samples) // 2] * 1000,
+            'p99_ms': samples[max(0, int(len(samples) * 0.99) - 1)] * 1000,
+            'max_ms': samples[-1] * 1000,
+        }
+
+    def bind_alerts(self):
+        self.view.bind_page_built("Alerts", self.setup_alerts_panel)
+        # Rules are evaluated on the refresh thread; only the results reach the UI
+        self.alerts.add_listener(
+            lambda events: self.tasks.post(lambda: self.on_alerts_fired(events))
+        )
+
+    def setup_alerts_panel(self, panel):
+        """Wire up the Alerts tab when it is first built"""
+        panel.bind_add(self.handle_add_alert)
+        panel.bind_remove(self.handle_remove_alerts)
+        if self.model.snapshot is not None:
+            panel.set_currencies(list(self.model.currency_index.display))
+        panel.show_rules(self.alerts.rules.values())
+        while self._fired_backlog:
+            when, messages = self._fired_backlog.popleft()
+            panel.add_fired(messages, when)
+
+    def setup_charts_panel(self, panel):
+        """Wire up the Charts tab when it is first built"""
+        panel.bind_selection_changed(self.load_chart)
+        if self.model.snapshot is not None:
+            panel.set_currencies(list(self.model.currency_index.display))
+            self.load_chart()
+
+    def handle_add_alert(self):
+        panel = self.view.alerts_panel
+        from_text, to_text, kind, value_text = panel.get_rule_input()
+        index = self.model.currency_index
+        from_curr, to_curr = index.code_for(from_text), index.code_for(to_text)
+        try:
+            value = float(value_text.replace(',', ''))
+        except ValueError:
+            value = None
+
+        if not from_curr or not to_curr or from_curr == to_curr:
+            self.view.show_error("Invalid Alert", "Please select two different currencies.")
+            return
+        if kind is None or value is None or value <= 0:
+            self.view.show_error("Invalid Alert", "Please enter a value greater than zero.")
+            return
+
+        rule = self.alerts.add_rule(from_curr, to_curr, kind, value, save=False)
+        panel.insert_rules([rule])
+        self.save_alerts()
+        self.view.update_status(f"Alert added: {rule.describe()}")
+
+    def handle_remove_alerts(self):
+        panel = self.view.alerts_panel
+        removed = self.alerts.remove_rules(panel.selected_rule_ids(), save=False)
+        if removed:
+            panel.delete_rules(removed)
+            self.save_alerts()
+            self.view.update_status(f"Removed {len(removed):,} alert(s)")
+
+    def save_alerts(self):
+        """Write the rule file on a worker; a newer save supersedes a queued one"""
+        if not self.tasks.submit("alerts_save", self.alerts.save, lambda _: None):
+            # Never lose a rule change: a saturated pool writes it here instead
+            self.alerts.save()
+
+    @metrics.timed(UI_CALLBACKS.labels("on_alerts_fired"))
+    def on_alerts_fired(self, events):
+        messages = [event.message() for event in events]
+        panel = self.view.page_panel("Alerts")
+        if panel is None:
+            self._fired_backlog.append((datetime.now(), messages))
+        else:
+            panel.add_fired(messages)
+            panel.update_rules(event.rule for event in events)
+        extra = f" (+{len(messages) - 1} more)" if len(messages) > 1 else ""
+        self.view.notify(messages[0] + extra)
+
+    def setup_send_panel(self, panel):
+        """Wire up the Send tab when it is first built"""
+        panel.bind_quote(self.handle_send_quote)
+        panel.bind_load(self.handle_send_load)
+        panel.bind_export(self.handle_send_export)
+
+    def handle_send_quote(self):
+        text = self.view.send_panel.get_text()
+        self.quote_recipients(lambda: parse_recipients(text.splitlines()), "pasted list")
+
+    def handle_send_load(self):
+        path = self.view.send_panel.ask_open_path()
+        if path:
+            self.quote_recipients(lambda: load_recipients(path), os.path.basename(path))
+
+    def quote_recipients(self, load, source):
+        """Parse and quote a recipient list on a worker against the active snapshot"""
+        snapshot = self.model.snapshot
+        if snapshot is None:
+            self.view.show_error("No Rates", "Exchange rates are not loaded yet.")
+            return
+        exact, rounding = self.model.exact, self.model.rounding
+        self.view.send_panel.show_status(f"Quoting {source}...")
+        if not self.tasks.submit(
+            "send_quote",
+            lambda: quote_transfers(snapshot.matrix, load(), exact, rounding,
+                                    snapshot.last_updated),
+            lambda quotes: self.finish_send_quote(quotes, source),
+            lambda error: self.on_send_failed("Could not quote recipients", error),
+        ):
+            self.on_send_busy(f"quote {source}")
+
+    @metrics.timed(UI_CALLBACKS.labels("finish_send_quote"))
+    def finish_send_quote(self, quotes, source):
+        self._send_quotes = quotes
+        self.view.send_panel.show_quotes(quotes, source)
+
+    def handle_send_export(self):
+        quotes = self._send_quotes
+        if quotes is None:
+            return
+        path = self.view.send_panel.ask_save_path()
+        if not path:
+            return
+
+        def export():
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                quotes.write_csv(f)
+
+        self.view.send_panel.show_status(f"Exporting {len(quotes):,} quotes...")
+        if not self.tasks.submit(
+            "send_export", export,
+            lambda _: self.view.send_panel.show_status(
+                f"Exported {len(quotes):,} quotes to {os.path.basename(path)}"),
+            lambda error: self.on_send_failed("Could not export quotes", error),
+        ):
+            self.on_send_busy("export quotes")
+
+    def on_send_failed(self, title, error):
+        self.view.send_panel.show_status(f"{title}: {error}")
+        self.view.show_error("Send", f"{title}:\n{error}")
+
+    def on_send_busy(self, action):
+        """The executor is saturated; nothing was queued"""
+        self.view.send_panel.show_status(f"Too busy to {action} right now; try again")
+
+    def load_chart(self):
+        """Replot the selected pair from recorded history"""
+        from_text, to_text, seconds = self.view.charts_panel.get_selection()
+        index = self.model.currency_index
+        if index is None:
+            return
+        pair = (index.code_for(from_text), index.code_for(to_text))
+        if None in pair:
+            return
+        self._chart_pair = pair
+        start = time.time() - seconds if seconds else None
+        if not self.tasks.submit(
+            "chart",
+            lambda: self.model.get_rate_range(*pair, start=start),
+            lambda series: self.finish_chart(pair, series),
+        ):
+            self.view.charts_panel.show_status("Too busy to load the chart right now; try again")
+
+    @metrics.timed(UI_CALLBACKS.labels("finish_chart"))
+    def finish_chart(self, pair, series):
+        if pair == self._chart_pair:
+            self.view.charts_panel.show_series(*series)
+
+    def extend_chart(self):
+        """Append snapshots recorded since the last plotted point (no full redraw)"""
+        panel = self.view.charts_panel
+        last = panel.last_timestamp()
+        if last is None:
+            self.load_chart()
+            return
+        pair = self._chart_pair
+        # Its own key, so a pending full reload is not superseded by it
+        if not self.tasks.submit(
+            "chart_extend",
+            lambda: self.model.get_rate_range(*pair, start=last),
+            lambda series: self.finish_extend_chart(pair, series),
+        ):
+            # The next extension starts from the same last point, so nothing is lost
+            panel.show_status("Too busy to add new rates now; they will appear on the next update")
+
+    @metrics.timed(UI_CALLBACKS.labels("finish_extend_chart"))
+    def finish_extend_chart(self, pair, series):
+        if pair != self._chart_pair:
+            return
+        panel = self.view.charts_panel
+        # A reload may have landed since the query; only add what is still new
+        last = panel.last_timestamp()
+        if last is None:
+            return
+        timestamps, rates = series
+        keep = timestamps > last
+        if keep.any():
+            panel.append_points(timestamps[keep], rates[keep])
+
     def handle_swap(self):
         """Swap selected currencies."""
-        self.view.swap_currencies()
\ No newline at end of file
+        self.view.swap_currencies()
+        self.on_user_input()
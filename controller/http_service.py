@@ -0,0 +1,275 @@
+# ============================================================================
+# controller/http_service.py
+# ============================================================================
+
+"""
+HTTP Service - Asyncio JSON API over one shared, background-refreshed CurrencyModel
+
+Endpoints:
+    GET  /rate?from=USD&to=EUR
+    GET  /convert?from=USD&to=EUR&amount=100[&exact=1&rounding=half_up]
+    POST /convert   body: [{"amount": 100, "from": "USD", "to": "EUR"}, ...]
+    GET  /history?days=7&limit=10[&from=USD&to=EUR]   conversion log aggregates
+    GET  /health
+    GET  /metrics   Prometheus text format
+"""
+
+import asyncio
+import json
+import logging
+import math
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from model import metrics
+from model.fixed_point import ROUNDING_MODES, minor_units
+
+log = logging.getLogger(__name__)
+
+REQUESTS = metrics.counter("fx_http_requests_total", "HTTP requests by status", ("status",))
+REQUEST_SECONDS = metrics.histogram("fx_http_request_seconds", "Time to dispatch one HTTP request")
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class RateService:
+    """Serves conversions from the model's in-memory snapshot; never fetches per request"""
+
+    def __init__(self, model, host="127.0.0.1", port=8080, max_body=8 * 1024 * 1024):
+        self.model = model
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self.server = None
+        self.requests_served = 0
+        self.connections = 0
+
+    # -- request handlers --------------------------------------------------
+
+    def snapshot(self):
+        snapshot = self.model.snapshot
+        if snapshot is None or snapshot.matrix is None:
+            raise HttpError(503, "No rates loaded yet")
+        return snapshot
+
+    @staticmethod
+    def lookup(snapshot, from_curr, to_curr):
+        """Rate from one snapshot, so a concurrent refresh cannot mix two snapshots"""
+        matrix = snapshot.matrix
+        i, j = matrix.index.get(from_curr), matrix.index.get(to_curr)
+        if i is None or j is None:
+            raise HttpError(404, f"Unknown currency pair {from_curr}/{to_curr}")
+        return matrix.rate(i, j)
+
+    def handle_rate(self, query):
+        snapshot = self.snapshot()
+        from_curr, to_curr = self.pair(query)
+        rate = self.lookup(snapshot, from_curr, to_curr)
+        return {"from": from_curr, "to": to_curr, "rate": rate,
+                "last_updated": snapshot.last_updated}
+
+    def handle_convert(self, query):
+        snapshot = self.snapshot()
+        from_curr, to_curr = self.pair(query)
+        try:
+            amount = float(query["amount"][0])
+        except (KeyError, ValueError):
+            raise HttpError(400, "Query parameter 'amount' must be a number")
+        if not math.isfinite(amount):
+            raise HttpError(400, "Query parameter 'amount' must be finite")
+        rate = self.lookup(snapshot, from_curr, to_curr)
+        if query.get("exact", ["0"])[0] in ("1", "true"):
+            rounding = query.get("rounding", ["half_even"])[0]
+            if rounding not in ROUNDING_MODES:
+                raise HttpError(400, f"Unknown rounding mode: {rounding}")
+            exact = snapshot.matrix.fixed.convert_exact(query["amount"][0], from_curr, to_curr,
+                                                        rounding)
+            # A string keeps every digit; JSON numbers would go through binary floats
+            result = None if exact is None else str(exact)
+        else:
+            result = round(amount * rate, minor_units(to_curr))
+            # Amounts near the float limit overflow; JSON has no infinity
+            result = result if math.isfinite(result) else None
+        self.model.record_conversion(amount, from_curr, to_curr, result, rate, source="api")
+        return {"amount": amount, "from": from_curr, "to": to_curr,
+                "result": result, "rate": rate,
+                "last_updated": snapshot.last_updated}
+
+    def handle_convert_batch(self, body):
+        snapshot = self.snapshot()
+        try:
+            items = json.loads(body)
+            if not isinstance(items, list):
+                raise ValueError
+            amounts = [float(item["amount"]) for item in items]
+            from_codes = [str(item["from"]).upper() for item in items]
+            to_codes = [str(item["to"]).upper() for item in items]
+        except (ValueError, KeyError, TypeError):
+            raise HttpError(400, "Body must be a JSON array of {amount, from, to} objects")
+        if not all(map(math.isfinite, amounts)):
+            raise HttpError(400, "Every 'amount' must be a finite number")
+
+        if not items:
+            return {"results": [], "last_updated": snapshot.last_updated}
+        # One vectorized pass over the same snapshot for the whole batch
+        results = snapshot.matrix.convert_many(amounts, from_codes, to_codes).tolist()
+        self.model.record_conversions(amounts, from_codes, to_codes, results, source="api")
+        return {"results": [r if math.isfinite(r) else None for r in results],
+                "last_updated": snapshot.last_updated}
+
+    def handle_history(self, query):
+        conversion_log = self.model.conversion_log
+        if conversion_log is None:
+            raise HttpError(404, "Conversion history is disabled")
+        try:
+            days = int(query["days"][0]) if "days" in query else None
+            limit = int(query.get("limit", ["10"])[0])
+        except ValueError:
+            raise HttpError(400, "Query parameters 'days' and 'limit' must be integers")
+        from_curr = query.get("from", [""])[0].upper() or None
+        to_curr = query.get("to", [""])[0].upper() or None
+        return {
+            "top_pairs": [{"from": f, "to": t, "conversions": n}
+                          for f, t, n in conversion_log.top_pairs(limit, days)],
+            "daily": [{"day": day, "from": f, "to": t, "conversions": n,
+                       "amount": amount, "result": result}
+                      for day, f, t, n, amount, result in
+                      conversion_log.daily_totals(days, from_curr, to_curr)],
+        }
+
+    def handle_health(self):
+        snapshot = self.model.snapshot
+        reconciliation = self.model.last_reconciliation
+        return {"ready": snapshot is not None,
+                "base": snapshot.base if snapshot else None,
+                "last_updated": snapshot.last_updated if snapshot else None,
+                "offline": snapshot.is_offline if snapshot else None,
+                "requests_served": self.requests_served,
+                "connections": self.connections,
+                "outliers": [{"provider": o.provider, "code": o.code, "bps": round(o.deviation_bps, 1)}
+                             for o in reconciliation.outliers] if reconciliation else []}
+
+    @staticmethod
+    def pair(query):
+        try:
+            return query["from"][0].upper(), query["to"][0].upper()
+        except KeyError:
+            raise HttpError(400, "Query parameters 'from' and 'to' are required")
+
+    def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        path = url.path.rstrip('/') or '/'
+
+        if path == "/rate" and method == "GET":
+            return self.handle_rate(query)
+        if path == "/convert" and method == "GET":
+            return self.handle_convert(query)
+        if path == "/convert" and method == "POST":
+            return self.handle_convert_batch(body)
+        if path == "/history" and method == "GET":
+            return self.handle_history(query)
+        if path == "/health" and method == "GET":
+            return self.handle_health()
+        if path == "/metrics" and method == "GET":
+            return metrics.render_prometheus()
+        if path in ("/rate", "/convert", "/history", "/health", "/metrics"):
+            raise HttpError(405, f"{method} not allowed on {path}")
+        raise HttpError(404, f"No route for {path}")
+
+    # -- HTTP/1.1 plumbing -------------------------------------------------
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one keep-alive connection, answering pipelined ones in order"""
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                lines = head.decode('latin-1').split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "Malformed request line"}, False)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "Invalid Content-Length"}, False)
+                    return
+                if length > self.max_body:
+                    await self.respond(writer, 413, {"error": "Body too large"}, False)
+                    return
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+
+                start = time.perf_counter()
+                try:
+                    status, payload = 200, self.dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception:
+                    log.exception("Unhandled error serving %s %s", method, target)
+                    status, payload = 500, {"error": "Internal server error"}
+                REQUEST_SECONDS.observe(time.perf_counter() - start)
+                REQUESTS.labels(status).inc()
+                self.requests_served += 1
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def respond(writer, status, payload, keep_alive):
+        """JSON for dicts and lists; strings (the metrics page) go out as plain text"""
+        if isinstance(payload, str):
+            body, content_type = payload.encode(), "text/plain; version=0.0.4"
+        else:
+            content_type = "application/json"
+            try:
+                # Strict JSON: NaN and Infinity are not valid JSON for clients
+                body = json.dumps(payload, allow_nan=False).encode()
+            except ValueError:
+                log.exception("Response is not valid JSON")
+                status, body = 500, b'{"error": "Internal server error"}'
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode()
+        writer.write(head + body)
+        await writer.drain()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        server = await self.start()
+        log.info("Listening on http://%s:%s", self.host, self.port)
+        async with server:
+            await server.serve_forever()
@@ -0,0 +1,163 @@
+# ============================================================================
+# controller/task_executor.py
+# ============================================================================
+
+"""
+Task Executor - Bounded worker pool whose results are applied on the Tk thread
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from model import metrics
+
+log = logging.getLogger(__name__)
+
+TASK_SECONDS = metrics.histogram("fx_task_seconds", "Controller task run time on a worker", ("task",))
+RESULT_WAIT = metrics.histogram("fx_task_result_wait_seconds",
+                                "Time a finished result waited for the Tk loop")
+
+
+class TaskExecutor:
+    """Runs controller tasks off the UI thread.
+
+    Workers never touch widgets: every result goes through one queue that the
+    Tk loop drains. Tasks share a key when only the newest one matters; an older
+    task with the same key is cancelled if still queued, and its result dropped
+    if it already ran (latest wins).
+    """
+
+    def __init__(self, schedule, max_workers: int = 2, max_pending: int = 32,
+                 poll_interval: int = 16):
+        self.schedule = schedule  # e.g. root.after(ms, callback)
+        self.max_pending = max_pending
+        self.poll_interval = poll_interval
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="controller")
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = {}
+        self._futures = {}
+        self._pending = 0
+        self._running = False
+
+        self.submitted = 0
+        self.completed = 0
+        self.superseded = 0
+        self.rejected = 0
+        self.max_pending_seen = 0
+        self.max_queue_wait = 0.0
+
+    def submit(self, key, fn, on_done, on_error=None) -> bool:
+        """Run fn() on a worker; on_done(result) later runs on the Tk thread.
+
+        Returns False (and counts a rejection) when too many tasks are pending.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                return False
+            generation = self._generation.get(key, 0) + 1
+            self._generation[key] = generation
+
+            previous = self._futures.get(key)
+            if previous is not None and previous.cancel():
+                self._pending -= 1
+                self.superseded += 1
+
+            self._pending += 1
+            self.submitted += 1
+            self.max_pending_seen = max(self.max_pending_seen, self._pending)
+            self._futures[key] = self._pool.submit(
+                self._run, key, generation, fn, on_done, on_error)
+        return True
+
+    def _run(self, key, generation, fn, on_done, on_error):
+        with TASK_SECONDS.labels(str(key)).time():
+            try:
+                result, error = fn(), None
+            except Exception as e:
+                result, error = None, e
+        # Queue the result before it stops counting as pending, so idle() never sees a gap
+        self._results.put((time.perf_counter(), key, generation, result, error, on_done, on_error))
+        with self._lock:
+            self._pending -= 1
+
+    def post(self, callback):
+        """Queue a plain callback for the Tk thread (safe from any thread)"""
+        self._results.put((time.perf_counter(), None, None, None, None, callback, None))
+
+    def drain(self):
+        """Apply finished results; call on the Tk thread"""
+        while True:
+            try:
+                queued_at, key, generation, result, error, on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                return
+            waited = time.perf_counter() - queued_at
+            self.max_queue_wait = max(self.max_queue_wait, waited)
+            RESULT_WAIT.observe(waited)
+
+            if key is None:
+                self._call(None, on_done)
+                continue
+            if self._generation.get(key) != generation:
+                self.superseded += 1
+                continue
+
+            self.completed += 1
+            if error is None:
+                self._call(key, on_done, result)
+            elif on_error is not None:
+                self._call(key, on_error, error)
+            else:
+                log.error("Task %s failed: %s", key, error)
+
+    @staticmethod
+    def _call(key, callback, *args):
+        """Run a result callback; one that raises must not stop the results behind it"""
+        try:
+            callback(*args)
+        except Exception:
+            log.exception("Callback for task %s failed", key or "post")
+
+    def idle(self) -> bool:
+        """True when no task is running or queued and every result has been applied"""
+        with self._lock:
+            return self._pending == 0 and self._results.empty()
+
+    def start(self):
+        """Begin draining results from the Tk loop"""
+        self._running = True
+        self._poll()
+        return self
+
+    def _poll(self):
+        if not self._running:
+            return
+        try:
+            self.drain()
+        finally:
+            try:
+                self.schedule(self.poll_interval, self._poll)
+            except Exception:  # the window has been destroyed
+                self._running = False
+
+    def shutdown(self):
+        self._running = False
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'superseded': self.superseded,
+            'rejected': self.rejected,
+            'pending': self._pending,
+            'max_pending': self.max_pending_seen,
+            'queued_results': self._results.qsize(),
+            'max_queue_wait_ms': self.max_queue_wait * 1000,
+        }
@@ -0,0 +1,113 @@
+"""
+Bulk Conversion CLI - Headless entry point for converting CSV/JSONL ledgers
+
+Examples:
+    python convert_cli.py ledger.csv -o converted.csv --to EUR
+    python convert_cli.py ledger.jsonl --amount-field value --offline
+    python convert_cli.py ledger.csv --to JPY --exact --rounding half_up
+"""
+import argparse
+import logging
+import sys
+
+from model import metrics
+from model.bulk_converter import ConversionSpec, convert_csv, convert_jsonl, detect_format
+from model.conversion_log import ConversionLog
+from model.currency_model import CurrencyModel
+from model.fixed_point import ROUNDING_MODES
+from model.parallel_converter import convert_file_parallel
+from model.rate_providers import load_provider_config
+from model.shared_cache import open_shared_cache
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Convert currency amounts in CSV or JSONL files")
+    parser.add_argument("input", help="Input file ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Input format (default: by extension)")
+    parser.add_argument("--amount-field", default="amount")
+    parser.add_argument("--from-field", default="from")
+    parser.add_argument("--to-field", default="to")
+    parser.add_argument("--output-field", default="converted")
+    parser.add_argument("--from", dest="from_code", help="Source currency for every row")
+    parser.add_argument("--to", dest="to_code", help="Target currency for every row")
+    parser.add_argument("--exact", action="store_true",
+                        help="Convert on integer minor units (no binary floating point)")
+    parser.add_argument("--rounding", choices=ROUNDING_MODES, default="half_even",
+                        help="Rounding mode for --exact (default: half_even)")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--offline", action="store_true", help="Use cached rates only")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (files only; one record per line)")
+    parser.add_argument("--providers", default="providers.json",
+                        help="Rate provider config (default: the public API)")
+    parser.add_argument("--cache-dir",
+                        help="Host-wide rate cache shared with other instances (default: $FX_CACHE_DIR)")
+    parser.add_argument("--history-db",
+                        help="Also record every converted row in this SQLite conversion log")
+    return parser
+
+
+def load_model(offline: bool, providers_path: str = None, cache_dir: str = None) -> CurrencyModel:
+    model = CurrencyModel(history_dir=None, providers=load_provider_config(providers_path),
+                          shared_cache=open_shared_cache(cache_dir))
+    loaded = model.load_rates_from_cache() if offline else model.fetch_rates()
+    if not loaded:
+        sys.exit("Could not load currency rates.")
+    return model
+
+
+def open_text(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Status messages go to stderr so they never mix with converted rows on stdout
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr,
+                        format="[%(levelname)s] %(name)s: %(message)s")
+    spec = ConversionSpec(args.amount_field, args.from_field, args.to_field, args.output_field,
+                          args.from_code and args.from_code.upper(),
+                          args.to_code and args.to_code.upper(),
+                          exact=args.exact, rounding=args.rounding)
+    fmt = args.format or detect_format(args.input)
+    model = load_model(args.offline, args.providers, args.cache_dir)
+
+    if args.history_db:
+        model.conversion_log = ConversionLog(args.history_db).start()
+
+    if args.workers > 1 and args.input != "-":
+        try:
+            stats = convert_file_parallel(model, args.input, args.output, fmt, spec,
+                                          args.workers, args.chunk_size)
+        finally:
+            if model.conversion_log is not None:
+                model.conversion_log.close()
+        print(f"[BULK] {stats.summary()} using {args.workers} workers", file=sys.stderr)
+        return 0
+
+    src = open_text(args.input, "r")
+    dst = open_text(args.output, "w")
+    try:
+        if fmt == "csv":
+            stats = convert_csv(model, src, dst, spec, args.chunk_size)
+        else:
+            stats = convert_jsonl(model, src, dst, spec, args.chunk_size)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+        if model.conversion_log is not None:
+            model.conversion_log.close()
+
+    print(f"[BULK] {stats.summary()}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    code = main()
+    metrics.export_from_env()
+    sys.exit(code)
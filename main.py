@@ -1,27 +1,69 @@
 """
 Main Entry Point - Currency Converter Application
 """
-import tkinter as tk
-from model.currency_model import CurrencyModel
-from view.currency_view import CurrencyView
-from view.splash_screen import SplashScreen  
-from controller.currency_controller import CurrencyController
+import time
+
+STARTED_AT = time.perf_counter()  # before the imports below, so startup timing covers them
+
+import logging  # noqa: E402
+import tkinter as tk  # noqa: E402
+from model import metrics  # noqa: E402
+from model.alert_engine import AlertEngine  # noqa: E402
+from model.conversion_log import ConversionLog  # noqa: E402
+from model.currency_model import CurrencyModel  # noqa: E402
+from model.rate_providers import load_provider_config  # noqa: E402
+from model.rate_refresher import RateRefresher  # noqa: E402
+from model.shared_cache import open_shared_cache  # noqa: E402
+from view.currency_view import CurrencyView  # noqa: E402
+from view.splash_screen import SplashScreen  # noqa: E402
+from controller.currency_controller import CurrencyController  # noqa: E402
 
 
 def main():
     """Main entry point with splash screen"""
-    # Show splash screen first (change duration here: 3 seconds default)
-    # For 1 minute, use: splash = SplashScreen(duration=60)
-    splash = SplashScreen(duration=6)  # 6 seconds for testing
-    splash.show()
-    
-    # After splash screen closes, show main application
+    imported_at = time.perf_counter()
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(name)s: %(message)s")
+
+    # Start loading rates (cache first, then network) while the splash is up
+    # $FX_CACHE_DIR shares downloaded rates with other instances on this host
+    conversion_log = ConversionLog("conversion_history.db").start()
+    model = CurrencyModel(providers=load_provider_config("providers.json"),
+                          shared_cache=open_shared_cache(max_age=300),
+                          conversion_log=conversion_log)
+    alerts = AlertEngine()
+    model.add_snapshot_listener(alerts.evaluate)
+    refresher = RateRefresher(model, interval=300).start()
+
+    # One Tk root for both windows; the main window stays hidden behind the splash
     root = tk.Tk()
-    model = CurrencyModel()
-    view = CurrencyView(root)
-    controller = CurrencyController(model, view)
+    root.withdraw()
+    splash = SplashScreen(duration=6, ready=refresher.ready.is_set, root=root)
+    app = {}
+
+    def build():
+        if "controller" not in app:
+            view = CurrencyView(root)
+            controller = CurrencyController(model, view, refresher=refresher,
+                                            started_at=STARTED_AT, alerts=alerts)
+            controller.record_startup("imports", imported_at)
+            controller.record_startup("view_built")
+            app["controller"] = controller
+
+    # The main window is built while the splash waits for rates
+    root.after_idle(build)
+    # The splash closes as soon as rates are ready; duration is only the upper bound
+    splash.show()
+
+    build()
+    root.deiconify()
+    controller = app["controller"]
+    root.after_idle(lambda: controller.record_startup("window_shown"))
     root.mainloop()
+    controller.tasks.shutdown()
+    refresher.stop()
+    conversion_log.close()
+    metrics.export_from_env()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
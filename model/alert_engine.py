@@ -0,0 +1,251 @@
+# ============================================================================
+# model/alert_engine.py
+# ============================================================================
+
+"""
+Alert Engine - Threshold and percent-change rate alerts with sorted per-pair indexes
+
+For each currency pair the engine keeps its rules sorted by threshold, so a new
+snapshot only costs a couple of binary searches per watched pair; rules whose
+thresholds were not crossed are never looked at. Given the snapshot's delta,
+pairs whose currencies did not move are skipped entirely.
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+
+from model import metrics
+from model.snapshot_store import atomic_write
+
+log = logging.getLogger(__name__)
+
+EVALUATE_SECONDS = metrics.histogram("fx_alert_evaluate_seconds", "Alert evaluation per snapshot")
+ALERTS_FIRED = metrics.counter("fx_alerts_fired_total", "Alert rules that fired")
+
+KINDS = ("above", "below", "change")
+
+
+class AlertRule:
+    """Fire when a pair's rate rises above / falls below a value, or moves by value %"""
+
+    __slots__ = ('id', 'from_curr', 'to_curr', 'kind', 'value', 'once', 'active', 'created')
+
+    def __init__(self, id, from_curr, to_curr, kind, value, once=True, active=True, created=None):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown alert kind: {kind}")
+        self.id = id
+        self.from_curr = from_curr
+        self.to_curr = to_curr
+        self.kind = kind
+        self.value = float(value)
+        self.once = once
+        self.active = active
+        self.created = created or time.time()
+
+    @property
+    def pair(self):
+        return self.from_curr, self.to_curr
+
+    def describe(self) -> str:
+        pair = f"{self.from_curr}/{self.to_curr}"
+        if self.kind == "change":
+            return f"{pair} moves {self.value:g}%"
+        return f"{pair} {self.kind} {self.value:g}"
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class AlertEvent:
+    """One fired rule with the rates that triggered it"""
+
+    __slots__ = ('rule', 'rate', 'previous', 'fired_at')
+
+    def __init__(self, rule, rate, previous):
+        self.rule = rule
+        self.rate = rate
+        self.previous = previous
+        self.fired_at = time.time()
+
+    def message(self) -> str:
+        return f"🔔 {self.rule.describe()} (now {self.rate:.6g})"
+
+
+class AlertEngine:
+    """Registry of alert rules, evaluated against each new rate snapshot"""
+
+    def __init__(self, path: str = "alerts.json"):
+        self.path = path
+        self.rules = {}
+        self._lock = threading.Lock()
+        # Saves run on worker and refresh threads; the last snapshot taken is the last written
+        self._save_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._listeners = []
+
+        # pair -> sorted [(threshold, rule id)] for each kind
+        self._index = {kind: {} for kind in KINDS}
+        self._last_rate = {}
+
+        self.evaluations = 0
+        self.rules_checked = 0
+        self.load()
+
+    # -- rule management ---------------------------------------------------
+
+    def add_listener(self, callback):
+        """Register callback(events: list[AlertEvent]); runs on the evaluating thread"""
+        self._listeners.append(callback)
+
+    def add_rule(self, from_curr, to_curr, kind, value, once=True, save=True) -> AlertRule:
+        """Register a rule; pass save=False when adding many and call save() once"""
+        with self._lock:
+            rule = AlertRule(next(self._ids), from_curr, to_curr, kind, value, once)
+            self.rules[rule.id] = rule
+            self._insert(rule)
+        if save:
+            self.save()
+        return rule
+
+    def remove_rule(self, rule_id):
+        self.remove_rules([rule_id])
+
+    def remove_rules(self, rule_ids, save=True) -> list:
+        """Remove several rules with one save; returns the ids that existed"""
+        removed = []
+        with self._lock:
+            for rule_id in rule_ids:
+                rule = self.rules.pop(rule_id, None)
+                if rule is not None:
+                    self._discard(rule)
+                    removed.append(rule_id)
+        if save and removed:
+            self.save()
+        return removed
+
+    def _entries(self, rule):
+        return self._index[rule.kind].setdefault(rule.pair, [])
+
+    def _insert(self, rule):
+        if rule.active:
+            insort(self._entries(rule), (rule.value, rule.id))
+
+    def _discard(self, rule):
+        entries = self._entries(rule)
+        i = bisect_left(entries, (rule.value, rule.id))
+        if i < len(entries) and entries[i] == (rule.value, rule.id):
+            del entries[i]
+
+    def watched_pairs(self) -> set:
+        pairs = set()
+        for by_pair in self._index.values():
+            pairs.update(pair for pair, entries in by_pair.items() if entries)
+        return pairs
+
+    # -- evaluation --------------------------------------------------------
+
+    def evaluate(self, snapshot, delta=None) -> list:
+        """Check a new snapshot; returns (and broadcasts) the alerts that fired.
+
+        With a SnapshotDelta only the watched pairs it affects are looked at.
+        """
+        matrix = snapshot.matrix if snapshot is not None else None
+        if matrix is None:
+            return []
+
+        events = []
+        with EVALUATE_SECONDS.time(), self._lock:
+            self.evaluations += 1
+            pairs = self.watched_pairs()
+            if delta is not None and not delta.full:
+                pairs = [pair for pair in pairs if delta.affects(*pair)]
+            for pair in pairs:
+                i, j = matrix.index.get(pair[0]), matrix.index.get(pair[1])
+                if i is None or j is None:
+                    continue
+                rate = matrix.rate(i, j)
+                previous = self._last_rate.get(pair)
+                self._last_rate[pair] = rate
+                for rule_id in self._crossed(pair, rate, previous):
+                    rule = self.rules[rule_id]
+                    events.append(AlertEvent(rule, rate, previous))
+
+            for event in events:
+                if event.rule.once and event.rule.active:
+                    self._discard(event.rule)
+                    event.rule.active = False
+
+        if events:
+            ALERTS_FIRED.inc(len(events))
+            self.save()
+            for callback in list(self._listeners):
+                try:
+                    callback(events)
+                except Exception:
+                    log.exception("Alert listener failed")
+        return events
+
+    def _crossed(self, pair, rate, previous):
+        """Rule ids whose thresholds lie between the previous and the new rate"""
+        crossed = []
+
+        above = self._index["above"].get(pair)
+        if above:
+            # Rising through t: previous <= t < rate
+            lo = 0 if previous is None else bisect_left(above, (previous, -1))
+            hi = bisect_left(above, (rate, -1))
+            crossed.extend(rule_id for _, rule_id in above[lo:hi])
+
+        below = self._index["below"].get(pair)
+        if below:
+            # Falling through t: rate < t <= previous
+            lo = bisect_right(below, (rate, float('inf')))
+            hi = len(below) if previous is None else bisect_right(below, (previous, float('inf')))
+            crossed.extend(rule_id for _, rule_id in below[lo:hi])
+
+        change = self._index["change"].get(pair)
+        if change and previous:
+            moved = abs(rate - previous) / previous * 100
+            hi = bisect_right(change, (moved, float('inf')))
+            crossed.extend(rule_id for _, rule_id in change[:hi])
+
+        self.rules_checked += len(crossed)
+        return crossed
+
+    # -- persistence -------------------------------------------------------
+
+    def save(self):
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                data = [rule.to_dict() for rule in self.rules.values()]
+            try:
+                atomic_write(self.path, json.dumps(data).encode())
+            except OSError as e:
+                log.warning("Could not save alerts: %s", e)
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning("Could not load alerts: %s", e)
+            return
+        with self._lock:
+            for item in data:
+                rule = AlertRule.from_dict(item)
+                self.rules[rule.id] = rule
+                self._insert(rule)
+            self._ids = itertools.count(max(self.rules, default=0) + 1)
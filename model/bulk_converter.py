@@ -0,0 +1,192 @@
+# ============================================================================
+# model/bulk_converter.py
+# ============================================================================
+
+"""
+Bulk Converter - Streams CSV/JSONL ledgers through the model in vectorized chunks
+"""
+
+import csv
+import json
+import math
+import time
+from itertools import islice
+
+import numpy as np
+
+from model.fixed_point import format_minor, minor_units
+
+
+class ConversionSpec:
+    """Which fields hold the amount and currencies, and where the result goes"""
+
+    def __init__(self, amount_field="amount", from_field="from", to_field="to",
+                 output_field="converted", from_code=None, to_code=None,
+                 exact=False, rounding="half_even"):
+        self.amount_field = amount_field
+        self.from_field = from_field
+        self.to_field = to_field
+        self.output_field = output_field
+        # Fixed codes override the per-row fields
+        self.from_code = from_code
+        self.to_code = to_code
+        # Exact mode converts on integer minor units and writes decimal strings
+        self.exact = exact
+        self.rounding = rounding
+
+
+class ConversionStats:
+    """Running totals for one bulk conversion"""
+
+    def __init__(self):
+        self.rows = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def add(self, rows, failed):
+        self.rows += rows
+        self.failed += failed
+        self.seconds = time.perf_counter() - self.started
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.rows:,} rows in {self.seconds:.2f}s "
+                f"({self.rows_per_sec:,.0f} rows/sec, {self.failed:,} failed)")
+
+
+def chunks(iterable, size):
+    """Yield lists of at most `size` items without materializing the input"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_amount(value) -> float:
+    try:
+        return float(str(value).replace(',', ''))
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def cell(row, col) -> str:
+    """Field `col` of a CSV row; blank and short rows read as empty"""
+    return row[col] if col < len(row) else ""
+
+
+def parse_record(line):
+    """(record, error) for one JSON line; only objects can be converted"""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None, "Invalid JSON"
+    if not isinstance(record, dict):
+        return None, "Record is not a JSON object"
+    return record, None
+
+
+def convert_columns(model, amounts, from_codes, to_codes) -> np.ndarray:
+    """Vectorized conversion of one chunk; NaN marks rows that could not convert"""
+    results = model.convert_many(amounts, from_codes, to_codes)
+    if results is None:
+        return np.full(len(amounts), np.nan)
+    return results
+
+
+def convert_texts(model, amounts, from_codes, to_codes, spec: ConversionSpec):
+    """Results of one chunk as text in the target's minor units; None marks failures"""
+    if spec.exact:
+        table = model.fixed
+        if table is None:
+            return [None] * len(amounts)
+        minor, ok = table.to_minor(amounts, from_codes)
+        results, converted = table.convert_minor(minor, from_codes, to_codes, spec.rounding)
+        digits = np.broadcast_to(table.digits(to_codes), results.shape)
+        return [format_minor(value, d) if good else None
+                for value, d, good in zip(results.tolist(), digits.tolist(),
+                                          (ok & converted).tolist())]
+
+    results = convert_columns(model, amounts, from_codes, to_codes)
+    if isinstance(to_codes, str):
+        digits = [minor_units(to_codes)] * len(results)
+    else:
+        digits = [minor_units(code) for code in to_codes]
+    return [None if math.isnan(value) else f"{value:.{d}f}"
+            for value, d in zip(results.tolist(), digits)]
+
+
+def convert_csv(model, src, dst, spec: ConversionSpec, chunk_size=10000,
+                header=None, write_header=True, stats=None) -> ConversionStats:
+    """Convert CSV rows from the `src` line iterable into the `dst` text stream.
+
+    Converted rows go to the model's conversion log when it has one (process
+    pool workers pass a bare RateMatrix, which does not).
+    """
+    stats = stats or ConversionStats()
+    conversion_log = getattr(model, "conversion_log", None)
+    reader = csv.reader(src)
+    writer = csv.writer(dst, lineterminator="\n")
+    if header is None:
+        header = next(reader, None)
+        if header is None:
+            return stats
+    if write_header:
+        writer.writerow(header + [spec.output_field])
+
+    amount_col = header.index(spec.amount_field)
+    from_col = None if spec.from_code else header.index(spec.from_field)
+    to_col = None if spec.to_code else header.index(spec.to_field)
+
+    for rows in chunks(reader, chunk_size):
+        amounts = [parse_amount(cell(row, amount_col)) for row in rows]
+        from_codes = spec.from_code or [cell(row, from_col).strip().upper() for row in rows]
+        to_codes = spec.to_code or [cell(row, to_col).strip().upper() for row in rows]
+        texts = convert_texts(model, amounts, from_codes, to_codes, spec)
+        if conversion_log is not None:
+            conversion_log.record_many(amounts, from_codes, to_codes, texts, wait=True)
+
+        writer.writerows(row + ["" if text is None else text] for row, text in zip(rows, texts))
+        stats.add(len(rows), texts.count(None))
+    return stats
+
+
+def convert_jsonl(model, src, dst, spec: ConversionSpec, chunk_size=10000,
+                  stats=None) -> ConversionStats:
+    """Convert JSON-lines records from `src` into `dst`, one object per line"""
+    stats = stats or ConversionStats()
+    conversion_log = getattr(model, "conversion_log", None)
+    records = (parse_record(line) for line in src if line.strip())
+
+    for parsed in chunks(records, chunk_size):
+        # Malformed lines convert as empty records, so they fail like bad fields
+        rows = [record or {} for record, _ in parsed]
+        amounts = [parse_amount(row.get(spec.amount_field)) for row in rows]
+        from_codes = spec.from_code or [str(row.get(spec.from_field, "")).upper() for row in rows]
+        to_codes = spec.to_code or [str(row.get(spec.to_field, "")).upper() for row in rows]
+        if spec.exact:
+            # Decimal strings, so no digits are lost to binary floats
+            values = convert_texts(model, amounts, from_codes, to_codes, spec)
+        else:
+            results = convert_columns(model, amounts, from_codes, to_codes)
+            values = [None if math.isnan(value) else value for value in results.tolist()]
+        if conversion_log is not None:
+            conversion_log.record_many(amounts, from_codes, to_codes, values, wait=True)
+
+        for row, (_, error), value in zip(rows, parsed, values):
+            if error:
+                row["error"] = error
+            row[spec.output_field] = value
+            dst.write(json.dumps(row))
+            dst.write("\n")
+        stats.add(len(rows), values.count(None))
+    return stats
+
+
+def detect_format(path) -> str:
+    return "jsonl" if str(path).lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
@@ -0,0 +1,299 @@
+# ============================================================================
+# model/conversion_log.py
+# ============================================================================
+
+"""
+Conversion Log - Every conversion (GUI, batch, API) in an embedded SQLite database
+
+Callers only enqueue rows; a writer thread drains the queue and inserts in
+batches, one transaction each, so recording never waits on disk. The same
+transaction updates two rollups: `daily_totals` (per day and pair) and
+`pair_totals` (all time, per pair). Aggregate queries read the rollups
+instead of scanning `conversions`, so their cost depends on the number of
+pairs and days, not on the number of conversions. Days are UTC.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from model import metrics
+
+log = logging.getLogger(__name__)
+
+LOGGED = metrics.counter("fx_conversions_logged_total", "Conversions written to the history database")
+DROPPED = metrics.counter("fx_conversions_dropped_total",
+                          "Conversions not logged because the write queue was full")
+WRITE_SECONDS = metrics.histogram("fx_conversion_log_write_seconds", "One batched history write")
+QUERY_SECONDS = metrics.histogram("fx_conversion_log_query_seconds", "History queries", ("query",))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    from_curr TEXT NOT NULL,
+    to_curr TEXT NOT NULL,
+    amount REAL NOT NULL,
+    result REAL NOT NULL,
+    rate REAL,
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conversions_ts ON conversions (ts);
+CREATE INDEX IF NOT EXISTS conversions_pair_ts ON conversions (from_curr, to_curr, ts);
+CREATE TABLE IF NOT EXISTS daily_totals (
+    day INTEGER NOT NULL,
+    from_curr TEXT NOT NULL,
+    to_curr TEXT NOT NULL,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    amount REAL NOT NULL DEFAULT 0,
+    result REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, from_curr, to_curr)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pair_totals (
+    from_curr TEXT NOT NULL,
+    to_curr TEXT NOT NULL,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (from_curr, to_curr)
+) WITHOUT ROWID;
+"""
+
+INSERT = ("INSERT INTO conversions (ts, from_curr, to_curr, amount, result, rate, source) "
+          "VALUES (?, ?, ?, ?, ?, ?, ?)")
+ADD_TOTAL = ("UPDATE daily_totals SET conversions = conversions + ?, amount = amount + ?, "
+             "result = result + ? WHERE day = ? AND from_curr = ? AND to_curr = ?")
+ADD_PAIR = ("UPDATE pair_totals SET conversions = conversions + ? "
+            "WHERE from_curr = ? AND to_curr = ?")
+
+STOP = object()
+
+
+def day_number(ts: float) -> int:
+    return int(ts // 86400)
+
+
+def day_string(day: int) -> str:
+    return datetime.fromtimestamp(day * 86400, tz=timezone.utc).date().isoformat()
+
+
+def as_float(value):
+    """Float for a result that may be a Decimal, a decimal string or None/NaN"""
+    if value is None:
+        return None
+    value = float(value)
+    return value if value == value else None
+
+
+class ConversionLog:
+    """Append-only conversion history with batched background writes"""
+
+    def __init__(self, path: str = "conversion_history.db", batch_size: int = 5000,
+                 linger: float = 0.2, max_pending: int = 10000):
+        self.path = path
+        self.batch_size = batch_size
+        # How long the writer waits for more rows before committing a small batch
+        self.linger = linger
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._ready = threading.Event()
+        self._local = threading.local()
+        self._thread = None
+        self.batches = 0
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name="conversion-log")
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Write everything queued, then stop the writer"""
+        if self._thread is not None:
+            self._queue.put(STOP)
+            self._thread.join()
+            self._thread = None
+
+    def flush(self):
+        """Block until every row queued so far is committed"""
+        if self._thread is not None:
+            self._queue.join()
+
+    # -- recording (any thread) --------------------------------------------
+
+    def record(self, amount, from_curr, to_curr, result, rate=None, source="gui", ts=None):
+        result = as_float(result)
+        if result is None:
+            return
+        self._put([(ts or time.time(), from_curr, to_curr, float(amount), result,
+                    as_float(rate), source)])
+
+    def record_many(self, amounts, from_codes, to_codes, results, source="batch", ts=None,
+                    wait=False):
+        """Record a batch; codes may be one string for every row, failed rows are skipped.
+
+        With `wait`, a full queue blocks the caller (batch jobs) instead of dropping rows.
+        """
+        ts = ts or time.time()
+        count = len(amounts)
+        if isinstance(from_codes, str):
+            from_codes = [from_codes] * count
+        if isinstance(to_codes, str):
+            to_codes = [to_codes] * count
+        rows = []
+        for amount, from_curr, to_curr, result in zip(amounts, from_codes, to_codes, results):
+            result = as_float(result)
+            if result is not None:
+                rows.append((ts, str(from_curr), str(to_curr), float(amount), result, None, source))
+        if rows:
+            self._put(rows, wait)
+
+    def _put(self, rows, wait=False):
+        try:
+            self._queue.put(rows, block=wait)
+        except queue.Full:
+            DROPPED.inc(len(rows))
+            log.warning("Conversion log is behind; dropped %d rows", len(rows))
+
+    # -- writer thread -----------------------------------------------------
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        # WAL lets the UI and the service read while a batch is being written
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _run(self):
+        try:
+            conn = self._connect()
+            conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            log.warning("Conversion log disabled: %s", e)
+            self._ready.set()
+            self._drain_forever()
+            return
+        self._ready.set()
+
+        stopping = False
+        while not stopping:
+            items = [self._queue.get()]
+            rows = 0 if items[0] is STOP else len(items[0])
+            deadline = time.monotonic() + self.linger
+            while rows < self.batch_size and items[-1] is not STOP:
+                try:
+                    items.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+                if items[-1] is not STOP:
+                    rows += len(items[-1])
+
+            stopping = items[-1] is STOP
+            batch = [row for item in items if item is not STOP for row in item]
+            if batch:
+                try:
+                    self._write(conn, batch)
+                except sqlite3.Error as e:
+                    log.warning("Could not write %d conversions: %s", len(batch), e)
+            for _ in items:
+                self._queue.task_done()
+        conn.close()
+
+    def _drain_forever(self):
+        """Without a database, keep accepting (and discarding) rows so callers never block"""
+        while self._queue.get() is not STOP:
+            self._queue.task_done()
+        self._queue.task_done()
+
+    def _write(self, conn, rows):
+        totals = {}
+        for ts, from_curr, to_curr, amount, result, _, _ in rows:
+            entry = totals.setdefault((day_number(ts), from_curr, to_curr), [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += amount
+            entry[2] += result
+        with WRITE_SECONDS.time(), conn:
+            conn.executemany(INSERT, rows)
+            conn.executemany("INSERT OR IGNORE INTO daily_totals (day, from_curr, to_curr) "
+                             "VALUES (?, ?, ?)", totals)
+            conn.executemany(ADD_TOTAL, [(count, amount, result, *key)
+                                         for key, (count, amount, result) in totals.items()])
+            pairs = {}
+            for (_, from_curr, to_curr), (count, _, _) in totals.items():
+                pairs[from_curr, to_curr] = pairs.get((from_curr, to_curr), 0) + count
+            conn.executemany("INSERT OR IGNORE INTO pair_totals (from_curr, to_curr) VALUES (?, ?)",
+                             pairs)
+            conn.executemany(ADD_PAIR, [(count, *pair) for pair, count in pairs.items()])
+        self.batches += 1
+        LOGGED.inc(len(rows))
+
+    # -- queries (any thread) ----------------------------------------------
+
+    def _reader(self):
+        """One read connection per thread; None until the writer created the schema"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if not self._ready.wait(1.0):
+                return None
+            try:
+                conn = self._local.conn = sqlite3.connect(self.path, timeout=10)
+            except sqlite3.Error as e:
+                log.warning("Could not open conversion log: %s", e)
+                return None
+        return conn
+
+    def _query(self, name, sql, params=()):
+        conn = self._reader()
+        if conn is None:
+            return []
+        try:
+            with QUERY_SECONDS.labels(name).time():
+                return conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            log.warning("Conversion log query failed: %s", e)
+            return []
+
+    @staticmethod
+    def _since(days):
+        return -1 if days is None else day_number(time.time()) - days + 1
+
+    def top_pairs(self, limit: int = 10, days: int = None) -> list:
+        """[(from, to, conversions)] most converted first, over the last `days` (default all)"""
+        if days is None:
+            return self._query("top_pairs",
+                               "SELECT from_curr, to_curr, conversions FROM pair_totals "
+                               "ORDER BY conversions DESC, from_curr, to_curr LIMIT ?", (limit,))
+        return self._query("top_pairs",
+                           "SELECT from_curr, to_curr, SUM(conversions) AS n FROM daily_totals "
+                           "WHERE day >= ? GROUP BY from_curr, to_curr "
+                           "ORDER BY n DESC, from_curr, to_curr LIMIT ?",
+                           (self._since(days), limit))
+
+    def daily_totals(self, days: int = None, from_curr: str = None, to_curr: str = None) -> list:
+        """[(YYYY-MM-DD, from, to, conversions, amount, result)] oldest day first"""
+        sql = ("SELECT day, from_curr, to_curr, conversions, amount, result FROM daily_totals "
+               "WHERE day >= ?")
+        params = [self._since(days)]
+        if from_curr:
+            sql += " AND from_curr = ?"
+            params.append(from_curr)
+        if to_curr:
+            sql += " AND to_curr = ?"
+            params.append(to_curr)
+        rows = self._query("daily_totals", sql + " ORDER BY day, from_curr, to_curr", params)
+        return [(day_string(day), *rest) for day, *rest in rows]
+
+    def recent(self, limit: int = 20, from_curr: str = None, to_curr: str = None) -> list:
+        """[(ts, from, to, amount, result, rate, source)] newest first"""
+        if from_curr and to_curr:
+            return self._query("recent",
+                               "SELECT ts, from_curr, to_curr, amount, result, rate, source "
+                               "FROM conversions WHERE from_curr = ? AND to_curr = ? "
+                               "ORDER BY ts DESC LIMIT ?", (from_curr, to_curr, limit))
+        return self._query("recent",
+                           "SELECT ts, from_curr, to_curr, amount, result, rate, source "
+                           "FROM conversions ORDER BY ts DESC LIMIT ?", (limit,))
+
+    def total(self) -> int:
+        rows = self._query("total", "SELECT COALESCE(SUM(conversions), 0) FROM daily_totals")
+        return rows[0][0] if rows else 0
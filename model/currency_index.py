@@ -0,0 +1,71 @@
+# ============================================================================
+# model/currency_index.py
+# ============================================================================
+
+"""
+Currency Index - Immutable code/position/display lookup and type-ahead search
+"""
+
+from bisect import bisect_left
+
+
+class CurrencyIndex:
+    """Built once per currency list; every lookup is a dict hit or a binary search"""
+
+    def __init__(self, codes, names: dict):
+        self.codes = tuple(sorted(codes))
+        self.display = tuple(f"{code} - {names.get(code, code)}" for code in self.codes)
+        self.position = {code: i for i, code in enumerate(self.codes)}
+        self._by_display = dict(zip(self.display, self.codes))
+        self._lowered = tuple(text.lower() for text in self.display)
+
+        # Prefix keys: the code, the full name and each word of the name
+        keys = set()
+        for i, code in enumerate(self.codes):
+            name = names.get(code, code).lower()
+            keys.add((code.lower(), i))
+            keys.add((name, i))
+            keys.update((word, i) for word in name.split())
+        self._keys = sorted(keys)
+        self._key_text = [key for key, _ in self._keys]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def code_for(self, text: str):
+        """Resolve a display string or a bare code; None if unknown"""
+        code = self._by_display.get(text)
+        if code is not None:
+            return code
+        text = text.strip().upper()
+        return text if text in self.position else None
+
+    def display_for(self, code: str):
+        i = self.position.get(code)
+        return None if i is None else self.display[i]
+
+    def search(self, query: str, limit: int = None) -> list:
+        """Display strings matching `query`: prefix matches first, then substrings"""
+        query = query.strip().lower()
+        if not query:
+            return list(self.display[:limit] if limit else self.display)
+
+        found = []
+        seen = set()
+        start = bisect_left(self._key_text, query)
+        for key, i in self._keys[start:]:
+            if not key.startswith(query):
+                break
+            if i not in seen:
+                seen.add(i)
+                found.append(i)
+        found.sort()
+
+        for i, text in enumerate(self._lowered):
+            if i not in seen and query in text:
+                seen.add(i)
+                found.append(i)
+
+        if limit:
+            found = found[:limit]
+        return [self.display[i] for i in found]
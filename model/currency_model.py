@@ -6,22 +6,85 @@
 Currency Model - Handles API data, rates, and business logic with offline support
 """
 
-import requests
 from datetime import datetime
-import json
+import logging
 import os
+import threading
+import time
+import numpy as np
+
+from model import metrics, rate_graph, snapshot_delta
+from model.currency_index import CurrencyIndex
+from model.fixed_point import ROUNDING_MODES, minor_units
+from model.rate_cache import RateCache, RateSnapshot
+from model.rate_fetcher import RateFetcher
+from model.rate_history import RateHistory
+from model.rate_providers import DEFAULT_API_URL, ProviderError
+from model.snapshot_store import TIME_FORMAT, import_json_cache, timestamp_from_string
+
+log = logging.getLogger(__name__)
+
+RATE_LOOKUPS = metrics.counter("fx_rate_lookups_total", "get_rate calls by outcome", ("result",))
+LOOKUP_OK = RATE_LOOKUPS.labels("ok")
+LOOKUP_UNKNOWN = RATE_LOOKUPS.labels("unknown_currency")
+LOOKUP_NO_RATES = RATE_LOOKUPS.labels("no_rates")
+BATCH_ROWS = metrics.counter("fx_batch_conversions_total", "Amounts converted through convert_many")
+BATCH_SECONDS = metrics.histogram("fx_batch_convert_seconds", "convert_many call duration")
+CACHE_SECONDS = metrics.histogram("fx_cache_io_seconds", "Disk snapshot cache saves and loads", ("op",))
+CACHE_ERRORS = metrics.counter("fx_cache_errors_total", "Failed disk cache operations", ("op",))
+REFRESHES = metrics.counter("fx_refresh_total", "Rate downloads by mode and outcome", ("mode", "result"))
+LISTENER_ERRORS = metrics.counter("fx_listener_errors_total", "Snapshot listeners that raised")
+REBASES = metrics.counter("fx_rebase_total", "Base switches served by rebasing a held snapshot")
+SNAPSHOT_CHANGES = metrics.counter("fx_snapshot_changes_total",
+                                   "Activated snapshots by change (full, delta, unchanged)", ("change",))
+CHANGE_FULL = SNAPSHOT_CHANGES.labels("full")
+CHANGE_DELTA = SNAPSHOT_CHANGES.labels("delta")
+CHANGE_NONE = SNAPSHOT_CHANGES.labels("unchanged")
+OUTLIERS = metrics.counter("fx_rate_outliers_total",
+                           "Provider quotes outside the reconciliation tolerance", ("provider",))
 
 
 class CurrencyModel:
     """Model: Handles data and business logic with offline mode"""
 
-    def __init__(self):
-        self.api_url = "https://api.exchangerate-api.com/v4/latest/"
-        self.rates = {}
-        self.base_currency = "USD"
-        self.last_updated = None
-        self.is_offline = False
-        self.cache_file = "currency_rates_cache.json"
+    def __init__(self, cache_ttl: float = 300, max_cached_bases: int = 8,
+                 history_dir: str = "rate_history", providers=None, hedge_after: float = 1.0,
+                 exact: bool = False, rounding: str = "half_even",
+                 reconcile: bool = False, tolerance_bps: float = 50.0, shared_cache=None,
+                 conversion_log=None):
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Unknown rounding mode: {rounding}")
+        # Exact mode converts on integer minor units (see model/fixed_point.py)
+        self.exact = exact
+        self.rounding = rounding
+
+        # Rate sources; without explicit providers the public API is the only one
+        self.fetcher = RateFetcher(DEFAULT_API_URL, providers=providers, hedge_after=hedge_after)
+        self.default_base = "USD"
+        # Download every provider and merge them instead of taking the first answer
+        self.reconcile = reconcile
+        self.tolerance_bps = tolerance_bps
+        self.last_reconciliation = None
+        # Host-wide SharedRateCache; replaces the per-directory cache file when set
+        self.shared_cache = shared_cache
+        self.cache_file = "currency_rates_cache.fxrs"
+        self.legacy_cache_file = "currency_rates_cache.json"
+        self._journal = None
+
+        # Every downloaded snapshot is appended here (None disables history)
+        self.history = RateHistory(history_dir) if history_dir else None
+        # ConversionLog recording user conversions (None disables it)
+        self.conversion_log = conversion_log
+
+        # Snapshots per base currency; `snapshot` is the one currently in use
+        self.rate_cache = RateCache(ttl=cache_ttl, max_entries=max_cached_bases)
+        self.snapshot = None
+        self._revalidating = set()
+        self._index = (None, None)  # (snapshot, CurrencyIndex built for it)
+        self._snapshot_listeners = []
+        # Delta from the previously active snapshot to the current one
+        self.last_delta = None
+        self._revalidate_lock = threading.Lock()
 
         # Currency display names
         self.currency_names = {
@@ -45,110 +108,366 @@ class CurrencyModel:
             'BDT': 'Bangladeshi Taka', 'LKR': 'Sri Lankan Rupee', 'NPR': 'Nepalese Rupee'
         }
 
+    @property
+    def api_url(self) -> str:
+        return self.fetcher.api_url
+
+    @api_url.setter
+    def api_url(self, url: str):
+        self.fetcher.api_url = url
+
+    @property
+    def rates(self) -> dict:
+        snapshot = self.snapshot
+        return snapshot.rates if snapshot else {}
+
+    @property
+    def base_currency(self) -> str:
+        snapshot = self.snapshot
+        return snapshot.base if snapshot else self.default_base
+
+    @property
+    def last_updated(self):
+        snapshot = self.snapshot
+        return snapshot.last_updated if snapshot else None
+
+    @property
+    def is_offline(self) -> bool:
+        snapshot = self.snapshot
+        return snapshot.is_offline if snapshot else False
+
+    @property
+    def matrix(self):
+        snapshot = self.snapshot
+        return snapshot.matrix if snapshot else None
+
+    def set_rates(self, rates: dict, base: str, last_updated: str,
+                  is_offline: bool = False, fetched_at: float = None):
+        """Install a rates snapshot for `base` and make it the active one"""
+        snapshot = RateSnapshot(base, rates, last_updated, is_offline, fetched_at)
+        self.rate_cache.put(snapshot)
+        self.activate(snapshot)
+        return snapshot
+
+    def add_snapshot_listener(self, callback):
+        """Register callback(snapshot, delta), called on the installing thread when the
+        active snapshot's rates change (not for refreshes that returned identical rates)"""
+        self._snapshot_listeners.append(callback)
+
+    def activate(self, snapshot):
+        """Make `snapshot` the active one and notify subscribers of what changed"""
+        delta = snapshot_delta.diff(self.snapshot, snapshot)
+        self.snapshot = snapshot
+        self.last_delta = delta
+        if delta.unchanged:
+            CHANGE_NONE.inc()
+            return
+        (CHANGE_FULL if delta.full else CHANGE_DELTA).inc()
+        for callback in list(self._snapshot_listeners):
+            try:
+                callback(snapshot, delta)
+            except Exception:
+                LISTENER_ERRORS.inc()
+                log.exception("Snapshot listener failed")
+
+    @property
+    def journal(self) -> snapshot_delta.SnapshotJournal:
+        """Checkpoint + delta log behind `cache_file`"""
+        if self._journal is None or self._journal.path != self.cache_file:
+            self._journal = snapshot_delta.SnapshotJournal(self.cache_file)
+        return self._journal
+
     def save_rates_to_cache(self):
-        """Save current rates to local cache file"""
+        """Save current rates to the local cache: nothing if unchanged, else a delta or checkpoint"""
+        snapshot = self.snapshot
+        # Shared snapshots are published by whichever process downloaded them
+        if snapshot is None or self.shared_cache is not None:
+            return
         try:
-            cache_data = {
-                'rates': self.rates,
-                'base_currency': self.base_currency,
-                'last_updated': self.last_updated
-            }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f)
-            print("[CACHE] Rates saved to cache")
+            with CACHE_SECONDS.labels("save").time():
+                kind = self.journal.record(snapshot.rates, snapshot.base,
+                                           timestamp_from_string(snapshot.last_updated),
+                                           snapshot.digest)
+            log.debug("Rates saved to cache (%s)", kind)
         except Exception as e:
-            print(f"[CACHE ERROR] Could not save cache: {e}")
+            CACHE_ERRORS.labels("save").inc()
+            log.warning("Could not save cache: %s", e)
 
     def load_rates_from_cache(self):
-        """Load rates from local cache file"""
+        """Load rates from the local snapshot, importing the legacy JSON cache if needed"""
+        if self.shared_cache is not None:
+            return self.load_shared_cache()
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                self.rates = cache_data['rates']
-                self.base_currency = cache_data['base_currency']
-                self.last_updated = cache_data['last_updated']
-                self.is_offline = True
-                print("[CACHE] Loaded rates from cache (Offline Mode)")
+            if not os.path.exists(self.cache_file) and os.path.exists(self.legacy_cache_file):
+                import_json_cache(self.legacy_cache_file, self.cache_file)
+                log.info("Imported legacy JSON cache")
+            if self.journal.exists():
+                with CACHE_SECONDS.labels("load").time():
+                    rates, base, timestamp = self.journal.load()
+                self.set_rates(rates, base, datetime.fromtimestamp(timestamp).strftime(TIME_FORMAT),
+                               is_offline=True)
+                log.info("Loaded rates from cache (Offline Mode)")
                 return True
         except Exception as e:
-            print(f"[CACHE ERROR] Could not load cache: {e}")
+            CACHE_ERRORS.labels("load").inc()
+            log.warning("Could not load cache: %s", e)
         return False
 
-    def fetch_rates(self, base: str = "USD") -> bool:
-        """Fetch latest currency rates from API with offline fallback"""
+    def load_shared_cache(self) -> bool:
+        """Load the newest snapshot any local process published to the shared cache"""
         try:
-            response = requests.get(f"{self.api_url}{base}", timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            if "rates" not in data:
-                raise ValueError("Invalid response: 'rates' key missing")
-
-            self.rates = data["rates"]
-            self.base_currency = base
-            self.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.is_offline = False
-            
-            # Save to cache for offline use
-            self.save_rates_to_cache()
-            
-            print("[API] Rates fetched successfully (Online Mode)")
+            with CACHE_SECONDS.labels("load").time():
+                latest = self.shared_cache.latest()
+        except OSError as e:
+            CACHE_ERRORS.labels("load").inc()
+            log.warning("Could not read shared cache: %s", e)
+            return False
+        if latest is None:
+            return False
+        rates, base, fetched_at = latest
+        self.set_rates(rates, base, datetime.fromtimestamp(fetched_at).strftime(TIME_FORMAT),
+                       is_offline=True)
+        log.info("Loaded rates from shared cache (Offline Mode)")
+        return True
+
+    def fetch_from_providers(self, base: str) -> dict:
+        """Rates for `base` straight from the providers (merged when reconciling)"""
+        if self.reconcile and len(self.fetcher.providers) > 1:
+            return self.reconcile_providers(base).rebased(base)
+        return self.fetcher.fetch(base)["rates"]
+
+    def download_rates(self, base: str) -> RateSnapshot:
+        """Fresh snapshot for `base`: from the API, or from the shared cache when
+        another process downloaded it within the shared cache's max_age"""
+        if self.shared_cache is not None:
+            rates, fetched_at = self.shared_cache.get_or_fetch(base, self.fetch_from_providers)
+        else:
+            rates, fetched_at = self.fetch_from_providers(base), time.time()
+        when = datetime.fromtimestamp(fetched_at)
+        if self.history is not None:
+            try:
+                self.history.append(rates, base, when)
+            except OSError as e:
+                log.warning("Could not record snapshot in history: %s", e)
+        # Age counts from the original download, so TTLs line up across processes
+        age = max(0.0, time.time() - fetched_at)
+        return RateSnapshot(base, rates, when.strftime(TIME_FORMAT),
+                            fetched_at=time.monotonic() - age)
+
+    def reconcile_providers(self, base: str, pivot: str = None):
+        """Fetch `base` from every provider and merge the answers into one Reconciliation"""
+        payloads = self.fetcher.fetch_all(base)
+        quotes = {name: (data.get("base", base), data["rates"]) for name, data in payloads.items()}
+        result = rate_graph.reconcile(quotes, pivot or base, self.tolerance_bps)
+        for outlier in result.outliers:
+            OUTLIERS.labels(outlier.provider).inc()
+            log.warning("%s quotes %s %+.1f bps away from the other providers",
+                        outlier.provider, outlier.code, outlier.deviation_bps)
+        self.last_reconciliation = result
+        return result
+
+    def rebase(self, base: str) -> bool:
+        """Switch to `base` by rebasing the freshest snapshot held, without a download"""
+        candidates = [self.snapshot] + self.rate_cache.snapshots()
+        source = max((s for s in candidates if s is not None and s.quotes(base)),
+                     key=lambda s: -s.age(), default=None)
+        if source is None:
+            return False
+        snapshot = source.rebased(base)
+        self.rate_cache.put(snapshot)
+        self.activate(snapshot)
+        REBASES.inc()
+        if snapshot.age() > self.rate_cache.ttl:
+            self.revalidate(snapshot.derived_from)
+        return True
+
+    def fetch_rates(self, base: str = "USD") -> bool:
+        """Fetch latest currency rates, served from the in-memory cache when possible"""
+        snapshot, fresh = self.rate_cache.get(base)
+        if snapshot is not None:
+            if snapshot is not self.snapshot:
+                self.activate(snapshot)
+            if not fresh:
+                self.revalidate(snapshot.derived_from or base)
             return True
 
-        except (requests.RequestException, ValueError) as e:
-            print(f"[API ERROR] Could not fetch rates: {e}")
-            
-            # Try loading from cache
-            if self.load_rates_from_cache():
-                return True
-            
-            self.rates = {}
+        # Any held snapshot that quotes `base` can be rebased locally
+        if self.rebase(base):
+            return True
+
+        if self.refresh_rates(base):
+            return True
+
+        # Try loading from cache
+        if self.load_rates_from_cache():
+            return True
+
+        self.snapshot = None
+        return False
+
+    def refresh_rates(self, base: str = None) -> bool:
+        """Download fresh rates and swap them in as the active snapshot"""
+        base = base or self.base_currency
+        try:
+            snapshot = self.download_rates(base)
+        except (ProviderError, ValueError) as e:
+            REFRESHES.labels("foreground", "error").inc()
+            log.warning("Could not fetch rates: %s", e)
             return False
 
+        self.rate_cache.put(snapshot)
+        # A single reference assignment, so readers see the old or new snapshot, never a mix
+        self.activate(snapshot)
+
+        # Save to cache for offline use
+        self.save_rates_to_cache()
+
+        REFRESHES.labels("foreground", "ok").inc()
+        log.info("Rates fetched successfully (Online Mode)")
+        return True
+
+    def revalidate(self, base: str):
+        """Refresh a stale snapshot in the background; readers keep the stale one meanwhile"""
+        with self._revalidate_lock:
+            if base in self._revalidating:
+                return
+            self._revalidating.add(base)
+
+        def worker():
+            try:
+                snapshot = self.download_rates(base)
+            except (ProviderError, ValueError) as e:
+                REFRESHES.labels("background", "error").inc()
+                log.warning("Background refresh for %s failed: %s", base, e)
+                return
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(base)
+
+            self.rate_cache.put(snapshot)
+            current = self.snapshot
+            if current is not None and current.derived_from == base:
+                # The active snapshot was rebased from this one; rebase the fresh copy too
+                snapshot = snapshot.rebased(current.base)
+                self.rate_cache.put(snapshot)
+            if current is not None and current.base == snapshot.base:
+                self.activate(snapshot)
+                self.save_rates_to_cache()
+            REFRESHES.labels("background", "ok").inc()
+            log.info("Rates for %s refreshed in background", base)
+
+        threading.Thread(target=worker, daemon=True).start()
+
     def get_rate(self, from_curr: str, to_curr: str) -> float:
         """Get exchange rate between two currencies"""
-        if not self.rates:
-            print("[WARNING] No rates available")
+        matrix = self.matrix
+        if matrix is None:
+            LOOKUP_NO_RATES.inc()
             return None
-        
-        try:
-            if from_curr not in self.rates and from_curr != self.base_currency:
-                print(f"[ERROR] Unknown currency: {from_curr}")
-                return None
-            
-            if to_curr not in self.rates:
-                print(f"[ERROR] Unknown currency: {to_curr}")
-                return None
-            
-            if from_curr == self.base_currency:
-                rate = self.rates[to_curr]
-            else:
-                rate = self.rates[to_curr] / self.rates[from_curr]
-            
-            return round(rate, 6)
-        
-        except Exception as e:
-            print(f"[ERROR] Rate calculation failed: {e}")
+
+        i = matrix.index.get(from_curr)
+        j = matrix.index.get(to_curr)
+        if i is None or j is None:
+            LOOKUP_UNKNOWN.inc()
+            log.debug("Unknown currency in %s -> %s", from_curr, to_curr)
+            return None
+
+        LOOKUP_OK.inc()
+        return matrix.rate(i, j)
+
+    def get_rate_at(self, from_curr: str, to_curr: str, when) -> float:
+        """Historical exchange rate in effect at `when` (datetime or unix seconds)"""
+        if self.history is None:
             return None
+        return self.history.get_rate_at(from_curr, to_curr, when)
+
+    def get_rate_range(self, from_curr: str, to_curr: str, start=None, end=None):
+        """(timestamps, rates) recorded for a pair between start and end"""
+        if self.history is None:
+            return np.empty(0), np.empty(0)
+        return self.history.get_range(from_curr, to_curr, start, end)
 
     def convert(self, amount: float, from_curr: str, to_curr: str) -> float:
-        """Convert a given amount between two currencies"""
+        """Convert a given amount, rounded to the target currency's minor units"""
         rate = self.get_rate(from_curr, to_curr)
         if rate is None:
             return 0.0
-        return round(amount * rate, 2)
+        return round(amount * rate, minor_units(to_curr))
+
+    @property
+    def fixed(self):
+        """Scaled-integer rate table of the current snapshot (None before rates load)"""
+        matrix = self.matrix
+        return matrix.fixed if matrix is not None else None
+
+    def convert_exact(self, amount, from_curr: str, to_curr: str, rounding: str = None):
+        """Exact conversion on integer minor units; returns a Decimal or None"""
+        matrix = self.matrix
+        if matrix is None:
+            LOOKUP_NO_RATES.inc()
+            return None
+        return matrix.fixed.convert_exact(amount, from_curr, to_curr, rounding or self.rounding)
+
+    def quote(self, amount, from_curr: str, to_curr: str):
+        """(result, rate) as shown to users, in the model's float or exact mode"""
+        rate = self.get_rate(from_curr, to_curr)
+        if rate is None:
+            return None, None
+        if self.exact:
+            return self.convert_exact(amount, from_curr, to_curr), rate
+        return round(amount * rate, minor_units(to_curr)), rate
+
+    def convert_many_minor(self, minor, from_codes, to_codes, rounding: str = None):
+        """Exact batch conversion of int64 minor units: (int64 results, ok mask)"""
+        matrix = self.matrix
+        if matrix is None:
+            LOOKUP_NO_RATES.inc()
+            return None
+        with BATCH_SECONDS.time():
+            result = matrix.fixed.convert_minor(minor, from_codes, to_codes,
+                                                rounding or self.rounding)
+        BATCH_ROWS.inc(len(result[0]))
+        return result
+
+    def convert_many(self, amounts, from_codes, to_codes):
+        """Convert whole arrays of amounts at once (NaN where a currency is unknown)"""
+        matrix = self.matrix
+        if matrix is None:
+            LOOKUP_NO_RATES.inc()
+            return None
+        with BATCH_SECONDS.time():
+            result = matrix.convert_many(amounts, from_codes, to_codes)
+        BATCH_ROWS.inc(len(result))
+        return result
+
+    def record_conversion(self, amount, from_curr, to_curr, result, rate=None, source="gui"):
+        """Add one completed conversion to the conversion log, if there is one"""
+        if self.conversion_log is not None:
+            self.conversion_log.record(amount, from_curr, to_curr, result, rate, source)
+
+    def record_conversions(self, amounts, from_codes, to_codes, results, source="batch"):
+        """Add a batch of conversions to the log; rows without a result are skipped"""
+        if self.conversion_log is not None:
+            self.conversion_log.record_many(amounts, from_codes, to_codes, results, source)
+
+    def top_pairs(self, limit: int = 5) -> list:
+        """[(from, to, conversions)] the user converts most, or [] without a log"""
+        if self.conversion_log is None:
+            return []
+        return self.conversion_log.top_pairs(limit)
+
+    @property
+    def currency_index(self) -> CurrencyIndex:
+        """Currency lookup/search index, rebuilt only when the currency list changes"""
+        snapshot = self.snapshot
+        codes = snapshot.matrix.codes if snapshot and snapshot.matrix else tuple(self.currency_names)
+        cached_for, index = self._index
+        # Keyed by the code list, so refreshes that only move rates keep the index
+        if index is None or cached_for != codes:
+            index = CurrencyIndex(codes, self.currency_names)
+            self._index = (codes, index)
+        return index
 
     def get_currency_list(self) -> list:
         """Return sorted list of all available currencies with display names"""
-        if self.rates:
-            available = self.rates.keys()
-        else:
-            available = self.currency_names.keys()
-        
-        formatted_list = []
-        for code in sorted(available):
-            name = self.currency_names.get(code, code)
-            formatted_list.append(f"{code} - {name}")
-        
-        return formatted_list
+        return list(self.currency_index.display)
@@ -0,0 +1,219 @@
+# ============================================================================
+# model/fixed_point.py
+# ============================================================================
+
+"""
+Fixed Point - Exact conversion on integer minor units with scaled-integer rates
+
+A cross rate is published as `mantissa * 10**-exponent` with RATE_DIGITS
+significant digits. Converting `a` minor units of X into Y is then the single
+integer division
+
+    a * mantissa / 10**shift,   shift = exponent + minor_units(X) - minor_units(Y)
+
+rounded once with the chosen rounding mode. Batches run on int64 arrays: the
+amount is split into base-1e9 limbs so the product never leaves int64.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation, localcontext
+
+import numpy as np
+
+RATE_DIGITS = 9  # significant digits kept in every cross rate
+MAX_SHIFT = 18
+MAX_MINOR = 9 * 10 ** 18  # largest amount (in minor units) accepted
+
+# ISO 4217 minor units; every other currency uses 2
+MINOR_UNITS = {
+    'BIF': 0, 'CLP': 0, 'DJF': 0, 'GNF': 0, 'ISK': 0, 'JPY': 0, 'KMF': 0, 'KRW': 0,
+    'PYG': 0, 'RWF': 0, 'UGX': 0, 'UYI': 0, 'VND': 0, 'VUV': 0, 'XAF': 0, 'XOF': 0,
+    'XPF': 0,
+    'BHD': 3, 'IQD': 3, 'JOD': 3, 'KWD': 3, 'LYD': 3, 'OMR': 3, 'TND': 3,
+    'CLF': 4, 'UYW': 4,
+}
+
+ROUNDING_MODES = ("half_even", "half_up", "half_down", "down", "up", "floor", "ceiling")
+
+_POW10 = np.array([10 ** k for k in range(MAX_SHIFT + 1)], dtype=np.int64)
+_LIMB = 10 ** 9
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def minor_units(code: str) -> int:
+    return MINOR_UNITS.get(code, 2)
+
+
+def quantize_significant(values, digits: int = RATE_DIGITS):
+    """Split positive floats into (int64 mantissa, int64 exponent), value ~ m * 10**-e.
+
+    Non-positive or non-finite values get mantissa 0.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valid = np.isfinite(values) & (values > 0)
+        x = np.where(valid, values, 1.0)
+        exponent = digits - 1 - np.floor(np.log10(x)).astype(np.int64)
+        mantissa = np.rint(x * 10.0 ** exponent)
+
+        # log10 can land one decade off, and rounding can carry into a new digit
+        low = mantissa < 10 ** (digits - 1)
+        exponent = np.where(low, exponent + 1, exponent)
+        mantissa = np.where(low, np.rint(x * 10.0 ** exponent), mantissa)
+        high = mantissa >= 10 ** digits
+        exponent = np.where(high, exponent - 1, exponent)
+        mantissa = np.where(high, np.rint(x * 10.0 ** exponent), mantissa)
+
+    return np.where(valid, mantissa, 0).astype(np.int64), exponent
+
+
+def round_divide(numerator: int, divisor: int, rounding: str = "half_even") -> int:
+    """numerator / divisor rounded to an integer (exact, Python ints)"""
+    q, r = divmod(abs(numerator), divisor)
+    q += _round_up(q, r, divisor, numerator < 0, rounding)
+    return -q if numerator < 0 else q
+
+
+def _round_up(q, r, divisor, negative, rounding):
+    """1 if the magnitude quotient q (remainder r) must be rounded away from zero.
+
+    Works element-wise on numpy arrays as well as on Python ints.
+    """
+    twice = 2 * r
+    if rounding == "half_even":
+        return (twice > divisor) | ((twice == divisor) & (q % 2 == 1))
+    if rounding == "half_up":
+        return twice >= divisor
+    if rounding == "half_down":
+        return twice > divisor
+    if rounding == "down":
+        return r * 0
+    if rounding == "up":
+        return r > 0
+    if rounding == "floor":
+        return (r > 0) & negative
+    if rounding == "ceiling":
+        return (r > 0) & ~negative if isinstance(negative, np.ndarray) else (r > 0) and not negative
+    raise ValueError(f"Unknown rounding mode: {rounding}")
+
+
+def format_minor(value: int, digits: int) -> str:
+    """'-1234.50' style text for an integer amount in minor units"""
+    sign = "-" if value < 0 else ""
+    whole, frac = divmod(abs(int(value)), 10 ** digits)
+    return f"{sign}{whole}.{frac:0{digits}d}" if digits else f"{sign}{whole}"
+
+
+class FixedRateTable:
+    """Scaled-integer cross rates for one RateMatrix, built on first exact conversion"""
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.exponents = matrix.exponents
+
+        vector = matrix._cross_vector
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = vector[np.newaxis, :] / vector[:, np.newaxis]
+        mantissa, exponent = quantize_significant(ratio)
+        shift = exponent + self.exponents[:, np.newaxis] - self.exponents[np.newaxis, :]
+
+        # Extremely small rates: give up trailing mantissa digits to keep shift <= 18
+        excess = np.clip(shift - MAX_SHIFT, 0, MAX_SHIFT)
+        mantissa = np.where(excess > 0,
+                            np.rint(mantissa / 10.0 ** excess).astype(np.int64), mantissa)
+        shift = shift - excess
+
+        # Rates of 1e8 and above would need a negative shift; none exist in practice
+        self.valid = (mantissa > 0) & (shift >= 0) & (shift <= MAX_SHIFT)
+        self.mantissa = np.where(self.valid, mantissa, 0)
+        self.shift = np.where(self.valid, shift, 0)
+
+    def digits(self, codes) -> np.ndarray:
+        """Minor-unit exponents for codes (2 for unknown codes)"""
+        idx = self.matrix.indices(codes)
+        return np.where(idx >= 0, self.exponents[np.maximum(idx, 0)], 2)
+
+    def rate(self, from_code: str, to_code: str):
+        """The published cross rate as an exact Decimal, or None"""
+        i, j = self.matrix.index.get(from_code), self.matrix.index.get(to_code)
+        if i is None or j is None or not self.valid[i, j]:
+            return None
+        exponent = int(self.shift[i, j] - self.exponents[i] + self.exponents[j])
+        return Decimal(int(self.mantissa[i, j])).scaleb(-exponent)
+
+    def to_minor(self, amounts, codes):
+        """(int64 minor units, ok mask) from float amounts, rounded half-even"""
+        amounts = np.asarray(amounts, dtype=np.float64).reshape(-1)
+        scale = 10.0 ** np.broadcast_to(self.digits(codes), amounts.shape)
+        with np.errstate(invalid='ignore', over='ignore'):
+            scaled = np.rint(amounts * scale)
+            ok = np.isfinite(scaled) & (np.abs(scaled) < MAX_MINOR)
+        minor = np.where(ok, scaled, 0).astype(np.int64)
+        return minor, ok & (np.broadcast_to(self.matrix.indices(codes), amounts.shape) >= 0)
+
+    def convert_minor(self, minor, from_codes, to_codes, rounding: str = "half_even"):
+        """Convert int64 minor units between currencies.
+
+        Returns (int64 results in the target's minor units, ok mask); rows with
+        unknown currencies or results beyond int64 are not ok and hold 0.
+        """
+        minor = np.asarray(minor, dtype=np.int64).reshape(-1)
+        src = np.broadcast_to(self.matrix.indices(from_codes), minor.shape)
+        dst = np.broadcast_to(self.matrix.indices(to_codes), minor.shape)
+        known = (src >= 0) & (dst >= 0)
+        src, dst = np.where(known, src, 0), np.where(known, dst, 0)
+
+        m = self.mantissa[src, dst]
+        s = self.shift[src, dst]
+        ok = known & self.valid[src, dst] & (minor > -MAX_MINOR) & (minor < MAX_MINOR)
+
+        negative = minor < 0
+        a1, a0 = np.divmod(np.where(ok, np.abs(minor), 0), _LIMB)
+        p1, p0 = a1 * m, a0 * m  # both < 9.2e18 since m < 1e9
+
+        # shift <= 9: q = p1 * 10**(9-s) + p0 // 10**s
+        s_low = np.minimum(s, 9)
+        up = _POW10[9 - s_low]
+        low_div = _POW10[s_low]
+        overflow = (s <= 9) & (p1 > (_INT64_MAX - p0 // low_div) // up)
+        with np.errstate(over='ignore'):
+            q_low = p1 * up + p0 // low_div
+        r_low = p0 % low_div
+
+        # shift > 9: fold p0's high limb into p1, then divide by 10**(s-9)
+        t = np.maximum(s - 9, 0)
+        carry = p1 + p0 // _LIMB
+        q_high = carry // _POW10[t]
+        r_high = (carry % _POW10[t]) * _LIMB + p0 % _LIMB
+
+        q = np.where(s <= 9, q_low, q_high)
+        r = np.where(s <= 9, r_low, r_high)
+        q = q + _round_up(q, r, _POW10[s], negative, rounding).astype(np.int64)
+
+        ok &= ~overflow
+        return np.where(ok, np.where(negative, -q, q), 0), ok
+
+    def convert_exact(self, amount, from_code: str, to_code: str,
+                      rounding: str = "half_even"):
+        """Convert one amount exactly; returns a Decimal in the target's minor units or None.
+
+        Like to_minor(), amounts that are not finite numbers or reach MAX_MINOR
+        minor units give None.
+        """
+        i, j = self.matrix.index.get(from_code), self.matrix.index.get(to_code)
+        if i is None or j is None or not self.valid[i, j]:
+            return None
+        src_digits, dst_digits = int(self.exponents[i]), int(self.exponents[j])
+        # Enough digits for MAX_MINOR times a 9-digit mantissa, whatever the caller's context
+        with localcontext() as ctx:
+            ctx.prec = 40
+            try:
+                scaled = Decimal(str(amount)).scaleb(src_digits)
+            except InvalidOperation:
+                return None
+            if not scaled.is_finite() or abs(scaled) >= MAX_MINOR:
+                return None
+            # Amounts are first taken to the source's minor units, as in to_minor()
+            minor = int(scaled.quantize(Decimal(1), ROUND_HALF_EVEN))
+            result = round_divide(minor * int(self.mantissa[i, j]), 10 ** int(self.shift[i, j]),
+                                  rounding)
+            return Decimal(result).scaleb(-dst_digits)
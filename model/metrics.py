@@ -0,0 +1,290 @@
+# ============================================================================
+# model/metrics.py
+# ============================================================================
+
+"""
+Metrics - In-process counters, gauges and latency histograms
+
+Instruments are created once at import time and updated on hot paths with a
+single attribute check when metrics are disabled. Updates are not locked: a
+rare lost increment under heavy thread contention is an accepted trade-off.
+
+    FETCHES = metrics.counter("fx_fetch_total", "Rate fetches", ("provider", "result"))
+    FETCHES.labels("primary", "ok").inc()
+    with FETCH_SECONDS.time():
+        ...
+
+Set FX_METRICS=0 to disable collection. Export with render_prometheus() or
+write_prometheus(path) (node_exporter textfile format).
+"""
+
+import functools
+import os
+import time
+from bisect import bisect_left
+
+from model.snapshot_store import atomic_write
+
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _NullTimer:
+    """Shared no-op context manager handed out while metrics are disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ('series', 'start')
+
+    def __init__(self, series):
+        self.series = series
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.series.observe(time.perf_counter() - self.start)
+        return False
+
+
+class Registry:
+    """Holds every instrument; `enabled` gates all updates"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.instruments = {}
+
+    def _register(self, instrument):
+        existing = self.instruments.get(instrument.name)
+        if existing is not None:
+            return existing
+        self.instruments[instrument.name] = instrument
+        return instrument
+
+    def reset(self):
+        for instrument in self.instruments.values():
+            instrument.reset()
+
+    def snapshot(self) -> dict:
+        """{name: {label values: value or histogram dict}}"""
+        return {name: {labels: series.value() for labels, series in instrument.series.items()}
+                for name, instrument in self.instruments.items()}
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for instrument in self.instruments.values():
+            lines.append(f"# HELP {instrument.name} {instrument.help}")
+            lines.append(f"# TYPE {instrument.name} {instrument.kind}")
+            for labels, series in list(instrument.series.items()):
+                lines.extend(series.render(instrument.name, instrument.label_text(labels)))
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        atomic_write(path, self.render_prometheus().encode())
+
+
+class _Instrument:
+    kind = None
+
+    def __init__(self, registry, name: str, help: str, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.series = {}
+        self._default = None if self.labelnames else self.labels()
+
+    def labels(self, *values):
+        """Series for one combination of label values (cache it on hot paths)"""
+        series = self.series.get(values)
+        if series is None:
+            series = self.series.setdefault(values, self._new_series())
+        return series
+
+    def label_text(self, values) -> str:
+        if not values:
+            return ""
+        pairs = ",".join(f'{name}="{value}"' for name, value in zip(self.labelnames, values))
+        return "{" + pairs + "}"
+
+    def reset(self):
+        for series in self.series.values():
+            series.reset()
+
+
+class _CounterSeries:
+    __slots__ = ('registry', 'count')
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.count = 0
+
+    def inc(self, amount=1):
+        if self.registry.enabled:
+            self.count += amount
+
+    def value(self):
+        return self.count
+
+    def reset(self):
+        self.count = 0
+
+    def render(self, name, labels):
+        return [f"{name}{labels} {self.count}"]
+
+
+class _GaugeSeries(_CounterSeries):
+    __slots__ = ()
+
+    def set(self, value):
+        if self.registry.enabled:
+            self.count = value
+
+
+class _HistogramSeries:
+    __slots__ = ('registry', 'buckets', 'counts', 'total', 'observations')
+
+    def __init__(self, registry, buckets):
+        self.registry = registry
+        self.buckets = buckets
+        self.reset()
+
+    def observe(self, value: float):
+        if self.registry.enabled:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.total += value
+            self.observations += 1
+
+    def time(self):
+        """Context manager observing the elapsed seconds of its block"""
+        return _Timer(self) if self.registry.enabled else NULL_TIMER
+
+    def reset(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.observations = 0
+
+    def quantile(self, q: float):
+        """Upper bucket bound containing the q-quantile (None without data)"""
+        if not self.observations:
+            return None
+        rank = q * self.observations
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def value(self):
+        return {'count': self.observations, 'sum': self.total,
+                'p50': self.quantile(0.5), 'p99': self.quantile(0.99)}
+
+    def render(self, name, labels):
+        inner = labels[1:-1] + "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{inner}le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{inner}le="+Inf"}} {self.observations}')
+        lines.append(f"{name}_sum{labels} {self.total}")
+        lines.append(f"{name}_count{labels} {self.observations}")
+        return lines
+
+
+class Counter(_Instrument):
+    kind = "counter"
+
+    def _new_series(self):
+        return _CounterSeries(self.registry)
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+
+class Gauge(_Instrument):
+    kind = "gauge"
+
+    def _new_series(self):
+        return _GaugeSeries(self.registry)
+
+    def set(self, value):
+        self._default.set(value)
+
+
+class Histogram(_Instrument):
+    kind = "histogram"
+
+    def __init__(self, registry, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(registry, name, help, labelnames)
+
+    def _new_series(self):
+        return _HistogramSeries(self.registry, self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+
+REGISTRY = Registry(enabled=os.environ.get("FX_METRICS", "1") != "0")
+
+
+def counter(name: str, help: str, labelnames=()) -> Counter:
+    return REGISTRY._register(Counter(REGISTRY, name, help, labelnames))
+
+
+def gauge(name: str, help: str, labelnames=()) -> Gauge:
+    return REGISTRY._register(Gauge(REGISTRY, name, help, labelnames))
+
+
+def histogram(name: str, help: str, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+    return REGISTRY._register(Histogram(REGISTRY, name, help, labelnames, buckets))
+
+
+def timed(series):
+    """Decorator observing each call's duration in a histogram series"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not series.registry.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                series.observe(time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def set_enabled(enabled: bool):
+    REGISTRY.enabled = enabled
+
+
+def render_prometheus() -> str:
+    return REGISTRY.render_prometheus()
+
+
+def write_prometheus(path: str):
+    REGISTRY.write_prometheus(path)
+
+
+def export_from_env():
+    """Write the Prometheus text file named by FX_METRICS_FILE, if set"""
+    path = os.environ.get("FX_METRICS_FILE")
+    if path and REGISTRY.enabled:
+        write_prometheus(path)
@@ -0,0 +1,176 @@
+# ============================================================================
+# model/parallel_converter.py
+# ============================================================================
+
+"""
+Parallel Converter - Process-pool bulk conversion over byte-range chunks
+
+The active rate snapshot is packed once into shared memory (same layout as the
+binary cache file); workers map it instead of receiving a pickled copy per task.
+Input must hold one record per line (no quoted newlines in CSV fields).
+Workers have no conversion log; the parent logs each part's rows as it merges them.
+"""
+
+import csv
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from multiprocessing import shared_memory
+
+from model.bulk_converter import (ConversionStats, cell, chunks, convert_csv, convert_jsonl,
+                                  parse_amount, parse_record)
+from model.rate_matrix import RateMatrix
+from model.snapshot_store import pack_snapshot, parse_snapshot, timestamp_from_string
+
+_worker_rates = None
+
+
+class SharedRateTable:
+    """A rate snapshot published into a named shared memory block"""
+
+    def __init__(self, snapshot):
+        data = pack_snapshot(snapshot.rates, snapshot.base,
+                             timestamp_from_string(snapshot.last_updated))
+        self.shm = shared_memory.SharedMemory(create=True, size=len(data))
+        self.shm.buf[:len(data)] = data
+        self.name = self.shm.name
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_shared_rates(name):
+    """Pool initializer: map the shared snapshot and build this worker's rate matrix"""
+    global _worker_rates
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track flag
+        shm = shared_memory.SharedMemory(name=name)
+    view = parse_snapshot(shm.buf)
+    _worker_rates = RateMatrix(view.to_dict(), view.base)
+    # Only the small matrix is kept; drop the views so the mapping can close
+    del view
+    shm.close()
+
+
+def split_byte_ranges(path, parts: int, start: int = 0):
+    """Split [start, EOF) into up to `parts` ranges that begin on line boundaries"""
+    size = os.path.getsize(path)
+    bounds = [start]
+    with open(path, 'rb') as f:
+        for k in range(1, parts):
+            target = start + (size - start) * k // parts
+            if target <= bounds[-1]:
+                continue
+            f.seek(target - 1)
+            f.readline()  # finish the line that straddles the target
+            offset = f.tell()
+            if bounds[-1] < offset < size:
+                bounds.append(offset)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def header_end(path) -> tuple:
+    """Return (header row, byte offset after it) for a CSV file"""
+    with open(path, 'rb') as f:
+        line = f.readline()
+        offset = f.tell()
+    return next(csv.reader([line.decode('utf-8')]), []), offset
+
+
+def iter_range_lines(f, start, end):
+    f.seek(start)
+    position = start
+    while position < end:
+        line = f.readline()
+        if not line:
+            return
+        position += len(line)
+        yield line.decode('utf-8')
+
+
+def convert_range(task):
+    """Worker: convert one byte range into its own part file"""
+    path, start, end, fmt, spec, header, part_path, chunk_size = task
+    stats = ConversionStats()
+    with open(path, 'rb') as src, open(part_path, 'w', newline="", encoding="utf-8") as dst:
+        lines = iter_range_lines(src, start, end)
+        if fmt == "csv":
+            convert_csv(_worker_rates, lines, dst, spec, chunk_size,
+                        header=header, write_header=False, stats=stats)
+        else:
+            convert_jsonl(_worker_rates, lines, dst, spec, chunk_size, stats=stats)
+    return part_path, stats.rows, stats.failed
+
+
+def log_part(conversion_log, part_path, fmt, spec, header, chunk_size=10000):
+    """Record the converted rows of one part file in the conversion log"""
+    with open(part_path, 'r', newline="", encoding="utf-8") as part:
+        if fmt == "csv":
+            amount_col = header.index(spec.amount_field)
+            from_col = None if spec.from_code else header.index(spec.from_field)
+            to_col = None if spec.to_code else header.index(spec.to_field)
+            for rows in chunks(csv.reader(part), chunk_size):
+                conversion_log.record_many(
+                    [parse_amount(cell(row, amount_col)) for row in rows],
+                    spec.from_code or [cell(row, from_col).strip().upper() for row in rows],
+                    spec.to_code or [cell(row, to_col).strip().upper() for row in rows],
+                    [cell(row, len(header)) or None for row in rows], wait=True)
+        else:
+            records = (parse_record(line)[0] or {} for line in part if line.strip())
+            for rows in chunks(records, chunk_size):
+                conversion_log.record_many(
+                    [parse_amount(row.get(spec.amount_field)) for row in rows],
+                    spec.from_code or [str(row.get(spec.from_field, "")).upper() for row in rows],
+                    spec.to_code or [str(row.get(spec.to_field, "")).upper() for row in rows],
+                    [row.get(spec.output_field) for row in rows], wait=True)
+
+
+def convert_file_parallel(model, input_path, output_path, fmt, spec, workers=None,
+                          chunk_size=10000, chunks_per_worker=4) -> ConversionStats:
+    """Convert a file with a process pool; output order matches input order"""
+    workers = workers or os.cpu_count() or 1
+    stats = ConversionStats()
+    conversion_log = getattr(model, "conversion_log", None)
+
+    header, body_start = header_end(input_path) if fmt == "csv" else (None, 0)
+    ranges = split_byte_ranges(input_path, workers * chunks_per_worker, body_start)
+
+    out_dir = os.path.dirname(os.path.abspath(output_path)) if output_path != "-" else None
+    with SharedRateTable(model.snapshot) as table, \
+            tempfile.TemporaryDirectory(dir=out_dir, prefix=".fx-parts-") as tmp:
+        tasks = [(input_path, start, end, fmt, spec, header,
+                  os.path.join(tmp, f"part-{i:05d}"), chunk_size)
+                 for i, (start, end) in enumerate(ranges)]
+
+        dst = sys.stdout if output_path == "-" else open(output_path, 'w', newline="", encoding="utf-8")
+        try:
+            if header is not None:
+                csv.writer(dst, lineterminator="\n").writerow(header + [spec.output_field])
+            with multiprocessing.Pool(workers, initializer=attach_shared_rates,
+                                      initargs=(table.name,)) as pool:
+                # imap yields in task order, so parts are merged as soon as they are next in line
+                for part_path, rows, failed in pool.imap(convert_range, tasks):
+                    with open(part_path, 'r', newline="", encoding="utf-8") as part:
+                        shutil.copyfileobj(part, dst)
+                    if conversion_log is not None:
+                        log_part(conversion_log, part_path, fmt, spec, header, chunk_size)
+                    os.unlink(part_path)
+                    stats.add(rows, failed)
+        finally:
+            if dst is not sys.stdout:
+                dst.close()
+
+    stats.seconds = time.perf_counter() - stats.started
+    return stats
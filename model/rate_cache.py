@@ -0,0 +1,135 @@
+# ============================================================================
+# model/rate_cache.py
+# ============================================================================
+
+"""
+Rate Cache - In-memory, multi-base rate snapshots with TTL and LRU eviction
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from model import metrics
+from model.rate_matrix import RateMatrix
+from model.snapshot_delta import content_hash
+
+CACHE_LOOKUPS = metrics.counter("fx_rate_cache_lookups_total",
+                                "In-memory snapshot cache lookups by outcome", ("result",))
+LOOKUP_HIT = CACHE_LOOKUPS.labels("hit")
+LOOKUP_STALE = CACHE_LOOKUPS.labels("stale")
+LOOKUP_MISS = CACHE_LOOKUPS.labels("miss")
+
+
+class RateSnapshot:
+    """Rates for one base currency, treated as immutable once built"""
+
+    __slots__ = ('base', 'rates', 'last_updated', 'is_offline', 'fetched_at', 'matrix',
+                 'derived_from', '_digest')
+
+    def __init__(self, base: str, rates: dict, last_updated: str,
+                 is_offline: bool = False, fetched_at: float = None,
+                 matrix: RateMatrix = None, derived_from: str = None):
+        self.base = base
+        self.rates = rates
+        self.last_updated = last_updated
+        self.is_offline = is_offline
+        # Monotonic fetch time; None means "never fresh" (e.g. loaded from disk)
+        self.fetched_at = fetched_at
+        if matrix is None and rates:
+            matrix = RateMatrix(rates, base)
+        self.matrix = matrix
+        # Base of the downloaded snapshot this one was rebased from (None if downloaded)
+        self.derived_from = derived_from
+        self._digest = None
+
+    @property
+    def digest(self) -> str:
+        """Content hash of base + rates, computed on first use"""
+        if self._digest is None:
+            self._digest = content_hash(self.rates, self.base)
+        return self._digest
+
+    def quotes(self, code: str) -> bool:
+        return self.matrix is not None and code in self.matrix.index
+
+    def rebased(self, base: str) -> "RateSnapshot":
+        """This snapshot quoted against `base`, computed locally (KeyError if not quoted)"""
+        matrix = self.matrix.rebased(base)
+        return RateSnapshot(base, matrix.rates_dict(), self.last_updated, self.is_offline,
+                            self.fetched_at, matrix, self.derived_from or self.base)
+
+    def age(self) -> float:
+        """Seconds since this snapshot was fetched (inf if unknown)"""
+        if self.fetched_at is None:
+            return float('inf')
+        return time.monotonic() - self.fetched_at
+
+
+class RateCache:
+    """LRU cache of RateSnapshots keyed by base currency"""
+
+    def __init__(self, ttl: float = 300, max_entries: int = 8):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, base: str):
+        """Return (snapshot, is_fresh); snapshot is None on a miss.
+
+        Stale entries are still returned so callers can serve them while a
+        refresh runs in the background.
+        """
+        with self._lock:
+            snapshot = self._entries.get(base)
+            if snapshot is None:
+                self.misses += 1
+                LOOKUP_MISS.inc()
+                return None, False
+            self._entries.move_to_end(base)
+            if snapshot.age() <= self.ttl:
+                self.hits += 1
+                LOOKUP_HIT.inc()
+                return snapshot, True
+            self.stale_hits += 1
+            LOOKUP_STALE.inc()
+            return snapshot, False
+
+    def put(self, snapshot: RateSnapshot):
+        """Insert or replace the snapshot for its base, evicting the LRU entry"""
+        with self._lock:
+            self._entries[snapshot.base] = snapshot
+            self._entries.move_to_end(snapshot.base)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def snapshots(self) -> list:
+        """All held snapshots, least recently used first"""
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, base):
+        return base in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
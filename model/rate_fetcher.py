@@ -0,0 +1,240 @@
+# ============================================================================
+# model/rate_fetcher.py
+# ============================================================================
+
+"""
+Rate Fetcher - Asyncio rate downloads across failover providers with hedged requests
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from model import metrics
+from model.rate_providers import HttpJsonProvider, ProviderError
+
+COALESCED = metrics.counter("fx_fetch_coalesced_total", "Fetches that joined an in-flight request")
+RETRIES = metrics.counter("fx_fetch_retries_total", "Fetch attempts retried after backoff")
+HEDGES = metrics.counter("fx_fetch_hedged_total", "Providers raced because the current one was slow")
+FAILOVERS = metrics.counter("fx_fetch_failovers_total", "Providers tried after another one failed")
+
+
+class RateFetcher:
+    """Fetches rate payloads with provider failover, retries and request coalescing.
+
+    All coalescing state lives on one private event loop running in a daemon
+    thread, so callers from any thread (or any other event loop) share the
+    same in-flight requests.
+
+    Each fetch starts with the fastest healthy provider. If it has not answered
+    within `hedge_after` seconds the next one is raced against it, and a failure
+    moves straight on to the next provider; the first valid payload wins.
+    """
+
+    def __init__(self, api_url: str = None, timeout: float = 10, max_concurrency: int = 4,
+                 retries: int = 2, backoff: float = 0.5, max_backoff: float = 4.0,
+                 providers=None, hedge_after: float = 1.0):
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.hedge_after = hedge_after
+
+        if providers:
+            self.providers = list(providers)
+        else:
+            self.providers = [HttpJsonProvider("primary", api_url, timeout, max_concurrency)]
+
+        # Hedged requests can keep one extra worker busy per provider
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency + len(self.providers),
+                                            thread_name_prefix="rate-fetch")
+
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._inflight = {}
+        self._semaphore = None
+
+        self.requests_sent = 0
+        self.coalesced = 0
+        self.retried = 0
+        self.hedged = 0
+        self.failovers = 0
+
+    @property
+    def api_url(self) -> str:
+        """URL of the first HTTP provider (None when there is none)"""
+        for provider in self.providers:
+            if isinstance(provider, HttpJsonProvider):
+                return provider.api_url
+        return None
+
+    @api_url.setter
+    def api_url(self, url: str):
+        for provider in self.providers:
+            if isinstance(provider, HttpJsonProvider):
+                provider.api_url = url
+                return
+        self.providers.insert(0, HttpJsonProvider("primary", url, pool_size=self.max_concurrency))
+
+    def ranked_providers(self) -> list:
+        """Available providers, fastest first (all of them if none is available)"""
+        now = time.monotonic()
+        available = [p for p in self.providers if p.health.available(now)]
+        return sorted(available or self.providers, key=lambda p: p.health.score())
+
+    def _ensure_loop(self):
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, daemon=True,
+                                 name="rate-fetch-loop").start()
+                self._loop = loop
+        return self._loop
+
+    def submit(self, base: str):
+        """Start (or join) a fetch for `base`; returns a concurrent.futures.Future"""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._fetch_coalesced(base), loop)
+
+    def fetch(self, base: str) -> dict:
+        """Blocking fetch of the rate payload for `base`"""
+        return self.submit(base).result()
+
+    async def fetch_async(self, base: str) -> dict:
+        """Awaitable fetch usable from any event loop"""
+        return await asyncio.wrap_future(self.submit(base))
+
+    def fetch_all(self, base: str) -> dict:
+        """Blocking fetch of `base` from every available provider: {name: payload}.
+
+        Providers that fail are left out; ProviderError only if all of them do.
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._gather(base), loop).result()
+
+    async def _gather(self, base: str) -> dict:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        providers = self.ranked_providers()
+        results = await asyncio.gather(*(self._call(p, base) for p in providers),
+                                       return_exceptions=True)
+        payloads = {p.name: r for p, r in zip(providers, results)
+                    if not isinstance(r, BaseException)}
+        if not payloads:
+            raise ProviderError([(p.name, r) for p, r in zip(providers, results)])
+        return payloads
+
+    async def _fetch_coalesced(self, base: str) -> dict:
+        task = self._inflight.get(base)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_with_retry(base))
+            self._inflight[base] = task
+            task.add_done_callback(lambda _: self._inflight.pop(base, None))
+        else:
+            self.coalesced += 1
+            COALESCED.inc()
+        return await asyncio.shield(task)
+
+    async def _fetch_with_retry(self, base: str) -> dict:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        attempt = 0
+        while True:
+            try:
+                return await self._race(base)
+            except ProviderError as e:
+                if attempt >= self.retries or not any(
+                        self._is_retryable(error) for _, error in e.errors):
+                    raise
+            # Full jitter keeps many clients from retrying in lockstep
+            delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+            attempt += 1
+            self.retried += 1
+            RETRIES.inc()
+            await asyncio.sleep(random.uniform(0, delay))
+
+    async def _race(self, base: str) -> dict:
+        """One attempt across providers: hedge slow ones, fail over on errors"""
+        candidates = iter(self.ranked_providers())
+        running = {}  # task -> provider
+        errors = []
+
+        def launch():
+            provider = next(candidates, None)
+            if provider is None:
+                return
+            task = asyncio.ensure_future(self._call(provider, base))
+            running[task] = provider
+
+        launch()
+        while running:
+            done, _ = await asyncio.wait(running, timeout=self.hedge_after,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                before = len(running)
+                launch()
+                self.hedged += len(running) - before
+                HEDGES.inc(len(running) - before)
+                continue
+
+            result = None
+            for task in done:
+                provider = running.pop(task)
+                if task.exception() is None:
+                    result = result or task.result()
+                else:
+                    errors.append((provider.name, task.exception()))
+            if result is not None:
+                # Losers keep running in the pool; they still update provider health
+                for task in running:
+                    task.add_done_callback(lambda t: t.exception())
+                return result
+            before = len(running)
+            launch()
+            self.failovers += len(running) - before
+            FAILOVERS.inc(len(running) - before)
+        raise ProviderError(errors)
+
+    async def _call(self, provider, base: str) -> dict:
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            self.requests_sent += 1
+            return await loop.run_in_executor(self._executor, provider.timed_fetch, base)
+
+    @staticmethod
+    def _is_retryable(error) -> bool:
+        """Retry network failures and 5xx responses, never client errors or bad payloads"""
+        # requests is imported lazily; before that no error can come from it
+        requests = sys.modules.get("requests")
+        if requests is None or not isinstance(error, requests.RequestException):
+            return False
+        response = getattr(error, 'response', None)
+        if response is not None and response.status_code < 500:
+            return False
+        return True
+
+    def stats(self) -> dict:
+        return {
+            'requests_sent': self.requests_sent,
+            'coalesced': self.coalesced,
+            'retried': self.retried,
+            'hedged': self.hedged,
+            'failovers': self.failovers,
+            'in_flight': len(self._inflight),
+            'providers': {p.name: p.health.to_dict() for p in self.providers},
+        }
+
+    def close(self):
+        """Stop the event loop and release pooled connections"""
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+                self._semaphore = None
+        self._executor.shutdown(wait=False)
+        for provider in self.providers:
+            provider.close()
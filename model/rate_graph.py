@@ -0,0 +1,112 @@
+# ============================================================================
+# model/rate_graph.py
+# ============================================================================
+
+"""
+Rate Graph - Local rebasing and reconciliation of several providers' snapshots
+
+Every snapshot is a vector of rates against its own base, so any other base is
+one division away. Quotes from several providers are reconciled in log space
+against a pivot currency: each provider's quotes become a vector of
+log(pivot -> code) values, the consensus is the per-currency median, and a
+provider whose base -> pivot -> code triangle does not close against the
+consensus by more than `tolerance_bps` is reported as an outlier.
+"""
+
+import math
+import warnings
+
+import numpy as np
+
+
+def rebase_rates(rates: dict, base: str, new_base: str) -> dict:
+    """Rates against `new_base` from rates against `base` (KeyError if it is not quoted)"""
+    rates = dict(rates)
+    rates.setdefault(base, 1.0)
+    pivot = rates[new_base]
+    if not pivot > 0:
+        raise ValueError(f"No usable rate for {new_base}")
+    return {code: rate / pivot for code, rate in rates.items()}
+
+
+class Outlier:
+    """One provider quote that disagrees with the consensus"""
+
+    __slots__ = ('provider', 'code', 'deviation_bps')
+
+    def __init__(self, provider: str, code: str, deviation_bps: float):
+        self.provider = provider
+        self.code = code
+        self.deviation_bps = deviation_bps
+
+    def __repr__(self):
+        return f"Outlier({self.provider}, {self.code}, {self.deviation_bps:+.1f} bps)"
+
+
+class Reconciliation:
+    """Consensus rates against `pivot`, plus what each provider disagreed on"""
+
+    def __init__(self, pivot: str, codes, consensus, deviations, providers, tolerance_bps):
+        self.pivot = pivot
+        self.codes = codes
+        self.providers = providers
+        self.tolerance_bps = tolerance_bps
+        # deviations[p, c]: provider p's quote for codes[c] vs consensus, in bps (NaN if unquoted)
+        self.deviations = deviations
+        self.rates = {code: value for code, value in zip(codes, consensus.tolist())
+                      if not math.isnan(value)}
+
+        flagged = np.argwhere(np.abs(np.nan_to_num(deviations)) > tolerance_bps)
+        self.outliers = [Outlier(providers[p], codes[c], float(deviations[p, c]))
+                         for p, c in flagged]
+
+    @property
+    def consistent(self) -> bool:
+        return not self.outliers
+
+    def max_deviation_bps(self) -> float:
+        if not np.isfinite(self.deviations).any():
+            return 0.0
+        return float(np.nanmax(np.abs(self.deviations)))
+
+    def rebased(self, base: str) -> dict:
+        return rebase_rates(self.rates, self.pivot, base)
+
+
+def reconcile(snapshots: dict, pivot: str = "USD", tolerance_bps: float = 50.0) -> Reconciliation:
+    """Merge {provider: (base, rates)} into one consistent set of rates against `pivot`.
+
+    Providers that do not quote the pivot are aligned to the consensus by their
+    median offset.
+    """
+    providers = list(snapshots)
+    codes = sorted({code for base, rates in snapshots.values() for code in (*rates, base)})
+    index = {code: i for i, code in enumerate(codes)}
+    if pivot not in index:
+        raise ValueError(f"No provider quotes the pivot currency {pivot}")
+
+    # logs[p, c] = log(units of c per unit of provider p's base)
+    logs = np.full((len(providers), len(codes)), np.nan)
+    for p, name in enumerate(providers):
+        base, rates = snapshots[name]
+        logs[p, index[base]] = 0.0
+        for code, rate in rates.items():
+            if rate and rate > 0:
+                logs[p, index[code]] = math.log(rate)
+
+    # Re-express every row as pivot -> code where the provider quotes the pivot
+    pivot_col = logs[:, index[pivot]]
+    quoted = ~np.isnan(pivot_col)
+    logs[quoted] -= pivot_col[quoted, np.newaxis]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns are expected
+        consensus = np.nanmedian(logs[quoted], axis=0)
+        # Align every row by its median offset, so a bad pivot quote does not skew the row
+        offsets = np.nan_to_num(np.nanmedian(logs - consensus, axis=1))
+        logs -= offsets[:, np.newaxis]
+        consensus = np.nanmedian(logs, axis=0)
+    consensus -= consensus[index[pivot]]
+    deviations = np.expm1(logs - consensus) * 1e4
+
+    return Reconciliation(pivot, codes, np.exp(consensus), deviations, providers, tolerance_bps)
@@ -0,0 +1,199 @@
+# ============================================================================
+# model/rate_history.py
+# ============================================================================
+
+"""
+Rate History - Append-only, columnar store of every fetched rate snapshot
+
+One float64 file per currency plus a shared timestamps file. Row i of every
+column belongs to timestamps[i]; rates within a row share a base, so cross
+rates are col[to][i] / col[from][i] whatever base that row was fetched in.
+
+Every `compact_after` appended rows, snapshots older than `keep_seconds`
+are compacted to one per day so the files stay bounded.
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from model.snapshot_store import atomic_write
+
+TIMESTAMPS = "timestamps.f64"
+
+log = logging.getLogger(__name__)
+
+
+def to_seconds(when) -> float:
+    """Accept a datetime or unix seconds"""
+    if isinstance(when, datetime):
+        return when.timestamp()
+    return float(when)
+
+
+class RateHistory:
+    """Time-indexed rate columns on disk with binary-search lookups"""
+
+    def __init__(self, directory: str = "rate_history", compact_after: int = 5000,
+                 keep_seconds: float = 30 * 86400):
+        self.directory = directory
+        self.compact_after = compact_after
+        self.keep_seconds = keep_seconds
+        self._lock = threading.Lock()
+        self._timestamps = None
+        self._columns = {}
+        self._next_compact = compact_after
+        if os.path.isdir(directory):
+            self._repair()
+
+    # -- storage helpers ---------------------------------------------------
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _column_path(self, code):
+        return self._path(f"{code}.f64")
+
+    def codes(self) -> list:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-4] for name in os.listdir(self.directory)
+                      if name.endswith(".f64") and name != TIMESTAMPS)
+
+    def _repair(self):
+        """Trim columns left longer than the timestamps by an interrupted append"""
+        self._truncate(len(self.timestamps()))
+
+    def _truncate(self, rows):
+        for path in [self._column_path(code) for code in self.codes()] + [self._path(TIMESTAMPS)]:
+            if os.path.exists(path) and os.path.getsize(path) > rows * 8:
+                os.truncate(path, rows * 8)
+
+    def timestamps(self) -> np.ndarray:
+        if self._timestamps is None:
+            path = self._path(TIMESTAMPS)
+            self._timestamps = np.fromfile(path, dtype="<f8") if os.path.exists(path) else np.empty(0)
+        return self._timestamps
+
+    def column(self, code: str) -> np.ndarray:
+        """Full history for one currency (NaN where it was not quoted)"""
+        column = self._columns.get(code)
+        if column is None:
+            rows = len(self.timestamps())
+            path = self._column_path(code)
+            if not os.path.exists(path):
+                return None
+            column = np.fromfile(path, dtype="<f8")[:rows]
+            if len(column) < rows:
+                column = np.concatenate([column, np.full(rows - len(column), np.nan)])
+            self._columns[code] = column
+        return column
+
+    def __len__(self):
+        return len(self.timestamps())
+
+    # -- writing -----------------------------------------------------------
+
+    def append(self, rates: dict, base: str, when) -> bool:
+        """Record one snapshot; out-of-order or repeated snapshots are ignored"""
+        when = to_seconds(when)
+        with self._lock:
+            timestamps = self.timestamps()
+            rows = len(timestamps)
+            # A shared-cache snapshot keeps its download time, so re-reads repeat it
+            if rows and when <= timestamps[-1]:
+                return False
+
+            os.makedirs(self.directory, exist_ok=True)
+            row = dict(rates)
+            row.setdefault(base, 1.0)
+            known = set(self.codes())
+
+            # Columns first; the timestamp written last commits the row
+            try:
+                for code in known | set(row):
+                    with open(self._column_path(code), 'ab') as f:
+                        if code not in known and rows:
+                            f.write(np.full(rows, np.nan).tobytes())
+                        f.write(np.float64(row.get(code, np.nan)).tobytes())
+                with open(self._path(TIMESTAMPS), 'ab') as f:
+                    f.write(np.float64(when).tobytes())
+            except OSError:
+                # Later appends must line up with the timestamps again
+                try:
+                    self._truncate(rows)
+                finally:
+                    self._timestamps = None
+                    self._columns.clear()
+                raise
+
+            self._timestamps = None
+            self._columns.clear()
+            if self.compact_after and rows + 1 >= self._next_compact:
+                try:
+                    self._compact(when - self.keep_seconds)
+                except OSError as e:
+                    log.warning("Could not compact rate history: %s", e)
+                self._next_compact = len(self.timestamps()) + self.compact_after
+            return True
+
+    def compact(self, older_than, bucket_seconds: float = 86400) -> int:
+        """Keep only the last row per bucket for rows older than `older_than`.
+
+        Returns the number of rows removed.
+        """
+        with self._lock:
+            return self._compact(to_seconds(older_than), bucket_seconds)
+
+    def _compact(self, cutoff, bucket_seconds=86400):
+        timestamps = self.timestamps()
+        if not len(timestamps):
+            return 0
+
+        old = timestamps < cutoff
+        buckets = np.floor(timestamps / bucket_seconds)
+        # A row survives if it is recent or the last of its bucket
+        last_in_bucket = np.append(buckets[1:] != buckets[:-1], True)
+        keep = ~old | last_in_bucket
+        removed = int(len(keep) - keep.sum())
+        if not removed:
+            return 0
+
+        for code in self.codes():
+            atomic_write(self._column_path(code), self.column(code)[keep].astype("<f8").tobytes())
+        atomic_write(self._path(TIMESTAMPS), timestamps[keep].astype("<f8").tobytes())
+
+        self._timestamps = None
+        self._columns.clear()
+        return removed
+
+    # -- queries -----------------------------------------------------------
+
+    def get_rate_at(self, from_curr: str, to_curr: str, when) -> float:
+        """Rate in effect at `when` (latest snapshot at or before it), or None"""
+        with self._lock:
+            timestamps = self.timestamps()
+            i = int(np.searchsorted(timestamps, to_seconds(when), side='right')) - 1
+            if i < 0:
+                return None
+            src, dst = self.column(from_curr), self.column(to_curr)
+            if src is None or dst is None:
+                return None
+            rate = dst[i] / src[i]
+        if np.isnan(rate):
+            return None
+        return float(rate)
+
+    def get_range(self, from_curr: str, to_curr: str, start=None, end=None):
+        """(timestamps, rates) arrays for snapshots in [start, end]"""
+        with self._lock:
+            timestamps = self.timestamps()
+            lo = 0 if start is None else int(np.searchsorted(timestamps, to_seconds(start), side='left'))
+            hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, to_seconds(end), side='right'))
+            src, dst = self.column(from_curr), self.column(to_curr)
+            if src is None or dst is None:
+                return np.empty(0), np.empty(0)
+            return timestamps[lo:hi], dst[lo:hi] / src[lo:hi]
@@ -0,0 +1,115 @@
+# ============================================================================
+# model/rate_matrix.py
+# ============================================================================
+
+"""
+Rate Matrix - Precomputed cross-rate table for fast single and batch conversion
+"""
+
+import copy
+
+import numpy as np
+
+from model.fixed_point import FixedRateTable, minor_units, quantize_significant
+
+
+class RateMatrix:
+    """Array-backed N x N cross-rate table built once per rate snapshot"""
+
+    def __init__(self, rates: dict, base: str):
+        rates = dict(rates)
+        rates.setdefault(base, 1.0)
+
+        self.base = base
+        self.codes = tuple(sorted(rates))
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self._sorted_codes = np.array(self.codes)
+        self.vector = np.array([rates[code] for code in self.codes], dtype=np.float64)
+
+        self.exponents = np.array([minor_units(code) for code in self.codes], dtype=np.int64)
+        self._scales = 10.0 ** self.exponents
+        # The N x N tables are built on first use: snapshots that are loaded,
+        # diffed or rebased but never converted with never pay for them.
+        # Rebased copies keep this vector so their tables come out identical.
+        self._cross_vector = self.vector
+        self._cross = None
+        self._rows = None
+        self._fixed = None
+
+    def __len__(self):
+        return len(self.codes)
+
+    def rebased(self, base: str) -> "RateMatrix":
+        """The same table quoted against another base.
+
+        Cross rates do not depend on the base, so the tables (once built) are
+        shared and only the base vector is rescaled.
+        """
+        matrix = copy.copy(self)
+        matrix.base = base
+        matrix.vector = self.vector / self.vector[self.index[base]]
+        return matrix
+
+    def rates_dict(self) -> dict:
+        return dict(zip(self.codes, self.vector.tolist()))
+
+    @property
+    def cross(self) -> np.ndarray:
+        """cross[i, j] = units of codes[j] per one unit of codes[i], built on first use.
+
+        Kept to the same significant digits as the exact (fixed-point) rates so
+        both modes agree.
+        """
+        if self._cross is None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cross = self._cross_vector[np.newaxis, :] / self._cross_vector[:, np.newaxis]
+            mantissa, exponent = quantize_significant(cross)
+            self._cross = np.where(mantissa > 0, mantissa / 10.0 ** exponent, np.nan)
+        return self._cross
+
+    def rate(self, i: int, j: int) -> float:
+        """Cross rate between two currency indices"""
+        rows = self._rows
+        if rows is None:
+            # Plain Python rows make scalar lookups cheaper than numpy indexing
+            rows = self._rows = self.cross.tolist()
+        return rows[i][j]
+
+    @property
+    def fixed(self) -> FixedRateTable:
+        """Scaled-integer rates for exact conversion, built on first use"""
+        if self._fixed is None:
+            self._fixed = FixedRateTable(self)
+        return self._fixed
+
+    def indices(self, codes) -> np.ndarray:
+        """Map currency codes to integer indices (-1 for unknown codes)"""
+        if isinstance(codes, str):
+            return np.array([self.index.get(codes, -1)], dtype=np.intp)
+
+        # codes are kept sorted, so a vectorized binary search resolves them
+        codes = np.asarray(codes).reshape(-1)
+        if len(self.codes) == 0:
+            return np.full(codes.shape, -1, dtype=np.intp)
+        pos = np.searchsorted(self._sorted_codes, codes)
+        pos = np.minimum(pos, len(self.codes) - 1)
+        return np.where(self._sorted_codes[pos] == codes, pos, -1).astype(np.intp)
+
+    def convert_many(self, amounts, from_codes, to_codes) -> np.ndarray:
+        """Convert arrays of amounts in one vectorized pass.
+
+        ``from_codes``/``to_codes`` may be a single code or an array matching
+        ``amounts``. Results are rounded to the target currency's minor units;
+        rows with an unknown currency come back as NaN.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64).reshape(-1)
+        src = self.indices(from_codes)
+        dst = self.indices(to_codes)
+        src, dst = np.broadcast_to(src, amounts.shape), np.broadcast_to(dst, amounts.shape)
+
+        known = (src >= 0) & (dst >= 0)
+        rates = np.full(amounts.shape, np.nan)
+        rates[known] = self.cross[src[known], dst[known]]
+        scale = np.full(amounts.shape, 100.0)
+        scale[known] = self._scales[dst[known]]
+        return np.round(amounts * rates * scale) / scale
@@ -0,0 +1,233 @@
+# ============================================================================
+# model/rate_providers.py
+# ============================================================================
+
+"""
+Rate Providers - Interchangeable rate sources with latency and error tracking
+
+Every provider returns the same payload shape as the HTTP API:
+{"base": "USD", "date": "...", "rates": {"EUR": 0.92, ...}}
+"""
+
+import json
+import os
+import time
+from datetime import date
+
+from model import metrics
+
+DEFAULT_API_URL = "https://api.exchangerate-api.com/v4/latest/"
+
+FETCHES = metrics.counter("fx_fetch_total", "Provider fetches by outcome", ("provider", "result"))
+FETCH_SECONDS = metrics.histogram("fx_fetch_seconds", "Provider fetch latency", ("provider",))
+
+
+class ProviderError(Exception):
+    """Every provider tried for a request failed"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        details = "; ".join(f"{name}: {error}" for name, error in self.errors)
+        super().__init__(f"All rate providers failed ({details})")
+
+
+class ProviderHealth:
+    """EWMA latency and error rate of one provider, plus a failure cooldown"""
+
+    def __init__(self, alpha: float = 0.3, max_failures: int = 3, cooldown: float = 30.0):
+        self.alpha = alpha
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+
+        self.latency = None  # seconds; None until the first answer
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+        self.successes = 0
+        self.failures = 0
+        self.last_error = None
+
+    def record_success(self, seconds: float):
+        self.latency = seconds if self.latency is None else \
+            self.latency + self.alpha * (seconds - self.latency)
+        self.error_rate *= 1 - self.alpha
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+        self.successes += 1
+
+    def record_failure(self, seconds: float, error):
+        # Slow failures (timeouts) count against latency; fast ones say nothing about it
+        if self.latency is None or seconds > self.latency:
+            self.latency = seconds if self.latency is None else \
+                self.latency + self.alpha * (seconds - self.latency)
+        self.error_rate += self.alpha * (1 - self.error_rate)
+        self.consecutive_failures += 1
+        self.failures += 1
+        self.last_error = str(error)
+        if self.consecutive_failures >= self.max_failures:
+            self.down_until = time.monotonic() + self.cooldown
+
+    def available(self, now: float = None) -> bool:
+        return (now if now is not None else time.monotonic()) >= self.down_until
+
+    def score(self) -> float:
+        """Lower is better; untried providers score 0 so they get probed once"""
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1 + 4 * self.error_rate)
+
+    def to_dict(self) -> dict:
+        return {
+            'latency_ms': None if self.latency is None else self.latency * 1000,
+            'error_rate': self.error_rate,
+            'successes': self.successes,
+            'failures': self.failures,
+            'available': self.available(),
+            'last_error': self.last_error,
+        }
+
+
+class RateProvider:
+    """Base class: subclasses implement fetch(base) -> payload dict"""
+
+    kind = None
+
+    def __init__(self, name: str):
+        self.name = name
+        self.health = ProviderHealth()
+
+    def fetch(self, base: str) -> dict:
+        raise NotImplementedError
+
+    def timed_fetch(self, base: str) -> dict:
+        """fetch() with validation, recording latency and errors in self.health"""
+        start = time.perf_counter()
+        try:
+            data = self.fetch(base)
+            if "rates" not in data:
+                raise ValueError("Invalid response: 'rates' key missing")
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            self.health.record_failure(elapsed, e)
+            FETCHES.labels(self.name, "error").inc()
+            FETCH_SECONDS.labels(self.name).observe(elapsed)
+            raise
+        elapsed = time.perf_counter() - start
+        self.health.record_success(elapsed)
+        FETCHES.labels(self.name, "ok").inc()
+        FETCH_SECONDS.labels(self.name).observe(elapsed)
+        return data
+
+    def close(self):
+        pass
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class HttpJsonProvider(RateProvider):
+    """GET <api_url><BASE> returning exchangerate-api style JSON"""
+
+    kind = "http"
+
+    def __init__(self, name: str, api_url: str, timeout: float = 10, pool_size: int = 4):
+        super().__init__(name)
+        self.api_url = api_url
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._session = None
+
+    @property
+    def session(self):
+        """Pooled session, created on the first fetch so startup never imports requests"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            # One pooled session per provider: connections are kept alive between fetches
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def fetch(self, base: str) -> dict:
+        response = self.session.get(f"{self.api_url}{base}", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+class FileDropProvider(RateProvider):
+    """Reads <directory>/<BASE>.json files dropped by another process"""
+
+    kind = "file"
+
+    def __init__(self, name: str, directory: str, max_age: float = None):
+        super().__init__(name)
+        self.directory = directory
+        self.max_age = max_age
+
+    def fetch(self, base: str) -> dict:
+        path = os.path.join(self.directory, f"{base}.json")
+        if self.max_age is not None and time.time() - os.path.getmtime(path) > self.max_age:
+            raise ValueError(f"{path} is older than {self.max_age:g} s")
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("base", base) != base:
+            raise ValueError(f"{path} holds {data['base']} rates, not {base}")
+        return data
+
+
+class FixtureProvider(RateProvider):
+    """Fixed rates held in memory, with optional simulated latency"""
+
+    kind = "fixture"
+
+    def __init__(self, name: str, rates: dict, base: str = "USD", latency: float = 0.0):
+        super().__init__(name)
+        self.rates = dict(rates)
+        self.rates.setdefault(base, 1.0)
+        self.latency = latency
+
+    @classmethod
+    def from_file(cls, name: str, path: str, latency: float = 0.0):
+        with open(path) as f:
+            payload = json.load(f)
+        return cls(name, payload["rates"], payload.get("base", "USD"), latency)
+
+    def fetch(self, base: str) -> dict:
+        if self.latency:
+            time.sleep(self.latency)
+        pivot = self.rates.get(base)
+        if not pivot:
+            raise ValueError(f"Fixture has no rate for {base}")
+        rates = {code: value / pivot for code, value in self.rates.items()}
+        return {"base": base, "date": date.today().isoformat(), "rates": rates}
+
+
+def provider_from_config(entry: dict) -> RateProvider:
+    """Build a provider from {"type": "http"|"file"|"fixture", "name": ..., ...}"""
+    kind = entry.get("type")
+    name = entry.get("name", kind)
+    if kind == "http":
+        return HttpJsonProvider(name, entry["url"], entry.get("timeout", 10))
+    if kind == "file":
+        return FileDropProvider(name, entry["directory"], entry.get("max_age"))
+    if kind == "fixture":
+        return FixtureProvider.from_file(name, entry["path"], entry.get("latency", 0.0))
+    raise ValueError(f"Unknown provider type: {kind}")
+
+
+def load_provider_config(path: str):
+    """Providers listed in a JSON config file, or None if the file does not exist"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path) as f:
+        config = json.load(f)
+    entries = config.get("providers", []) if isinstance(config, dict) else config
+    return [provider_from_config(entry) for entry in entries]
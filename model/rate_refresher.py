@@ -0,0 +1,87 @@
+# ============================================================================
+# model/rate_refresher.py
+# ============================================================================
+
+"""
+Rate Refresher - Loads rates off the UI thread and keeps them fresh on a schedule
+"""
+
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+
+class RateRefresher:
+    """Background thread: cache first, then network, then periodic refreshes.
+
+    A failed refresh is retried after `retry` seconds, doubling up to `interval`.
+    """
+
+    def __init__(self, model, interval: float = 300, base: str = None, retry: float = 5.0):
+        self.model = model
+        self.interval = interval
+        self.base = base
+        self.retry = retry
+
+        # Set once the first load attempt finished (successfully or not)
+        self.ready = threading.Event()
+        self.last_ok = False
+        self._listeners = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_listener(self, callback):
+        """Register callback(ok: bool), called from the refresher thread"""
+        self._listeners.append(callback)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name="rate-refresher")
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh_now(self):
+        """Run one refresh immediately (blocking, call from a worker thread)"""
+        return self._refresh()
+
+    def _refresh(self) -> bool:
+        """One refresh; errors the model does not handle count as a failed attempt"""
+        try:
+            ok = self.model.refresh_rates(self.base)
+        except Exception:
+            log.exception("Rate refresh failed")
+            ok = False
+        # Also sets `ready`, so waiters learn about a failed first attempt too
+        self._notify(ok)
+        return ok
+
+    def _run(self):
+        # Cached rates make the app usable before the network answers
+        try:
+            if self.model.snapshot is None and self.model.load_rates_from_cache():
+                self._notify(True)
+        except Exception:
+            log.exception("Could not load cached rates")
+
+        delay = self.retry
+        while not self._stop.is_set():
+            if self._refresh():
+                wait, delay = self.interval, self.retry
+            else:
+                wait, delay = min(delay, self.interval), min(delay * 2, self.interval)
+                log.info("Retrying rate refresh in %.0f s", wait)
+            if self._stop.wait(wait):
+                break
+
+    def _notify(self, ok: bool):
+        self.last_ok = ok
+        self.ready.set()
+        for callback in list(self._listeners):
+            try:
+                callback(ok)
+            except Exception:
+                log.exception("Refresh listener failed")
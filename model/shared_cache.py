@@ -0,0 +1,219 @@
+# ============================================================================
+# model/shared_cache.py
+# ============================================================================
+
+"""
+Shared Cache - Host-wide rate snapshots that every local process refreshes cooperatively
+
+Snapshots live in one directory as `<BASE>.fxrs` files (see snapshot_store),
+replaced atomically so readers never see a partial file. To refresh a base, a
+process takes an exclusive advisory lock on `<BASE>.lock` and re-checks the
+snapshot's age. The lock holder is the only process that downloads, and only
+when the file is older than `max_age`. Processes queued behind it then find a
+fresh file and read it, so upstream sees one request per interval however
+many GUIs, services and batch jobs are running.
+
+Locks are flock(2) on POSIX and msvcrt.locking on Windows. The OS releases
+them when a process dies, so a crashed fetcher cannot block the others. If
+the lock cannot be taken at all (permissions, a full disk), the process
+fetches for itself without publishing.
+
+Snapshots are published world-readable. For several users to share one
+cache, the directory must be writable by all of them (e.g. a group-owned,
+group-writable directory).
+"""
+
+import glob
+import logging
+import os
+import threading
+import time
+
+from model import metrics
+from model.snapshot_store import read_snapshot, write_snapshot
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "FX_CACHE_DIR"
+SNAPSHOT_MODE = 0o644  # readable by every process on the host, whoever published it
+LOCK_MODE = 0o666  # lock files must be openable by every user (the umask still applies)
+
+SHARED_REFRESHES = metrics.counter("fx_shared_cache_total",
+                                   "Shared cache refreshes by outcome", ("result",))
+SHARED_FETCHED = SHARED_REFRESHES.labels("fetched")
+SHARED_HIT = SHARED_REFRESHES.labels("shared")
+SHARED_TIMEOUT = SHARED_REFRESHES.labels("lock_timeout")
+SHARED_LOCK_ERROR = SHARED_REFRESHES.labels("lock_error")
+LOCK_WAIT = metrics.histogram("fx_shared_cache_lock_wait_seconds", "Time spent waiting for a fetch lock")
+
+
+class FileLock:
+    """Exclusive advisory lock on a file, across processes and across threads of one process"""
+
+    def __init__(self, path: str, poll: float = 0.05):
+        self.path = path
+        self.poll = poll
+        self._fd = None
+        # Threads of one process queue here; the file lock only arbitrates between processes
+        self._local = threading.Lock()
+
+    @staticmethod
+    def _try_lock(fd) -> bool:
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def _open(self):
+        try:
+            return os.open(self.path, os.O_RDWR | os.O_CREAT, LOCK_MODE)
+        except PermissionError:
+            # Created by another user without write access for us; flock only needs a read fd
+            if os.name == "nt":
+                raise
+            return os.open(self.path, os.O_RDONLY)
+
+    def acquire(self, timeout: float = None) -> bool:
+        """Block until the lock is held; False if `timeout` seconds pass first.
+
+        Raises OSError if the lock file cannot be opened.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._local.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        try:
+            fd = self._open()
+        except OSError:
+            self._local.release()
+            raise
+        while not self._try_lock(fd):
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                self._local.release()
+                return False
+            time.sleep(self.poll)
+        self._fd = fd
+        return True
+
+    def release(self):
+        fd, self._fd = self._fd, None
+        try:
+            if os.name == "nt":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+            self._local.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class SharedRateCache:
+    """Directory of per-base snapshots with one fetcher per base and interval"""
+
+    def __init__(self, directory: str, max_age: float = 300, lock_timeout: float = 30):
+        self.directory = directory
+        self.max_age = max_age
+        self.lock_timeout = lock_timeout
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, base: str) -> str:
+        return os.path.join(self.directory, f"{base}.fxrs")
+
+    def lock(self, base: str) -> FileLock:
+        with self._locks_guard:
+            lock = self._locks.get(base)
+            if lock is None:
+                lock = self._locks[base] = FileLock(os.path.join(self.directory, f"{base}.lock"))
+            return lock
+
+    def read(self, base: str):
+        """(rates, fetched_at unix seconds) of the shared snapshot for `base`, or None"""
+        try:
+            view = read_snapshot(self.path(base))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring unreadable shared snapshot for %s: %s", base, e)
+            return None
+        return view.to_dict(), view.timestamp
+
+    def fresh(self, base: str):
+        """Like read(), but None once the snapshot is older than max_age"""
+        entry = self.read(base)
+        if entry is not None and time.time() - entry[1] < self.max_age:
+            return entry
+        return None
+
+    def get_or_fetch(self, base: str, fetch):
+        """(rates, fetched_at) for `base`, calling fetch(base) only if no process fetched it recently"""
+        entry = self.fresh(base)
+        if entry is not None:
+            SHARED_HIT.inc()
+            return entry
+
+        lock = self.lock(base)
+        start = time.perf_counter()
+        try:
+            locked = lock.acquire(self.lock_timeout)
+        except OSError as e:
+            SHARED_LOCK_ERROR.inc()
+            log.warning("Cannot lock the shared %s snapshot (%s); fetching directly", base, e)
+            return fetch(base), time.time()
+        LOCK_WAIT.observe(time.perf_counter() - start)
+        if not locked:
+            # Whoever holds the lock looks stuck; fetch without publishing
+            SHARED_TIMEOUT.inc()
+            log.warning("Timed out waiting for the %s fetch lock; fetching directly", base)
+            return fetch(base), time.time()
+
+        try:
+            # Another process may have published while this one waited for the lock
+            entry = self.fresh(base)
+            if entry is not None:
+                SHARED_HIT.inc()
+                return entry
+            rates = fetch(base)
+            fetched_at = time.time()
+            try:
+                write_snapshot(self.path(base), rates, base, fetched_at, SNAPSHOT_MODE)
+            except OSError as e:
+                log.warning("Could not publish %s to the shared cache: %s", base, e)
+            SHARED_FETCHED.inc()
+            return rates, fetched_at
+        finally:
+            lock.release()
+
+    def latest(self):
+        """(rates, base, fetched_at) of the newest shared snapshot, or None if there is none"""
+        newest = None
+        for path in glob.glob(os.path.join(self.directory, "*.fxrs")):
+            base = os.path.basename(path)[:-len(".fxrs")]
+            entry = self.read(base)
+            if entry is not None and (newest is None or entry[1] > newest[2]):
+                newest = (entry[0], base, entry[1])
+        return newest
+
+
+def open_shared_cache(directory: str = None, max_age: float = 300):
+    """SharedRateCache in `directory` (default $FX_CACHE_DIR), or None when neither is set"""
+    directory = directory or os.environ.get(CACHE_DIR_ENV)
+    return SharedRateCache(directory, max_age) if directory else None
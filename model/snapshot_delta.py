@@ -0,0 +1,185 @@
+# ============================================================================
+# model/snapshot_delta.py
+# ============================================================================
+
+"""
+Snapshot Delta - Change detection between rate snapshots and a delta journal on disk
+
+Each snapshot has a content hash over its base, codes and rates, so an
+unchanged refresh is spotted without comparing rates. Otherwise a delta lists
+the codes whose rate moved. Only codes appear in a delta, so a pair (a, b) is
+affected exactly when a or b changed; all rates share one base.
+
+The journal keeps the binary snapshot file as a checkpoint and appends one
+JSON line per delta next to it (`<cache file>.log`). A full checkpoint is
+rewritten every `checkpoint_every` deltas or when the base changes. Unchanged
+refreshes write nothing, so the stored timestamp is that of the last change.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from model import metrics
+from model.snapshot_store import read_snapshot, write_snapshot
+
+log = logging.getLogger(__name__)
+
+JOURNAL_WRITES = metrics.counter("fx_cache_writes_total",
+                                 "Disk cache saves by kind (checkpoint, delta, unchanged)", ("kind",))
+WRITE_CHECKPOINT = JOURNAL_WRITES.labels("checkpoint")
+WRITE_DELTA = JOURNAL_WRITES.labels("delta")
+WRITE_UNCHANGED = JOURNAL_WRITES.labels("unchanged")
+
+
+def content_hash(rates: dict, base: str) -> str:
+    """Digest of base + sorted codes + float64 rates; equal iff the snapshots are identical"""
+    codes = sorted(rates)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(base.encode('ascii'))
+    digest.update(b"\0" + " ".join(codes).encode('ascii'))
+    digest.update(np.array([rates[code] for code in codes], dtype="<f8").tobytes())
+    return digest.hexdigest()
+
+
+class SnapshotDelta:
+    """What changed from one snapshot to the next.
+
+    `changed` maps added or moved codes to their new rate. A `full` delta
+    (no previous snapshot, or a different base) affects every pair.
+    """
+
+    __slots__ = ('base', 'previous', 'digest', 'changed', 'removed', 'full')
+
+    def __init__(self, base, previous, digest, changed=None, removed=(), full=False):
+        self.base = base
+        self.previous = previous
+        self.digest = digest
+        self.changed = changed or {}
+        self.removed = tuple(removed)
+        self.full = full
+
+    @property
+    def unchanged(self) -> bool:
+        return not self.full and self.previous == self.digest
+
+    @property
+    def codes(self) -> set:
+        return set(self.changed) | set(self.removed)
+
+    def affects(self, from_curr, to_curr) -> bool:
+        return self.full or from_curr in self.changed or to_curr in self.changed \
+            or from_curr in self.removed or to_curr in self.removed
+
+    def __len__(self):
+        return len(self.changed) + len(self.removed)
+
+    def to_dict(self, timestamp: float) -> dict:
+        return {"ts": timestamp, "prev": self.previous, "hash": self.digest,
+                "set": self.changed, "del": list(self.removed)}
+
+
+def diff_rates(old: dict, new: dict, base: str, previous: str, digest: str) -> SnapshotDelta:
+    """Delta between two rate dicts quoted in the same base"""
+    if previous == digest:
+        return SnapshotDelta(base, previous, digest)
+    changed = {code: rate for code, rate in new.items() if old.get(code) != rate}
+    removed = [code for code in old if code not in new]
+    return SnapshotDelta(base, previous, digest, changed, removed)
+
+
+def diff(old, new) -> SnapshotDelta:
+    """Delta between two RateSnapshots (`old` may be None)"""
+    if old is None or old.base != new.base:
+        return SnapshotDelta(new.base, old.digest if old else None, new.digest,
+                             dict(new.rates), full=True)
+    return diff_rates(old.rates, new.rates, new.base, old.digest, new.digest)
+
+
+def apply_delta(rates: dict, entry: dict) -> dict:
+    rates = dict(rates)
+    rates.update(entry["set"])
+    for code in entry["del"]:
+        rates.pop(code, None)
+    return rates
+
+
+class SnapshotJournal:
+    """Binary checkpoint plus an append-only log of deltas"""
+
+    def __init__(self, path: str, checkpoint_every: int = 50):
+        self.path = path
+        self.log_path = path + ".log"
+        self.checkpoint_every = checkpoint_every
+        # Last state on disk, as (base, rates, digest); None until loaded or written
+        self._state = None
+        self._deltas = 0
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def record(self, rates: dict, base: str, timestamp: float, digest: str = None) -> str:
+        """Persist a snapshot; returns "unchanged", "delta" or "checkpoint" """
+        digest = digest or content_hash(rates, base)
+        state = self._state
+        if state is not None and state[0] == base and state[2] == digest:
+            WRITE_UNCHANGED.inc()
+            return "unchanged"
+
+        if state is None or state[0] != base or self._deltas >= self.checkpoint_every:
+            self.checkpoint(rates, base, timestamp, digest)
+            return "checkpoint"
+
+        delta = diff_rates(state[1], rates, base, state[2], digest)
+        # No fsync: a lost tail only loses the newest deltas, and replay stops there
+        with open(self.log_path, 'a', encoding='ascii') as f:
+            f.write(json.dumps(delta.to_dict(timestamp), separators=(",", ":")) + "\n")
+        self._state = (base, dict(rates), digest)
+        self._deltas += 1
+        WRITE_DELTA.inc()
+        return "delta"
+
+    def checkpoint(self, rates: dict, base: str, timestamp: float, digest: str = None):
+        """Write the full snapshot, then start an empty log"""
+        write_snapshot(self.path, rates, base, timestamp)
+        # A crash between these two leaves a log whose first `prev` no longer
+        # matches the checkpoint, so replay ignores it
+        with open(self.log_path, 'w'):
+            pass
+        self._state = (base, dict(rates), digest or content_hash(rates, base))
+        self._deltas = 0
+        WRITE_CHECKPOINT.inc()
+
+    def load(self):
+        """(rates, base, timestamp) from the checkpoint with the log replayed"""
+        view = read_snapshot(self.path)
+        rates, base, timestamp = view.to_dict(), view.base, view.timestamp
+        digest = content_hash(rates, base)
+        deltas, clean = 0, True
+        if os.path.exists(self.log_path):
+            with open(self.log_path, encoding='ascii') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        log.warning("Ignoring truncated entry in %s", self.log_path)
+                        clean = False
+                        break
+                    if entry.get("prev") != digest:
+                        log.warning("Delta log %s does not match its checkpoint", self.log_path)
+                        clean = False
+                        break
+                    replayed = apply_delta(rates, entry)
+                    if content_hash(replayed, base) != entry["hash"]:
+                        log.warning("Corrupt entry in %s", self.log_path)
+                        clean = False
+                        break
+                    rates, digest, timestamp = replayed, entry["hash"], entry["ts"]
+                    deltas += 1
+        # Entries past a bad one would be unreachable, so the next save checkpoints
+        self._state = (base, dict(rates), digest) if clean else None
+        self._deltas = deltas
+        return rates, base, timestamp
@@ -0,0 +1,128 @@
+# ============================================================================
+# model/snapshot_store.py
+# ============================================================================
+
+"""
+Snapshot Store - Versioned binary rate snapshots, written atomically, read via mmap
+
+Layout (little-endian):
+    header   32 bytes  magic "FXRS", version u16, code width u16, count u32,
+                       timestamp f64 (unix seconds), base code (8 bytes), padding
+    codes    count * CODE_WIDTH bytes, sorted, NUL padded ASCII
+    rates    count * f64, rates[i] is units of codes[i] per one unit of base
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+MAGIC = b"FXRS"
+VERSION = 1
+CODE_WIDTH = 8
+HEADER = struct.Struct("<4sHHId8s4x")
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class SnapshotView:
+    """Read-only, zero-copy view over a memory-mapped snapshot file"""
+
+    def __init__(self, buffer, base: str, timestamp: float, codes, rates):
+        self._buffer = buffer  # keeps the mapping alive for the arrays below
+        self.base = base
+        self.timestamp = timestamp
+        self.codes = codes
+        self.rates = rates
+
+    def __len__(self):
+        return len(self.rates)
+
+    @property
+    def last_updated(self) -> str:
+        return datetime.fromtimestamp(self.timestamp).strftime(TIME_FORMAT)
+
+    def code_list(self) -> list:
+        return [code.decode('ascii') for code in self.codes.tolist()]
+
+    def to_dict(self) -> dict:
+        return dict(zip(self.code_list(), self.rates.tolist()))
+
+
+def timestamp_from_string(last_updated) -> float:
+    """Convert the model's last_updated string into unix seconds"""
+    if not last_updated:
+        return 0.0
+    return datetime.strptime(last_updated, TIME_FORMAT).timestamp()
+
+
+def pack_snapshot(rates: dict, base: str, timestamp: float) -> bytes:
+    codes = sorted(rates)
+    header = HEADER.pack(MAGIC, VERSION, CODE_WIDTH, len(codes), timestamp,
+                         base.encode('ascii'))
+    code_block = np.array([code.encode('ascii') for code in codes], dtype=f"S{CODE_WIDTH}")
+    rate_block = np.array([rates[code] for code in codes], dtype="<f8")
+    return header + code_block.tobytes() + rate_block.tobytes()
+
+
+def atomic_write(path, data: bytes, mode: int = None):
+    """Write to a temp file in the same directory, then rename over `path`.
+
+    The file is private (0600, from mkstemp) unless `mode` is given.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".fxrs-", suffix=".tmp")
+    try:
+        if mode is not None and hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_snapshot(path, rates: dict, base: str, timestamp: float, mode: int = None):
+    atomic_write(path, pack_snapshot(rates, base, timestamp), mode)
+
+
+def parse_snapshot(buffer) -> SnapshotView:
+    """Interpret a bytes-like buffer as a snapshot without copying the arrays"""
+    if len(buffer) < HEADER.size:
+        raise ValueError("Snapshot truncated: missing header")
+    magic, version, width, count, timestamp, base = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a rate snapshot file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+
+    rates_offset = HEADER.size + count * width
+    if len(buffer) < rates_offset + count * 8:
+        raise ValueError("Snapshot truncated: missing rates")
+
+    codes = np.frombuffer(buffer, dtype=f"S{width}", count=count, offset=HEADER.size)
+    rates = np.frombuffer(buffer, dtype="<f8", count=count, offset=rates_offset)
+    return SnapshotView(buffer, base.rstrip(b"\0").decode('ascii'), timestamp, codes, rates)
+
+
+def read_snapshot(path) -> SnapshotView:
+    """Memory-map a snapshot file; pages are shared between processes by the OS"""
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return parse_snapshot(buffer)
+
+
+def import_json_cache(json_path, snapshot_path) -> SnapshotView:
+    """Convert a legacy currency_rates_cache.json into a binary snapshot"""
+    with open(json_path, 'r') as f:
+        cache_data = json.load(f)
+    write_snapshot(snapshot_path, cache_data['rates'], cache_data['base_currency'],
+                   timestamp_from_string(cache_data.get('last_updated')))
+    return read_snapshot(snapshot_path)
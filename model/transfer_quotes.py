@@ -0,0 +1,149 @@
+# ============================================================================
+# model/transfer_quotes.py
+# ============================================================================
+
+"""
+Transfer Quotes - Payout quotes for many recipients in one pass over a rate snapshot
+
+Recipients come as delimited lines, `[recipient,] amount, from, to`, pasted or
+loaded from a file. Quotes are kept as columns (payouts in integer minor units)
+and only formatted row by row when the table or an export asks for them.
+"""
+
+import csv
+
+import numpy as np
+
+from model.bulk_converter import parse_amount
+from model.fixed_point import format_minor
+
+COLUMNS = ("Recipient", "Amount", "From", "To", "Rate", "Payout", "Status")
+
+
+class RecipientList:
+    """Parsed recipient lines as columns; `errors` holds (line number, message)"""
+
+    def __init__(self, names, amounts, from_codes, to_codes, errors=()):
+        self.names = names
+        self.amounts = np.asarray(amounts, dtype=np.float64)
+        self.from_codes = np.asarray(from_codes, dtype=str)
+        self.to_codes = np.asarray(to_codes, dtype=str)
+        self.errors = list(errors)
+
+    def __len__(self):
+        return len(self.names)
+
+
+def sniff_delimiter(line: str) -> str:
+    for delimiter in ("\t", ";", ","):
+        if delimiter in line:
+            return delimiter
+    return ","
+
+
+def parse_recipients(lines) -> RecipientList:
+    """Parse `[recipient,] amount, from, to` lines; a header line is skipped"""
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return RecipientList([], [], [], [])
+
+    names, amounts, from_codes, to_codes, errors = [], [], [], [], []
+    reader = csv.reader(lines, delimiter=sniff_delimiter(lines[0]), skipinitialspace=True)
+    for number, fields in enumerate(reader, 1):
+        fields = [field.strip() for field in fields]
+        if len(fields) == 3:
+            fields.insert(0, f"#{number}")
+        if len(fields) != 4:
+            errors.append((number, "expected [recipient,] amount, from, to"))
+            continue
+        amount = parse_amount(fields[1])
+        if number == 1 and amount != amount:  # NaN on the first line: a header
+            continue
+        names.append(fields[0])
+        amounts.append(amount)
+        from_codes.append(fields[2].upper())
+        to_codes.append(fields[3].upper())
+    return RecipientList(names, amounts, from_codes, to_codes, errors)
+
+
+def load_recipients(path) -> RecipientList:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return parse_recipients(f.read().splitlines())
+
+
+class TransferQuotes:
+    """Quotes for a RecipientList against one snapshot; rows are formatted on demand"""
+
+    def __init__(self, recipients, rates, payouts, digits, source_digits, ok, last_updated=None):
+        self.recipients = recipients
+        self.rates = rates
+        self.payouts = payouts  # int64, in each target currency's minor units
+        self.digits = digits
+        self.source_digits = source_digits
+        self.ok = ok
+        self.last_updated = last_updated
+
+    def __len__(self):
+        return len(self.recipients)
+
+    @property
+    def failed(self) -> int:
+        return int((~self.ok).sum())
+
+    def row(self, i: int) -> tuple:
+        """One quote as display/export strings"""
+        r = self.recipients
+        amount = float(r.amounts[i])
+        amount_text = f"{amount:.{self.source_digits[i]}f}" if np.isfinite(amount) else ""
+        from_code, to_code = str(r.from_codes[i]), str(r.to_codes[i])
+        if not self.ok[i]:
+            status = "bad amount" if not np.isfinite(amount) or amount < 0 else "unknown currency"
+            return (r.names[i], amount_text, from_code, to_code, "", "", status)
+        return (r.names[i], amount_text, from_code, to_code, f"{self.rates[i]:.9g}",
+                format_minor(int(self.payouts[i]), int(self.digits[i])), "ok")
+
+    def rows(self, start: int, stop: int) -> list:
+        return [self.row(i) for i in range(start, min(stop, len(self)))]
+
+    def totals(self) -> dict:
+        """{target code: total payout as text} over the rows that quoted"""
+        codes, inverse = np.unique(self.recipients.to_codes[self.ok], return_inverse=True)
+        sums = np.zeros(len(codes), dtype=np.int64)
+        np.add.at(sums, inverse, self.payouts[self.ok])
+        digits = dict(zip(self.recipients.to_codes[self.ok].tolist(), self.digits[self.ok].tolist()))
+        return {code: format_minor(int(total), digits[code])
+                for code, total in zip(codes.tolist(), sums.tolist())}
+
+    def write_csv(self, f):
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow([column.lower() for column in COLUMNS])
+        for start in range(0, len(self), 10000):
+            writer.writerows(self.rows(start, start + 10000))
+
+
+def quote_transfers(matrix, recipients: RecipientList, exact: bool = False,
+                    rounding: str = "half_even", last_updated=None) -> TransferQuotes:
+    """Quote every recipient in one vectorized pass over `matrix`"""
+    amounts = recipients.amounts
+    src = matrix.indices(recipients.from_codes)
+    dst = matrix.indices(recipients.to_codes)
+    valid = np.isfinite(amounts) & (amounts >= 0) & (src >= 0) & (dst >= 0)
+    src, dst = np.where(valid, src, 0), np.where(valid, dst, 0)
+
+    rates = matrix.cross[src, dst]
+    digits = np.where(valid, matrix.exponents[dst], 2)
+    source_digits = np.where(valid, matrix.exponents[src], 2)
+    if exact:
+        table = matrix.fixed
+        minor, ok = table.to_minor(amounts, recipients.from_codes)
+        payouts, converted = table.convert_minor(minor, recipients.from_codes,
+                                                 recipients.to_codes, rounding)
+        valid &= ok & converted
+    else:
+        with np.errstate(invalid='ignore', over='ignore'):
+            scaled = np.rint(np.where(valid, amounts * rates, 0) * 10.0 ** digits)
+        valid &= np.isfinite(scaled) & (np.abs(scaled) < 9e18)
+        payouts = np.where(valid, scaled, 0).astype(np.int64)
+
+    return TransferQuotes(recipients, rates, np.where(valid, payouts, 0), digits, source_digits,
+                          valid, last_updated)
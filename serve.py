@@ -0,0 +1,68 @@
+"""
+Conversion Service - Headless HTTP API backed by one shared CurrencyModel
+
+Usage: python serve.py [--host 127.0.0.1] [--port 8080] [--refresh 300] [--providers providers.json]
+                       [--cache-dir DIR] [--history-db conversion_history.db] [--startup-timeout 60]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from controller.http_service import RateService
+from model import metrics
+from model.conversion_log import ConversionLog
+from model.currency_model import CurrencyModel
+from model.rate_providers import load_provider_config
+from model.rate_refresher import RateRefresher
+from model.shared_cache import open_shared_cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve currency conversions over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--refresh", type=float, default=300, help="Seconds between rate refreshes")
+    parser.add_argument("--providers", default="providers.json",
+                        help="Rate provider config (default: the public API)")
+    parser.add_argument("--reconcile", action="store_true",
+                        help="Query every provider and serve their consensus rates")
+    parser.add_argument("--tolerance-bps", type=float, default=50.0,
+                        help="Flag provider quotes further than this from the consensus")
+    parser.add_argument("--cache-dir",
+                        help="Host-wide rate cache shared with other instances (default: $FX_CACHE_DIR)")
+    parser.add_argument("--history-db", default="conversion_history.db",
+                        help="SQLite conversion log ('' to disable)")
+    parser.add_argument("--startup-timeout", type=float, default=60,
+                        help="Seconds to wait for the first rates before giving up")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(name)s: %(message)s")
+
+    conversion_log = ConversionLog(args.history_db).start() if args.history_db else None
+    model = CurrencyModel(providers=load_provider_config(args.providers),
+                          reconcile=args.reconcile, tolerance_bps=args.tolerance_bps,
+                          shared_cache=open_shared_cache(args.cache_dir, max_age=args.refresh),
+                          conversion_log=conversion_log)
+    refresher = RateRefresher(model, interval=args.refresh).start()
+    if not refresher.ready.wait(args.startup_timeout) or model.snapshot is None:
+        refresher.stop()
+        if conversion_log is not None:
+            conversion_log.close()
+        sys.exit(f"Could not load currency rates within {args.startup_timeout:g} s "
+                 "(no cache and no provider answered); check --providers and the network.")
+
+    service = RateService(model, args.host, args.port)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        refresher.stop()
+        if conversion_log is not None:
+            conversion_log.close()
+        metrics.export_from_env()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
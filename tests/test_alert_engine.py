@@ -0,0 +1,25 @@
+"""AlertEngine: rule persistence and bulk removal"""
+
+from model import alert_engine
+from model.alert_engine import AlertEngine
+
+
+def test_remove_rules_saves_once(tmp_path, monkeypatch):
+    engine = AlertEngine(path=str(tmp_path / "alerts.json"))
+    for value in range(1, 6):
+        engine.add_rule("USD", "EUR", "above", value, save=False)
+    engine.save()
+
+    writes = []
+    real_write = alert_engine.atomic_write
+    monkeypatch.setattr(alert_engine, "atomic_write",
+                        lambda path, data: writes.append(path) or real_write(path, data))
+    assert engine.remove_rules([1, 3, 99]) == [1, 3]
+    assert len(writes) == 1
+    assert sorted(AlertEngine(path=engine.path).rules) == [2, 4, 5]
+
+
+def test_remove_rules_without_matches_does_not_save(tmp_path):
+    engine = AlertEngine(path=str(tmp_path / "alerts.json"))
+    assert engine.remove_rules([7]) == []
+    assert not (tmp_path / "alerts.json").exists()
@@ -0,0 +1,75 @@
+"""Bulk CSV/JSONL conversion: results, and malformed rows fail without stopping the stream"""
+
+import io
+import json
+
+import pytest
+
+from benchmarks.fixture_data import load_fixture_model
+from model.bulk_converter import ConversionSpec, convert_csv, convert_jsonl
+from model.conversion_log import ConversionLog
+from model.parallel_converter import convert_file_parallel
+
+
+@pytest.fixture(scope="module")
+def model():
+    return load_fixture_model()
+
+
+def test_csv_rows_are_converted(model):
+    src = io.StringIO("id,amount,from,to\n1,100,USD,EUR\n2,\"1,000.50\",gbp,jpy\n")
+    dst = io.StringIO()
+    stats = convert_csv(model, src, dst, ConversionSpec())
+    lines = dst.getvalue().splitlines()
+    assert lines[0] == "id,amount,from,to,converted"
+    assert lines[1] == f"1,100,USD,EUR,{model.convert_many([100.0], ['USD'], ['EUR'])[0]:.2f}"
+    assert lines[2].endswith(f",{model.convert_many([1000.5], ['GBP'], ['JPY'])[0]:.0f}")
+    assert (stats.rows, stats.failed) == (2, 0)
+
+
+def test_blank_and_short_csv_rows_fail_and_streaming_continues(model):
+    src = io.StringIO("id,amount,from,to\n1,100,USD,EUR\n\n3,50\n4,10,USD,EUR\n")
+    dst = io.StringIO()
+    stats = convert_csv(model, src, dst, ConversionSpec(), chunk_size=2)
+    lines = dst.getvalue().splitlines()
+    assert len(lines) == 5
+    assert lines[3] == "3,50,"
+    assert lines[4].startswith("4,10,USD,EUR,") and not lines[4].endswith(",")
+    assert (stats.rows, stats.failed) == (4, 2)
+
+
+def test_jsonl_records_are_converted(model):
+    src = io.StringIO('{"amount": 100, "from": "USD", "to": "EUR"}\n')
+    dst = io.StringIO()
+    stats = convert_jsonl(model, src, dst, ConversionSpec())
+    record = json.loads(dst.getvalue())
+    assert record["converted"] == pytest.approx(model.convert_many([100.0], ["USD"], ["EUR"])[0])
+    assert (stats.rows, stats.failed) == (1, 0)
+
+
+def test_non_object_and_invalid_jsonl_lines_fail_and_streaming_continues(model):
+    src = io.StringIO('[1, 2]\n3\n{"amount": 5, "from": "USD", "to": "EUR"}\n{oops\n'
+                      '{"amount": 7, "from": "USD", "to": "GBP"}\n')
+    dst = io.StringIO()
+    stats = convert_jsonl(model, src, dst, ConversionSpec(), chunk_size=2)
+    records = [json.loads(line) for line in dst.getvalue().splitlines()]
+    assert [record["converted"] is None for record in records] == [True, True, False, True, False]
+    assert records[0]["error"] == "Record is not a JSON object"
+    assert records[3]["error"] == "Invalid JSON"
+    assert (stats.rows, stats.failed) == (5, 3)
+
+
+def test_parallel_conversion_is_logged_by_the_parent(tmp_path):
+    model = load_fixture_model()
+    model.conversion_log = ConversionLog(str(tmp_path / "history.db")).start()
+    src = tmp_path / "in.csv"
+    src.write_text("id,amount,from,to\n" + "".join(
+        f"{i},{i + 1},USD,{'EUR' if i % 2 else 'XXX'}\n" for i in range(40)))
+    try:
+        stats = convert_file_parallel(model, str(src), str(tmp_path / "out.csv"), "csv",
+                                      ConversionSpec(), workers=2, chunk_size=7)
+    finally:
+        model.conversion_log.close()
+    assert (stats.rows, stats.failed) == (40, 20)
+    assert model.conversion_log.total() == 20
+    assert model.conversion_log.top_pairs() == [("USD", "EUR", 20)]
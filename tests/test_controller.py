@@ -0,0 +1,211 @@
+"""CurrencyController on a HeadlessView over fixture rates"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from benchmarks.replay_ui_events import EventReplayer, build_app, check_errors, generate_script
+from model.alert_engine import AlertEngine
+
+
+@pytest.fixture
+def app(tmp_path):
+    controller, view = build_app(str(tmp_path))
+    replayer = EventReplayer(controller, view)
+    replayer.settle()
+    yield controller, view, replayer
+    controller.tasks.shutdown()
+    controller.model.fetcher.close()
+
+
+def test_convert_shows_the_model_quote(app):
+    controller, view, replayer = app
+    view.type_amount("250")
+    view.select_from("USD - US Dollar")
+    view.select_to("EUR - Euro")
+    view.click_convert()
+    replayer.settle()
+    result, rate = controller.model.quote(250.0, "USD", "EUR")
+    assert view.result_text == f"250.00 USD = {result:,.2f} EUR"
+    assert view.rate_text == f"1 USD = {rate:.9g} EUR"
+    assert not view.errors
+
+
+def test_swap_reverses_the_pair(app):
+    controller, view, replayer = app
+    view.select_from("USD - US Dollar")
+    view.select_to("GBP - British Pound")
+    view.click_swap()
+    replayer.settle()
+    assert (view.get_from_currency(), view.get_to_currency()) == ("GBP", "USD")
+    assert view.result_text.endswith(" USD")
+
+
+def test_invalid_amount_raises_an_error_dialog(app):
+    controller, view, replayer = app
+    view.type_amount("abc")
+    view.click_convert()
+    replayer.settle()
+    assert [title for title, _ in view.errors] == ["Invalid Input"]
+    with pytest.raises(RuntimeError, match="Invalid Input"):
+        check_errors(view)
+
+
+def test_send_quotes_every_recipient(app):
+    controller, view, replayer = app
+    panel = view.send_panel
+    panel.text = "alice, 100, USD, EUR\nbob, 20.50, GBP, JPY"
+    panel.click_quote()
+    replayer.settle()
+    assert panel.quotes is not None and len(panel.quotes) == 2
+    assert panel.status == "2 recipients from pasted list"
+    assert not view.errors
+
+
+def test_generated_script_replays_without_errors(app):
+    controller, view, replayer = app
+    script = generate_script(1500, list(controller.model.currency_index.display), seed=3)
+    stats = replayer.replay(script)
+    assert stats["all"]["events"] == 1500
+    assert not view.errors
+    assert controller.tasks.idle()
+
+
+def test_send_quote_reports_a_saturated_executor(app):
+    controller, view, replayer = app
+    panel = view.send_panel
+    controller.tasks.max_pending = 0
+    panel.text = "alice, 100, USD, EUR"
+    panel.click_quote()
+    replayer.settle()
+    assert panel.status == "Too busy to quote pasted list right now; try again"
+    assert panel.quotes is None
+
+
+def test_send_rejection_leaves_a_running_refresh_spinner_alone(app):
+    controller, view, replayer = app
+    view.show_spinner()
+    controller.tasks.max_pending = 0
+    view.send_panel.text = "alice, 100, USD, EUR"
+    view.send_panel.click_quote()
+    assert view.spinner_active
+
+
+def test_chart_reports_a_saturated_executor(app):
+    controller, view, replayer = app
+    view.open_tab("Charts")
+    replayer.settle()
+    controller.tasks.max_pending = 0
+    view.charts_panel.select(range_name="7 days")
+    assert view.charts_panel.status == "Too busy to load the chart right now; try again"
+
+
+def test_chart_extension_reports_a_saturated_executor(app):
+    controller, view, replayer = app
+    view.open_tab("Charts")
+    replayer.settle()
+    panel = view.charts_panel
+    panel.show_series([1.0], [0.9])
+    controller.tasks.max_pending = 0
+    controller.extend_chart()
+    assert panel.status.startswith("Too busy to add new rates now")
+    assert list(panel.timestamps) == [1.0]
+
+
+def test_extend_chart_queries_history_off_the_ui_thread(app, monkeypatch):
+    controller, view, replayer = app
+    view.open_tab("Charts")
+    replayer.settle()
+    panel = view.charts_panel
+    panel.show_series([1.0], [0.9])
+    threads = []
+
+    def get_rate_range(from_curr, to_curr, start=None, end=None):
+        threads.append(threading.current_thread())
+        return np.array([1.0, 2.0]), np.array([0.9, 0.8])
+
+    monkeypatch.setattr(controller.model, "get_rate_range", get_rate_range)
+    controller.extend_chart()
+    replayer.settle()
+    assert threads and threads[0] is not threading.main_thread()
+    assert list(panel.timestamps) == [1.0, 2.0]
+    assert list(panel.rates) == [0.9, 0.8]
+
+
+def test_alert_rows_are_added_and_removed_in_place(app, tmp_path):
+    controller, view, replayer = app
+    controller.alerts.path = str(tmp_path / "alerts.json")
+    panel = view.alerts_panel
+    for value in ("1.5", "2.5", "3.5"):
+        panel.value_text = value
+        panel.click_add()
+    replayer.settle()
+    assert [row[0] for row in panel.rules.values()] == [
+        "USD/EUR above 1.5", "USD/EUR above 2.5", "USD/EUR above 3.5"]
+
+    panel.selected = list(panel.rules)[:2]
+    panel.click_remove()
+    replayer.settle()
+    assert list(panel.rules) == list(controller.alerts.rules)
+    assert view.status == "Removed 2 alert(s)"
+    # The rule file was written by the executor and matches the panel
+    assert list(AlertEngine(path=controller.alerts.path).rules) == list(panel.rules)
+
+
+def test_failed_manual_refresh_clears_the_spinner(app, monkeypatch):
+    controller, view, replayer = app
+
+    def broken():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(controller.model, "refresh_rates", broken)
+    view.press_refresh()
+    assert view.spinner_active
+    replayer.settle()
+    assert not view.spinner_active
+    assert view.status.startswith("⚠️ Refresh failed")
+
+
+class RecordingLog:
+    def __init__(self):
+        self.rows = []
+
+    def record(self, amount, from_curr, to_curr, result, rate=None, source="gui"):
+        self.rows.append((amount, from_curr, to_curr, source))
+
+
+def test_live_results_are_logged_once_they_settle(app):
+    controller, view, replayer = app
+    controller.model.conversion_log = log = RecordingLog()
+    controller.live_record_delay = 0.05
+    view.select_from("USD - US Dollar")
+    view.select_to("EUR - Euro")
+    for text in ("1", "12", "125"):
+        view.type_amount(text)
+        replayer.settle()
+    assert log.rows == []
+
+    time.sleep(0.06)
+    replayer.settle()
+    assert log.rows == [(125.0, "USD", "EUR", "live")]
+
+    # Pressing Convert on the settled result logs it once, as a GUI conversion
+    view.type_amount("300")
+    replayer.settle()
+    view.click_convert()
+    time.sleep(0.06)
+    replayer.settle()
+    assert log.rows[1:] == [(300.0, "USD", "EUR", "gui")]
+
+
+def test_startup_and_refresh_results_are_not_logged(app):
+    controller, view, replayer = app
+    controller.model.conversion_log = log = RecordingLog()
+    controller.live_record_delay = 0.0
+    controller.on_input_changed()  # what apply_rates does after a refresh
+    replayer.settle()
+    time.sleep(0.01)
+    replayer.settle()
+    assert log.rows == []
@@ -0,0 +1,66 @@
+"""ConversionLog: rollups agree with the raw rows, flush commits, a full queue drops"""
+
+import sqlite3
+import threading
+import time
+
+from model.conversion_log import ConversionLog, day_number, day_string
+
+DAY = 86400
+
+
+def rows(path, sql):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+def test_rollups_match_the_conversions_table(tmp_path):
+    log = ConversionLog(str(tmp_path / "history.db"), batch_size=7, linger=0.01).start()
+    now = time.time()
+    pairs = [("USD", "EUR"), ("EUR", "GBP"), ("USD", "EUR"), ("JPY", "USD")]
+    for i in range(200):
+        from_curr, to_curr = pairs[i % len(pairs)]
+        log.record(i + 1, from_curr, to_curr, (i + 1) * 0.5, 0.5, ts=now - (i % 3) * DAY)
+    log.record_many([10, 20, 30], "USD", ["EUR", "GBP", "EUR"], [9.0, None, 27.0], ts=now)
+    log.close()
+
+    path = log.path
+    raw_daily = rows(path, "SELECT CAST(ts / 86400 AS INTEGER) AS day, from_curr, to_curr, "
+                           "COUNT(*), SUM(amount), SUM(result) FROM conversions "
+                           "GROUP BY day, from_curr, to_curr ORDER BY day, from_curr, to_curr")
+    daily = rows(path, "SELECT day, from_curr, to_curr, conversions, amount, result "
+                       "FROM daily_totals ORDER BY day, from_curr, to_curr")
+    assert daily == raw_daily
+    raw_pairs = rows(path, "SELECT from_curr, to_curr, COUNT(*) FROM conversions "
+                           "GROUP BY from_curr, to_curr ORDER BY from_curr, to_curr")
+    assert rows(path, "SELECT * FROM pair_totals ORDER BY from_curr, to_curr") == raw_pairs
+
+    # The failed row in the batch was skipped
+    assert log.total() == 202
+    assert log.top_pairs(1) == [("USD", "EUR", 102)]
+    today = day_string(day_number(now))
+    assert (today, "USD", "GBP") not in {row[:3] for row in log.daily_totals(days=1)}
+
+
+def test_flush_waits_for_the_writer(tmp_path):
+    log = ConversionLog(str(tmp_path / "history.db"), linger=0.5).start()
+    log.record(100, "USD", "EUR", 90.0)
+    log.flush()
+    assert log.recent(1)[0][1:5] == ("USD", "EUR", 100.0, 90.0)
+    log.close()
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    log = ConversionLog(str(tmp_path / "history.db"), max_pending=2)
+    # The writer is not started, so nothing drains the queue
+    for _ in range(5):
+        log.record(1, "USD", "EUR", 0.9)
+    assert log._queue.qsize() == 2
+
+    done = threading.Event()
+    threading.Thread(target=lambda: (log.record_many([1], "USD", "EUR", [0.9]), done.set()),
+                     daemon=True).start()
+    assert done.wait(1.0)
+    log.start()
+    log.close()
+    assert log.total() == 2
@@ -0,0 +1,31 @@
+"""Exact conversion: rounding on minor units and out-of-range amounts"""
+
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.fixture_data import load_fixture_model
+
+
+@pytest.fixture(scope="module")
+def table():
+    return load_fixture_model().matrix.fixed
+
+
+def test_exact_result_has_target_minor_units(table):
+    assert table.convert_exact("100", "USD", "JPY").as_tuple().exponent == 0
+    assert table.convert_exact("100", "USD", "KWD").as_tuple().exponent == -3
+
+
+def test_exact_matches_published_rate(table):
+    rate = table.rate("USD", "EUR")
+    assert table.convert_exact("1000", "USD", "EUR") == (rate * 1000).quantize(Decimal("0.01"))
+
+
+@pytest.mark.parametrize("amount", ["1e300", "-1e300", "1e17", "inf", "nan", "abc", float("inf")])
+def test_out_of_range_or_invalid_amounts_give_none(table, amount):
+    assert table.convert_exact(amount, "USD", "EUR") is None
+
+
+def test_largest_amount_still_converts(table):
+    assert table.convert_exact("1e16", "USD", "EUR") is not None
@@ -0,0 +1,86 @@
+"""RateService over a real socket: status codes, strict JSON and the 500 fallback"""
+
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fixture_data import load_fixture_model
+from controller.http_service import RateService
+
+
+@pytest.fixture(scope="module")
+def model():
+    return load_fixture_model()
+
+
+def request(service, method, target, body=b"", length=None):
+    """(status, decoded JSON body) for one request against a freshly started service"""
+    length = len(body) if length is None else length
+    async def exchange():
+        server = await service.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+            writer.write(f"{method} {target} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+                         f"Content-Length: {length}\r\n\r\n".encode() + body)
+            await writer.drain()
+            raw = await reader.read()
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+        head, _, payload = raw.partition(b"\r\n\r\n")
+        return int(head.split(b" ")[1]), json.loads(payload)
+    return asyncio.run(exchange())
+
+
+def test_convert(model):
+    status, body = request(RateService(model, port=0), "GET", "/convert?from=USD&to=EUR&amount=100")
+    assert status == 200
+    assert body["result"] == round(100 * body["rate"], 2)
+
+
+@pytest.mark.parametrize("amount", ["inf", "-inf", "nan"])
+def test_non_finite_amount_is_rejected(model, amount):
+    status, body = request(RateService(model, port=0), "GET",
+                           f"/convert?from=USD&to=EUR&amount={amount}")
+    assert status == 400
+
+
+def test_non_finite_amount_in_batch_is_rejected(model):
+    body = b'[{"amount": Infinity, "from": "USD", "to": "EUR"}]'
+    status, _ = request(RateService(model, port=0), "POST", "/convert", body)
+    assert status == 400
+
+
+def test_huge_exact_amount_is_answered(model):
+    status, body = request(RateService(model, port=0), "GET",
+                           "/convert?from=USD&to=EUR&amount=1e300&exact=1")
+    assert status == 200
+    assert body["result"] is None
+
+
+def test_float_overflow_gives_null_not_infinity(model):
+    status, body = request(RateService(model, port=0), "GET",
+                           "/convert?from=USD&to=JPY&amount=1e308")
+    assert status == 200
+    assert body["result"] is None
+
+
+def test_unexpected_error_is_a_500(model):
+    service = RateService(model, port=0)
+
+    def broken(query):
+        raise RuntimeError("boom")
+
+    service.handle_rate = broken
+    status, body = request(service, "GET", "/rate?from=USD&to=EUR")
+    assert status == 500
+    assert body == {"error": "Internal server error"}
+
+
+@pytest.mark.parametrize("length", ["-5", "ten", "1.5"])
+def test_invalid_content_length_is_a_bad_request(model, length):
+    status, body = request(RateService(model, port=0), "POST", "/convert/batch", length=length)
+    assert status == 400
+    assert body == {"error": "Invalid Content-Length"}
@@ -0,0 +1,104 @@
+"""RateFetcher: coalescing and retries against the stub rates server, provider failover and hedging"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.stub_rates_server import StubRatesServer
+from model.rate_fetcher import RateFetcher
+from model.rate_providers import FixtureProvider, ProviderError, RateProvider
+
+
+@pytest.fixture
+def server():
+    server = StubRatesServer(latency=0.2).start()
+    yield server
+    server.stop()
+
+
+def test_concurrent_fetches_share_one_request(server):
+    fetcher = RateFetcher(server.api_url)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            payloads = list(pool.map(fetcher.fetch, ["USD"] * 8))
+    finally:
+        fetcher.close()
+    assert server.requests_served == 1
+    assert fetcher.coalesced == 7
+    assert all(payload == payloads[0] for payload in payloads)
+    assert payloads[0]["base"] == "USD"
+
+
+def test_server_errors_are_retried(server):
+    server.latency, server.fail_first = 0.0, 1
+    fetcher = RateFetcher(server.api_url, backoff=0.01)
+    try:
+        payload = fetcher.fetch("EUR")
+    finally:
+        fetcher.close()
+    assert payload["base"] == "EUR"
+    assert fetcher.retried == 1
+    assert server.requests_served == 2
+
+
+def test_client_errors_are_not_retried(server):
+    server.latency = 0.0
+    fetcher = RateFetcher(server.api_url, backoff=0.01)
+    try:
+        with pytest.raises(ProviderError):
+            fetcher.fetch("XXX")
+    finally:
+        fetcher.close()
+    assert fetcher.retried == 0
+    assert server.requests_served == 1
+
+
+class BrokenProvider(RateProvider):
+    def fetch(self, base):
+        raise ConnectionError("primary is down")
+
+
+def test_failing_provider_fails_over_to_the_next():
+    primary = BrokenProvider("primary")
+    backup = FixtureProvider("backup", {"EUR": 0.5})
+    fetcher = RateFetcher(providers=[primary, backup], retries=0)
+    try:
+        payload = fetcher.fetch("USD")
+    finally:
+        fetcher.close()
+    assert payload["rates"]["EUR"] == 0.5
+    assert fetcher.failovers == 1
+    assert primary.health.failures == 1
+    assert backup.health.successes == 1
+
+
+def test_slow_provider_is_hedged():
+    primary = FixtureProvider("primary", {"EUR": 0.9}, latency=0.5)
+    backup = FixtureProvider("backup", {"EUR": 0.5})
+    fetcher = RateFetcher(providers=[primary, backup], hedge_after=0.05)
+    try:
+        start = time.perf_counter()
+        payload = fetcher.fetch("USD")
+        elapsed = time.perf_counter() - start
+        # The loser still finishes and records its latency
+        deadline = time.monotonic() + 5
+        while not primary.health.successes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+    finally:
+        fetcher.close()
+    assert payload["rates"]["EUR"] == 0.5
+    assert fetcher.hedged == 1
+    assert elapsed < 0.5
+    assert primary.health.successes == 1
+
+
+def test_all_providers_failing_raises():
+    fetcher = RateFetcher(providers=[BrokenProvider("a"), BrokenProvider("b")], retries=0)
+    try:
+        with pytest.raises(ProviderError) as info:
+            fetcher.fetch("USD")
+    finally:
+        fetcher.close()
+    assert [name for name, _ in info.value.errors] == ["a", "b"]
@@ -0,0 +1,50 @@
+"""RateHistory: exact lookups, bounded growth, and rows stay aligned after a failed append"""
+
+import builtins
+
+import pytest
+
+from model import rate_history
+from model.rate_history import RateHistory
+
+DAY = 86400
+
+
+def test_get_rate_at_returns_the_stored_precision(tmp_path):
+    history = RateHistory(str(tmp_path))
+    history.append({"EUR": 0.912345678, "JPY": 151.123456789}, "USD", 1000)
+    assert history.get_rate_at("USD", "EUR", 1000) == 0.912345678
+    assert history.get_rate_at("USD", "JPY", 2000) == 151.123456789
+    assert history.get_rate_at("USD", "EUR", 999) is None
+
+
+def test_append_compacts_old_rows(tmp_path):
+    history = RateHistory(str(tmp_path), compact_after=50, keep_seconds=2 * DAY)
+    # Hourly snapshots for ten days
+    for hour in range(240):
+        history.append({"EUR": 0.9}, "USD", hour * 3600)
+    assert len(history) < 100
+    # Recent snapshots are all kept, older days keep their last one
+    assert history.get_rate_at("USD", "EUR", 239 * 3600) == 0.9
+    assert len(RateHistory(str(tmp_path))) == len(history)
+
+
+def test_failed_append_leaves_columns_aligned(tmp_path, monkeypatch):
+    history = RateHistory(str(tmp_path))
+    history.append({"EUR": 0.9}, "USD", 1000)
+
+    def failing_open(path, *args, **kwargs):
+        if path.endswith(rate_history.TIMESTAMPS):
+            raise OSError("disk full")
+        return builtins.open(path, *args, **kwargs)
+
+    monkeypatch.setattr(rate_history, "open", failing_open, raising=False)
+    with pytest.raises(OSError):
+        history.append({"EUR": 0.8, "GBP": 0.7}, "USD", 2000)
+    monkeypatch.undo()
+
+    for code in history.codes():
+        assert (tmp_path / f"{code}.f64").stat().st_size <= 8
+    assert history.append({"EUR": 0.7}, "USD", 3000)
+    assert history.get_rate_at("USD", "EUR", 1500) == 0.9
+    assert history.get_rate_at("USD", "EUR", 3000) == 0.7
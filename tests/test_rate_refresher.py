@@ -0,0 +1,40 @@
+"""RateRefresher: unexpected errors neither kill the thread nor leave `ready` unset"""
+
+import threading
+
+from model.rate_refresher import RateRefresher
+
+
+class FlakyModel:
+    """Raises on the first refresh, then succeeds"""
+
+    snapshot = None
+
+    def __init__(self):
+        self.calls = 0
+        self.succeeded = threading.Event()
+
+    def load_rates_from_cache(self):
+        raise OSError("cache unreadable")
+
+    def refresh_rates(self, base=None):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("unexpected")
+        self.succeeded.set()
+        return True
+
+
+def test_ready_is_set_after_a_failing_first_attempt_and_refresh_retries():
+    model = FlakyModel()
+    results = []
+    refresher = RateRefresher(model, interval=60, retry=0.01)
+    refresher.add_listener(results.append)
+    refresher.start()
+    try:
+        assert refresher.ready.wait(2)
+        assert model.succeeded.wait(2)
+        assert results[:2] == [False, True]
+        assert refresher.last_ok
+    finally:
+        refresher.stop()
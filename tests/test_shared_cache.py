@@ -0,0 +1,45 @@
+"""SharedRateCache: one fetch per interval, readable snapshots, and lock failures fall back to fetching"""
+
+import os
+import stat
+
+from model.shared_cache import SharedRateCache
+
+RATES = {"USD": 1.0, "EUR": 0.9, "GBP": 0.8}
+
+
+def counting_fetch(calls):
+    def fetch(base):
+        calls.append(base)
+        return dict(RATES)
+    return fetch
+
+
+def test_second_caller_reads_the_published_snapshot(tmp_path):
+    calls = []
+    first = SharedRateCache(str(tmp_path), max_age=60)
+    second = SharedRateCache(str(tmp_path), max_age=60)
+    rates, _ = first.get_or_fetch("USD", counting_fetch(calls))
+    shared, _ = second.get_or_fetch("USD", counting_fetch(calls))
+    assert calls == ["USD"]
+    assert shared == rates
+
+
+def test_published_snapshot_is_readable_by_other_users(tmp_path):
+    cache = SharedRateCache(str(tmp_path), max_age=60)
+    cache.get_or_fetch("USD", counting_fetch([]))
+    mode = stat.S_IMODE(os.stat(cache.path("USD")).st_mode)
+    assert mode & stat.S_IROTH and mode & stat.S_IRGRP
+
+
+def test_unopenable_lock_falls_back_to_a_direct_fetch(tmp_path):
+    calls = []
+    cache = SharedRateCache(str(tmp_path), max_age=60)
+    os.mkdir(os.path.join(str(tmp_path), "USD.lock"))  # open() on it fails with EISDIR
+
+    rates, _ = cache.get_or_fetch("USD", counting_fetch(calls))
+    assert rates == RATES
+    # The thread lock was released, so a second attempt does not deadlock
+    cache.get_or_fetch("USD", counting_fetch(calls))
+    assert calls == ["USD", "USD"]
+    assert not os.path.exists(cache.path("USD"))
@@ -0,0 +1,94 @@
+"""SnapshotJournal: delta replay, recovery from a broken log, periodic checkpoints"""
+
+import json
+
+import pytest
+
+from model.snapshot_delta import SnapshotJournal, content_hash
+
+RATES = {"USD": 1.0, "EUR": 0.9, "GBP": 0.8, "JPY": 150.0}
+
+
+def moved(rates, **changes):
+    return dict(rates, **changes)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return SnapshotJournal(str(tmp_path / "rates.fxrs"))
+
+
+def test_deltas_replay_to_the_latest_snapshot(journal):
+    assert journal.record(RATES, "USD", 1.0) == "checkpoint"
+    second = moved(RATES, EUR=0.91)
+    third = {code: rate for code, rate in moved(second, GBP=0.79, CHF=0.88).items() if code != "JPY"}
+    assert journal.record(second, "USD", 2.0) == "delta"
+    assert journal.record(second, "USD", 3.0) == "unchanged"
+    assert journal.record(third, "USD", 4.0) == "delta"
+
+    fresh = SnapshotJournal(journal.path)
+    assert fresh.load() == (third, "USD", 4.0)
+    # The reloaded state continues the chain
+    assert fresh.record(moved(third, EUR=0.92), "USD", 5.0) == "delta"
+    assert SnapshotJournal(journal.path).load()[0]["EUR"] == 0.92
+
+
+def test_truncated_log_stops_replay_and_forces_a_checkpoint(journal):
+    journal.record(RATES, "USD", 1.0)
+    second = moved(RATES, EUR=0.91)
+    journal.record(second, "USD", 2.0)
+    journal.record(moved(second, GBP=0.79), "USD", 3.0)
+    with open(journal.log_path, "r+") as f:
+        content = f.read()
+        f.seek(0)
+        f.truncate()
+        f.write(content[:-10])
+
+    fresh = SnapshotJournal(journal.path)
+    assert fresh.load() == (second, "USD", 2.0)
+    assert fresh.record(moved(second, JPY=151.0), "USD", 4.0) == "checkpoint"
+
+
+def test_log_that_does_not_chain_from_the_checkpoint_is_ignored(journal):
+    journal.record(RATES, "USD", 1.0)
+    journal.record(moved(RATES, EUR=0.91), "USD", 2.0)
+    with open(journal.log_path) as f:
+        entry = json.loads(f.readline())
+    entry["prev"] = content_hash(moved(RATES, EUR=0.5), "USD")
+    with open(journal.log_path, "w") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    fresh = SnapshotJournal(journal.path)
+    assert fresh.load() == (RATES, "USD", 1.0)
+    assert fresh.record(moved(RATES, EUR=0.92), "USD", 3.0) == "checkpoint"
+
+
+def test_corrupt_entry_hash_stops_replay(journal):
+    journal.record(RATES, "USD", 1.0)
+    journal.record(moved(RATES, EUR=0.91), "USD", 2.0)
+    with open(journal.log_path) as f:
+        entry = json.loads(f.readline())
+    entry["set"]["EUR"] = 0.95
+    with open(journal.log_path, "w") as f:
+        f.write(json.dumps(entry) + "\n")
+    assert SnapshotJournal(journal.path).load() == (RATES, "USD", 1.0)
+
+
+def test_checkpoint_every_50_deltas(journal):
+    kinds = []
+    for i in range(102):
+        kinds.append(journal.record(moved(RATES, EUR=0.9 + i / 1000), "USD", float(i)))
+    assert kinds[0] == "checkpoint"
+    assert kinds[1:51] == ["delta"] * 50
+    assert kinds[51] == "checkpoint"
+    assert kinds[52:102] == ["delta"] * 50
+    with open(journal.log_path) as f:
+        assert len(f.readlines()) == 50
+    assert SnapshotJournal(journal.path).load()[0]["EUR"] == pytest.approx(0.9 + 101 / 1000)
+
+
+def test_base_change_writes_a_checkpoint(journal):
+    journal.record(RATES, "USD", 1.0)
+    eur = {code: rate / 0.9 for code, rate in RATES.items()}
+    assert journal.record(eur, "EUR", 2.0) == "checkpoint"
+    assert SnapshotJournal(journal.path).load() == (eur, "EUR", 2.0)
@@ -0,0 +1,90 @@
+"""TaskExecutor: results reach the UI thread in order, latest wins, and failures do not stop the pump"""
+
+import threading
+import time
+
+from controller.task_executor import TaskExecutor
+
+
+class ManualSchedule:
+    """Records root.after calls; the test runs them as the Tk loop would"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, ms, callback):
+        self.calls.append(callback)
+
+    def run_next(self):
+        self.calls.pop(0)()
+
+
+def wait_done(executor, timeout=5.0):
+    """Wait until every submitted task has run; results stay queued for drain()"""
+    deadline = time.monotonic() + timeout
+    while executor.stats()['pending']:
+        assert time.monotonic() < deadline, "tasks still pending"
+        time.sleep(0.005)
+
+
+def test_results_are_applied_on_drain_in_submission_order():
+    executor = TaskExecutor(ManualSchedule(), max_workers=1)
+    seen = []
+    for i in range(5):
+        executor.submit(f"task{i}", lambda i=i: i * 10, seen.append)
+    wait_done(executor)
+    assert seen == []  # nothing runs on the worker thread's behalf
+    executor.drain()
+    assert seen == [0, 10, 20, 30, 40]
+    assert executor.idle()
+    executor.shutdown()
+
+
+def test_latest_submission_with_same_key_wins():
+    executor = TaskExecutor(ManualSchedule(), max_workers=1)
+    gate = threading.Event()
+    executor.submit("block", gate.wait, lambda _: None)
+    seen = []
+    for i in range(3):
+        executor.submit("quote", lambda i=i: i, seen.append)
+    gate.set()
+    wait_done(executor)
+    executor.drain()
+    assert seen == [2]
+    assert executor.superseded >= 2
+    executor.shutdown()
+
+
+def test_rejects_when_saturated():
+    executor = TaskExecutor(ManualSchedule(), max_workers=1, max_pending=2)
+    gate = threading.Event()
+    assert executor.submit("a", gate.wait, lambda _: None)
+    assert executor.submit("b", gate.wait, lambda _: None)
+    assert not executor.submit("c", gate.wait, lambda _: None)
+    assert executor.rejected == 1
+    gate.set()
+    executor.shutdown()
+
+
+def test_raising_callback_does_not_stop_the_pump():
+    schedule = ManualSchedule()
+    executor = TaskExecutor(schedule, max_workers=1).start()
+    seen = []
+
+    def explode(_):
+        raise RuntimeError("boom")
+
+    executor.submit("first", lambda: 1, explode)
+    executor.post(lambda: 1 / 0)
+    executor.submit("second", lambda: 2, seen.append)
+    wait_done(executor)
+    schedule.run_next()
+    assert seen == [2]
+
+    # The poll rescheduled itself, so later results still arrive
+    executor.submit("third", lambda: 3, seen.append)
+    wait_done(executor)
+    schedule.run_next()
+    assert seen == [2, 3]
+    assert len(schedule.calls) == 1
+    executor.shutdown()
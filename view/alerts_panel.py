@@ -0,0 +1,122 @@
+# ============================================================================
+# view/alerts_panel.py
+# ============================================================================
+
+"""
+Alerts Panel - Create, list and watch rate alerts in the Alerts tab
+"""
+
+import tkinter as tk
+from datetime import datetime
+from tkinter import ttk
+
+KIND_LABELS = {"Rises above": "above", "Falls below": "below", "Moves by %": "change"}
+
+
+def rule_row(rule) -> tuple:
+    return rule.describe(), "active" if rule.active else "fired"
+
+
+class AlertsPanel:
+    """View: rule form, rule table and a log of fired alerts"""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.frame = tk.Frame(parent, bg="white")
+        self.frame.pack(expand=True, fill="both", padx=30, pady=20)
+        self.create_widgets()
+
+    def create_widgets(self):
+        tk.Label(
+            self.frame, text="Rate Alerts", font=("Arial", 18, "bold"),
+            bg="white", fg="#0a2342"
+        ).pack(anchor="w", pady=(5, 10))
+
+        # Rule form
+        form = tk.Frame(self.frame, bg="white")
+        form.pack(fill="x", pady=(0, 10))
+
+        for column, text in enumerate(["From", "To", "When", "Value"]):
+            tk.Label(form, text=text, bg="white", font=("Arial", 10, "bold")).grid(
+                row=0, column=column, sticky="w")
+
+        self.from_combo = ttk.Combobox(form, state="readonly", width=22)
+        self.from_combo.grid(row=1, column=0, padx=(0, 5), sticky="ew")
+        self.to_combo = ttk.Combobox(form, state="readonly", width=22)
+        self.to_combo.grid(row=1, column=1, padx=5, sticky="ew")
+        self.kind_combo = ttk.Combobox(form, state="readonly", width=12,
+                                       values=list(KIND_LABELS))
+        self.kind_combo.set("Rises above")
+        self.kind_combo.grid(row=1, column=2, padx=5)
+        self.value_var = tk.StringVar()
+        tk.Entry(form, textvariable=self.value_var, width=12, relief="solid", bd=1).grid(
+            row=1, column=3, padx=5, ipady=3)
+        self.add_btn = ttk.Button(form, text="Add Alert", style="Round.TButton")
+        self.add_btn.grid(row=1, column=4, padx=(5, 0))
+        form.grid_columnconfigure(0, weight=1)
+        form.grid_columnconfigure(1, weight=1)
+
+        # Rule table
+        self.rules_tree = ttk.Treeview(
+            self.frame, columns=("rule", "status"), show="headings", height=8)
+        self.rules_tree.heading("rule", text="Alert")
+        self.rules_tree.heading("status", text="Status")
+        self.rules_tree.column("status", width=90, anchor="center")
+        self.rules_tree.pack(fill="both", expand=True)
+
+        self.remove_btn = ttk.Button(self.frame, text="Remove Selected")
+        self.remove_btn.pack(anchor="e", pady=5)
+
+        # Fired alerts
+        tk.Label(self.frame, text="Triggered", bg="white",
+                 font=("Arial", 10, "bold")).pack(anchor="w")
+        self.fired_list = tk.Listbox(self.frame, height=6, relief="solid", bd=1)
+        self.fired_list.pack(fill="x", pady=(2, 5))
+
+    def bind_add(self, callback):
+        self.add_btn.config(command=callback)
+
+    def bind_remove(self, callback):
+        self.remove_btn.config(command=callback)
+
+    def set_currencies(self, currencies: list):
+        self.from_combo['values'] = currencies
+        self.to_combo['values'] = currencies
+        if currencies and not self.from_combo.get():
+            self.from_combo.set("USD - US Dollar")
+            self.to_combo.set("EUR - Euro")
+
+    def get_rule_input(self):
+        """(from text, to text, kind, value text) as entered"""
+        return (self.from_combo.get(), self.to_combo.get(),
+                KIND_LABELS.get(self.kind_combo.get()), self.value_var.get().strip())
+
+    def show_rules(self, rules):
+        """Replace every row; later changes go through insert/delete/update_rules"""
+        self.rules_tree.delete(*self.rules_tree.get_children())
+        self.insert_rules(rules)
+
+    def insert_rules(self, rules):
+        for rule in rules:
+            self.rules_tree.insert("", "end", iid=str(rule.id), values=rule_row(rule))
+
+    def delete_rules(self, rule_ids):
+        iids = [str(rule_id) for rule_id in rule_ids if self.rules_tree.exists(str(rule_id))]
+        if iids:
+            self.rules_tree.delete(*iids)
+
+    def update_rules(self, rules):
+        for rule in rules:
+            if self.rules_tree.exists(str(rule.id)):
+                self.rules_tree.item(str(rule.id), values=rule_row(rule))
+
+    def selected_rule_ids(self) -> list:
+        return [int(iid) for iid in self.rules_tree.selection()]
+
+    def add_fired(self, messages, when=None):
+        stamp = (when or datetime.now()).strftime("%H:%M:%S")
+        for message in messages:
+            self.fired_list.insert(0, f"{stamp}  {message}")
+        # Keep the log bounded
+        if self.fired_list.size() > 200:
+            self.fired_list.delete(200, "end")
@@ -0,0 +1,92 @@
+# ============================================================================
+# view/charts_panel.py
+# ============================================================================
+
+"""
+Charts Panel - Rate history of one currency pair in the Charts tab
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from view.rate_chart import RateChart
+
+RANGES = {"24 hours": 86400, "7 days": 7 * 86400, "30 days": 30 * 86400,
+          "1 year": 365 * 86400, "All": None}
+
+
+class ChartsPanel:
+    """View: pair and range pickers above a rate chart"""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.frame = tk.Frame(parent, bg="white")
+        self.frame.pack(expand=True, fill="both", padx=30, pady=20)
+        self.create_widgets()
+
+    def create_widgets(self):
+        tk.Label(
+            self.frame, text="Rate History", font=("Arial", 18, "bold"),
+            bg="white", fg="#0a2342"
+        ).pack(anchor="w", pady=(5, 10))
+
+        form = tk.Frame(self.frame, bg="white")
+        form.pack(fill="x", pady=(0, 10))
+
+        for column, text in enumerate(["From", "To", "Range"]):
+            tk.Label(form, text=text, bg="white", font=("Arial", 10, "bold")).grid(
+                row=0, column=column, sticky="w")
+
+        self.from_combo = ttk.Combobox(form, state="readonly", width=22)
+        self.from_combo.grid(row=1, column=0, padx=(0, 5), sticky="ew")
+        self.to_combo = ttk.Combobox(form, state="readonly", width=22)
+        self.to_combo.grid(row=1, column=1, padx=5, sticky="ew")
+        self.range_combo = ttk.Combobox(form, state="readonly", width=10, values=list(RANGES))
+        self.range_combo.set("30 days")
+        self.range_combo.grid(row=1, column=2, padx=(5, 0))
+        form.grid_columnconfigure(0, weight=1)
+        form.grid_columnconfigure(1, weight=1)
+
+        self.chart = RateChart(self.frame)
+
+        self.info_label = tk.Label(self.frame, text="", font=("Arial", 9),
+                                   fg="#666", bg="white")
+        self.info_label.pack(anchor="e", pady=(5, 0))
+
+    def set_currencies(self, currencies: list):
+        self.from_combo['values'] = currencies
+        self.to_combo['values'] = currencies
+        if currencies and not self.from_combo.get():
+            self.from_combo.set("USD - US Dollar")
+            self.to_combo.set("EUR - Euro")
+
+    def get_selection(self):
+        """(from text, to text, range in seconds or None for everything)"""
+        return self.from_combo.get(), self.to_combo.get(), RANGES.get(self.range_combo.get())
+
+    def bind_selection_changed(self, callback):
+        for combo in (self.from_combo, self.to_combo, self.range_combo):
+            combo.bind("<<ComboboxSelected>>", lambda e: callback())
+
+    def show_series(self, timestamps, rates):
+        self.chart.set_series(timestamps, rates)
+        self.update_info()
+
+    def append_points(self, timestamps, rates):
+        for x, y in zip(timestamps, rates):
+            self.chart.append(float(x), float(y))
+        self.update_info()
+
+    def last_timestamp(self):
+        return float(self.chart.x[-1]) if len(self.chart.x) else None
+
+    def show_status(self, message):
+        """Until the next draw, the info line shows `message`"""
+        self.info_label.config(text=message)
+
+    def update_info(self):
+        chart = self.chart
+        self.info_label.config(
+            text=f"{len(chart.x):,} snapshots • {chart.drawn_points:,} points drawn • "
+                 f"last draw {chart.last_redraw_ms:.1f} ms"
+        )
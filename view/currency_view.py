@@ -11,9 +11,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import math
 
+from view.alerts_panel import AlertsPanel
+from view.charts_panel import ChartsPanel
+from view.send_panel import SendPanel
+
 
 class CurrencyView:
-    """View: Elegant, Responsive UI with Navigation Bar and Loading Spinner"""
+    """View: Elegant, Responsive UI with Navigation Bar and Loading Spinner
+
+    Implements view_protocol.CurrencyViewProtocol; the controller only uses those methods.
+    """
 
     def __init__(self, root):
         self.root = root
@@ -30,6 +37,11 @@ class CurrencyView:
         self.spinner_active = False
         self.spinner_angle = 0
 
+        # CurrencyIndex for the loaded snapshot (set by populate_currencies)
+        self.currency_index = None
+        # Full picker lists per combobox, most used currencies first
+        self.combo_values = {}
+
         self.setup_styles()
         self.create_widgets()
 
@@ -137,8 +149,32 @@ class CurrencyView:
             btn.bind("<Button-1>", lambda e, n=name: self.set_active_tab(n))
             self.nav_buttons[name] = btn
 
+        # PAGES: one frame per tab; tabs without a page keep the current one.
+        # Pages other than Convert are built the first time they are needed.
+        self.pages = {}
+        self.panels = {}
+        self._page_builders = {}
+        self._page_listeners = {}
+
+        # STATUS BAR: on the root, below the pages, so every tab shows it
+        self.status_label = tk.Label(
+            self.root,
+            text="Waiting for connection...",
+            font=("Arial", 9),
+            fg="#cbd9ff",
+            bg="#06172d",
+            anchor="w",
+            padx=15,
+            pady=4
+        )
+        self.status_label.pack(side="bottom", fill="x")
+
+        convert_page = tk.Frame(self.root, bg="#0a2342")
+        convert_page.pack(expand=True, fill="both")
+        self.pages["Convert"] = convert_page
+
         # TITLE AREA
-        title_frame = tk.Frame(self.root, bg="#0a2342")
+        title_frame = tk.Frame(convert_page, bg="#0a2342")
         title_frame.pack(pady=(25, 15))
 
         self.title_main = tk.Label(
@@ -160,7 +196,7 @@ class CurrencyView:
         self.title_sub.pack()
 
         # MAIN CARD
-        card_container = tk.Frame(self.root, bg="#0a2342")
+        card_container = tk.Frame(convert_page, bg="#0a2342")
         card_container.pack(expand=True, fill="both")
 
         shadow = tk.Label(card_container, bg="#07152c")
@@ -206,6 +242,12 @@ class CurrencyView:
         self.to_combo = ttk.Combobox(selector, state="readonly", font=("Arial", 11))
         self.to_combo.grid(row=1, column=2, sticky="ew", padx=(5, 0))
 
+        # Type-ahead: typing filters the list, Return/focus-out picks the best match
+        for combo in (self.from_combo, self.to_combo):
+            combo.bind("<KeyRelease>", self.on_combo_typed)
+            combo.bind("<Return>", self.commit_combo)
+            combo.bind("<FocusOut>", self.commit_combo)
+
         selector.grid_columnconfigure(0, weight=1)
         selector.grid_columnconfigure(1, weight=0)
         selector.grid_columnconfigure(2, weight=1)
@@ -238,7 +280,7 @@ class CurrencyView:
         
         self.result_label = tk.Label(
             result_frame,
-            text="Enter amount and press Convert",
+            text="Enter an amount to convert",
             font=("Arial", 16, "bold"),
             bg="#f6fbff",
             fg="#007bff",
@@ -261,15 +303,22 @@ class CurrencyView:
         )
         self.convert_btn.pack(fill="x", pady=(10, 20), ipady=4)
 
-        # Status Bar
-        self.status_label = tk.Label(
-            content,
-            text="Waiting for connection...",
-            font=("Arial", 9),
-            fg="#666",
-            bg="white"
-        )
-        self.status_label.pack(side="bottom", pady=5)
+        # OTHER TABS (deferred)
+        self.add_page("Send", SendPanel)
+        self.add_page("Charts", ChartsPanel)
+        self.add_page("Alerts", AlertsPanel)
+
+    @property
+    def send_panel(self):
+        return self.ensure_page("Send")
+
+    @property
+    def charts_panel(self):
+        return self.ensure_page("Charts")
+
+    @property
+    def alerts_panel(self):
+        return self.ensure_page("Alerts")
 
     def show_spinner(self):
         """Show and animate the loading spinner"""
@@ -326,6 +375,13 @@ class CurrencyView:
             btn.config(fg="#cbd9ff")
 
     def set_active_tab(self, tab_name):
+        if tab_name in self._page_builders:
+            self.ensure_page(tab_name)
+        if tab_name in self.pages and tab_name != self.active_tab:
+            current = self.pages.get(self.active_tab)
+            if current is not None:
+                current.pack_forget()
+            self.pages[tab_name].pack(expand=True, fill="both")
         self.active_tab = tab_name
         for name, btn in self.nav_buttons.items():
             btn.config(
@@ -334,12 +390,79 @@ class CurrencyView:
             )
         self.update_status(f"Switched to {tab_name} tab")
 
-    def populate_currencies(self, currencies: list):
-        self.from_combo['values'] = currencies
-        self.to_combo['values'] = currencies
+    def add_page(self, tab_name, build):
+        """Register a page for a nav tab; build(parent) runs on first use and returns its panel"""
+        self._page_builders[tab_name] = build
+
+    def ensure_page(self, tab_name):
+        """The tab's panel, building it now if it has not been built yet"""
+        if tab_name not in self.panels:
+            page = tk.Frame(self.root, bg="#0a2342")
+            self.pages[tab_name] = page
+            panel = self.panels[tab_name] = self._page_builders[tab_name](page)
+            for callback in self._page_listeners.pop(tab_name, []):
+                callback(panel)
+        return self.panels[tab_name]
+
+    def page_panel(self, tab_name):
+        """The tab's panel, or None while it has not been built"""
+        return self.panels.get(tab_name)
+
+    def bind_page_built(self, tab_name, callback):
+        """Call callback(panel) once the tab's page exists (immediately if it already does)"""
+        if tab_name in self.panels:
+            callback(self.panels[tab_name])
+        else:
+            self._page_listeners.setdefault(tab_name, []).append(callback)
+
+    def populate_currencies(self, currencies: list, index=None, favorites=()):
+        """Fill the pickers; `favorites` are (from, to) display pairs, most used first"""
+        index = index or self.currency_index
+        current_from, current_to = self.from_combo.get(), self.to_combo.get()
+        self.currency_index = index
+        favorites = list(favorites)
+        for combo, side in ((self.from_combo, 0), (self.to_combo, 1)):
+            first = list(dict.fromkeys(pair[side] for pair in favorites))
+            chosen = set(first)
+            self.combo_values[combo] = first + [text for text in currencies if text not in chosen]
+            combo['values'] = self.combo_values[combo]
+        if index is not None:
+            # Typing is only useful once there is an index to search
+            self.from_combo.config(state="normal")
+            self.to_combo.config(state="normal")
         if currencies:
-            self.from_combo.set("USD - US Dollar")
-            self.to_combo.set("EUR - Euro")
+            # Keep the user's picks across background refreshes; start on the favorite pair
+            default_from, default_to = favorites[0] if favorites else ("USD - US Dollar", "EUR - Euro")
+            self.from_combo.set(self.resolve_display(current_from) or default_from)
+            self.to_combo.set(self.resolve_display(current_to) or default_to)
+
+    def resolve_display(self, text):
+        """Display string for typed or selected text, if it names a known currency"""
+        if not text or self.currency_index is None:
+            return None
+        code = self.currency_index.code_for(text)
+        return self.currency_index.display_for(code) if code else None
+
+    def on_combo_typed(self, event):
+        if self.currency_index is None or event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        combo = event.widget
+        combo['values'] = self.currency_index.search(combo.get())
+
+    def commit_combo(self, event):
+        """Replace partial text with the first match and restore the full list"""
+        if self.currency_index is None:
+            return
+        combo = event.widget
+        text = combo.get()
+        display = self.resolve_display(text)
+        if display is None:
+            matches = self.currency_index.search(text, limit=1)
+            display = matches[0] if matches else None
+        combo['values'] = self.combo_values.get(combo, self.currency_index.display)
+        if display is not None and display != text:
+            combo.set(display)
+            combo.event_generate("<<ComboboxSelected>>")
 
     def get_amount(self) -> float:
         try:
@@ -349,25 +472,64 @@ class CurrencyView:
             return None
 
     def get_from_currency(self):
-        value = self.from_combo.get()
-        return value.split(' - ')[0] if value else "USD"
+        return self.selected_code(self.from_combo, "USD")
 
     def get_to_currency(self):
-        value = self.to_combo.get()
-        return value.split(' - ')[0] if value else "EUR"
-
-    def display_result(self, amount, from_c, to_c, result, rate):
+        return self.selected_code(self.to_combo, "EUR")
+
+    def selected_code(self, combo, default):
+        value = combo.get()
+        if not value:
+            return default
+        if self.currency_index is not None:
+            return self.currency_index.code_for(value)
+        return value.split(' - ')[0]
+
+    def display_result(self, amount, from_c, to_c, result, rate, digits=2):
+        """`digits` is the target currency's minor units (0 for JPY, 3 for KWD)"""
         self.result_label.config(
-            text=f"{amount:,.2f} {from_c} = {result:,.2f} {to_c}",
+            text=f"{amount:,.2f} {from_c} = {result:,.{digits}f} {to_c}",
             fg="#27ae60"
         )
         self.rate_label.config(
-            text=f"1 {from_c} = {rate:.6f} {to_c}"
+            text=f"1 {from_c} = {rate:.9g} {to_c}"
         )
 
+    def display_hint(self, message):
+        """Neutral placeholder while the input cannot be converted yet"""
+        self.result_label.config(text=message, fg="#7f8c8d")
+        self.rate_label.config(text="")
+
+    def after(self, ms, callback):
+        return self.root.after(ms, callback)
+
+    def after_idle(self, callback):
+        return self.root.after_idle(callback)
+
+    def bind_convert(self, callback):
+        self.convert_btn.config(command=callback)
+
+    def bind_swap(self, callback):
+        self.swap_btn.config(command=callback)
+
+    def bind_input_changed(self, callback):
+        """Call `callback()` on every amount keystroke and currency change"""
+        self.amount_var.trace_add("write", lambda *args: callback())
+        self.from_combo.bind("<<ComboboxSelected>>", lambda e: callback())
+        self.to_combo.bind("<<ComboboxSelected>>", lambda e: callback())
+
+    def bind_refresh(self, callback):
+        """F5 requests a manual rate refresh"""
+        self.root.bind("<F5>", lambda e: callback())
+
     def update_status(self, msg):
         self.status_label.config(text=msg)
 
+    def notify(self, message):
+        """Non-blocking notification: status line plus the system bell"""
+        self.update_status(message)
+        self.root.bell()
+
     def show_error(self, title, message):
         messagebox.showerror(title, message)
 
@@ -0,0 +1,389 @@
+# ============================================================================
+# view/headless_view.py
+# ============================================================================
+
+"""
+Headless View - CurrencyViewProtocol without Tk, for scripted and benchmark runs
+
+Widgets are plain attributes and the Tk event loop is a HeadlessLoop that
+runs `after`/`after_idle` callbacks only when pumped, so a driver decides
+when the UI thread does work. The `type_*`, `select_*`, `click_*` and
+`open_tab` methods act like a user: they fire the same callbacks the Tk
+widgets would. Dialogs never block; errors are collected in `errors`.
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+
+import numpy as np
+
+# Same choices as ChartsPanel and AlertsPanel, which cannot be imported without tkinter
+RANGES = {"24 hours": 86400, "7 days": 7 * 86400, "30 days": 30 * 86400,
+          "1 year": 365 * 86400, "All": None}
+KIND_LABELS = {"Rises above": "above", "Falls below": "below", "Moves by %": "change"}
+
+
+class HeadlessLoop:
+    """Stand-in for the Tk event loop; nothing runs until pump() or run_idle()"""
+
+    def __init__(self):
+        self._timers = []
+        self._idle = deque()
+        self._ids = itertools.count(1)
+
+    def after(self, ms, callback):
+        timer_id = next(self._ids)
+        heapq.heappush(self._timers, (time.monotonic() + ms / 1000, timer_id, callback))
+        return timer_id
+
+    def after_idle(self, callback):
+        timer_id = next(self._ids)
+        self._idle.append(callback)
+        return timer_id
+
+    @property
+    def idle_pending(self) -> int:
+        return len(self._idle)
+
+    def run_idle(self) -> int:
+        """Run idle callbacks, including ones queued while running (like Tk)"""
+        count = 0
+        while self._idle:
+            self._idle.popleft()()
+            count += 1
+        return count
+
+    def run_due(self) -> int:
+        """Run timers whose delay has passed"""
+        now, count = time.monotonic(), 0
+        while self._timers and self._timers[0][0] <= now:
+            _, _, callback = heapq.heappop(self._timers)
+            callback()
+            count += 1
+        return count
+
+    def pump(self) -> int:
+        return self.run_due() + self.run_idle()
+
+
+class HeadlessSendPanel:
+    def __init__(self):
+        self.text = ""
+        self.open_path = None
+        self.save_path = None
+        self.status = "No quotes yet"
+        self.quotes = None
+        self._quote = self._load = self._export = None
+
+    def bind_quote(self, callback):
+        self._quote = callback
+
+    def bind_load(self, callback):
+        self._load = callback
+
+    def bind_export(self, callback):
+        self._export = callback
+
+    def click_quote(self):
+        self._quote()
+
+    def click_load(self):
+        self._load()
+
+    def click_export(self):
+        self._export()
+
+    def get_text(self) -> str:
+        return self.text
+
+    def ask_open_path(self):
+        return self.open_path
+
+    def ask_save_path(self):
+        return self.save_path
+
+    def show_status(self, message):
+        self.status = message
+
+    def show_quotes(self, quotes, source):
+        self.quotes = quotes
+        self.show_status(f"{len(quotes):,} recipients from {source}")
+
+
+class HeadlessChartsPanel:
+    def __init__(self):
+        self.currencies = []
+        self.from_text = self.to_text = ""
+        self.range_name = "30 days"
+        self.status = ""
+        self.timestamps, self.rates = np.empty(0), np.empty(0)
+        self._changed = None
+
+    def set_currencies(self, currencies: list):
+        self.currencies = currencies
+        if currencies and not self.from_text:
+            self.from_text, self.to_text = "USD - US Dollar", "EUR - Euro"
+
+    def get_selection(self):
+        return self.from_text, self.to_text, RANGES.get(self.range_name)
+
+    def bind_selection_changed(self, callback):
+        self._changed = callback
+
+    def select(self, from_text=None, to_text=None, range_name=None):
+        self.from_text = from_text or self.from_text
+        self.to_text = to_text or self.to_text
+        self.range_name = range_name or self.range_name
+        if self._changed is not None:
+            self._changed()
+
+    def show_series(self, timestamps, rates):
+        self.timestamps, self.rates = np.asarray(timestamps), np.asarray(rates)
+
+    def append_points(self, timestamps, rates):
+        self.timestamps = np.concatenate([self.timestamps, timestamps])
+        self.rates = np.concatenate([self.rates, rates])
+
+    def last_timestamp(self):
+        return float(self.timestamps[-1]) if len(self.timestamps) else None
+
+    def show_status(self, message):
+        self.status = message
+
+
+class HeadlessAlertsPanel:
+    def __init__(self):
+        self.currencies = []
+        self.from_text = self.to_text = ""
+        self.kind_label = "Rises above"
+        self.value_text = ""
+        self.rules = {}
+        self.selected = []
+        self.fired = deque(maxlen=200)
+        self._add = self._remove = None
+
+    def bind_add(self, callback):
+        self._add = callback
+
+    def bind_remove(self, callback):
+        self._remove = callback
+
+    def click_add(self):
+        self._add()
+
+    def click_remove(self):
+        self._remove()
+
+    def set_currencies(self, currencies: list):
+        self.currencies = currencies
+        if currencies and not self.from_text:
+            self.from_text, self.to_text = "USD - US Dollar", "EUR - Euro"
+
+    def get_rule_input(self):
+        return (self.from_text, self.to_text, KIND_LABELS.get(self.kind_label),
+                self.value_text.strip())
+
+    def show_rules(self, rules):
+        self.rules = {}
+        self.insert_rules(rules)
+
+    def insert_rules(self, rules):
+        for rule in rules:
+            self.rules[rule.id] = (rule.describe(), "active" if rule.active else "fired")
+
+    def delete_rules(self, rule_ids):
+        for rule_id in rule_ids:
+            self.rules.pop(rule_id, None)
+
+    def update_rules(self, rules):
+        self.insert_rules(rule for rule in rules if rule.id in self.rules)
+
+    def selected_rule_ids(self) -> list:
+        return list(self.selected)
+
+    def add_fired(self, messages, when=None):
+        for message in messages:
+            self.fired.appendleft((when, message))
+
+
+class HeadlessView:
+    """View without a display; mirrors CurrencyView's behaviour, not its widgets"""
+
+    PANELS = {"Send": HeadlessSendPanel, "Charts": HeadlessChartsPanel,
+              "Alerts": HeadlessAlertsPanel}
+
+    def __init__(self):
+        self.loop = HeadlessLoop()
+        self.spinner_active = False
+        self.active_tab = "Convert"
+        self.currency_index = None
+
+        self.amount_text = "1.00"
+        self.from_text = self.to_text = ""
+        self.from_values, self.to_values = [], []
+        self.result_text, self.rate_text = "Enter an amount to convert", ""
+        self.status = "Waiting for connection..."
+        self.errors = deque(maxlen=200)
+        self.notifications = deque(maxlen=200)
+
+        self.panels = {}
+        self._page_listeners = {}
+        self._input_listeners = []
+        self._convert = self._swap = self._refresh = None
+
+    # -- event loop ----------------------------------------------------------
+
+    def after(self, ms, callback):
+        return self.loop.after(ms, callback)
+
+    def after_idle(self, callback):
+        return self.loop.after_idle(callback)
+
+    # -- bindings ------------------------------------------------------------
+
+    def bind_convert(self, callback):
+        self._convert = callback
+
+    def bind_swap(self, callback):
+        self._swap = callback
+
+    def bind_input_changed(self, callback):
+        self._input_listeners.append(callback)
+
+    def bind_refresh(self, callback):
+        self._refresh = callback
+
+    def bind_page_built(self, tab_name, callback):
+        if tab_name in self.panels:
+            callback(self.panels[tab_name])
+        else:
+            self._page_listeners.setdefault(tab_name, []).append(callback)
+
+    def ensure_page(self, tab_name):
+        if tab_name not in self.panels:
+            panel = self.panels[tab_name] = self.PANELS[tab_name]()
+            for callback in self._page_listeners.pop(tab_name, []):
+                callback(panel)
+        return self.panels[tab_name]
+
+    def page_panel(self, tab_name):
+        return self.panels.get(tab_name)
+
+    @property
+    def send_panel(self):
+        return self.ensure_page("Send")
+
+    @property
+    def charts_panel(self):
+        return self.ensure_page("Charts")
+
+    @property
+    def alerts_panel(self):
+        return self.ensure_page("Alerts")
+
+    # -- user actions (what the Tk widgets would fire) -----------------------
+
+    def _input_changed(self):
+        for callback in self._input_listeners:
+            callback()
+
+    def type_amount(self, text):
+        """One keystroke: the amount field now holds `text`"""
+        self.amount_text = text
+        self._input_changed()
+
+    def select_from(self, display):
+        self.from_text = display
+        self._input_changed()
+
+    def select_to(self, display):
+        self.to_text = display
+        self._input_changed()
+
+    def click_convert(self):
+        self._convert()
+
+    def click_swap(self):
+        self._swap()
+
+    def press_refresh(self):
+        self._refresh()
+
+    def open_tab(self, tab_name):
+        if tab_name in self.PANELS:
+            self.ensure_page(tab_name)
+        self.active_tab = tab_name
+        self.update_status(f"Switched to {tab_name} tab")
+
+    # -- protocol: input -----------------------------------------------------
+
+    def populate_currencies(self, currencies: list, index=None, favorites=()):
+        index = index or self.currency_index
+        self.currency_index = index
+        favorites = list(favorites)
+        for side, attr in ((0, "from_values"), (1, "to_values")):
+            first = list(dict.fromkeys(pair[side] for pair in favorites))
+            chosen = set(first)
+            setattr(self, attr, first + [text for text in currencies if text not in chosen])
+        if currencies:
+            default_from, default_to = favorites[0] if favorites else ("USD - US Dollar", "EUR - Euro")
+            self.from_text = self.resolve_display(self.from_text) or default_from
+            self.to_text = self.resolve_display(self.to_text) or default_to
+
+    def resolve_display(self, text):
+        if not text or self.currency_index is None:
+            return None
+        code = self.currency_index.code_for(text)
+        return self.currency_index.display_for(code) if code else None
+
+    def get_amount(self):
+        try:
+            return float(self.amount_text.replace(',', '').strip())
+        except ValueError:
+            return None
+
+    def get_from_currency(self):
+        return self.selected_code(self.from_text, "USD")
+
+    def get_to_currency(self):
+        return self.selected_code(self.to_text, "EUR")
+
+    def selected_code(self, value, default):
+        if not value:
+            return default
+        if self.currency_index is not None:
+            return self.currency_index.code_for(value)
+        return value.split(' - ')[0]
+
+    def swap_currencies(self):
+        self.from_text, self.to_text = self.to_text, self.from_text
+
+    # -- protocol: output ----------------------------------------------------
+
+    def show_spinner(self):
+        self.spinner_active = True
+
+    def hide_spinner(self):
+        self.spinner_active = False
+
+    def display_result(self, amount, from_c, to_c, result, rate, digits=2):
+        self.result_text = f"{amount:,.2f} {from_c} = {result:,.{digits}f} {to_c}"
+        self.rate_text = f"1 {from_c} = {rate:.9g} {to_c}"
+
+    def display_hint(self, message):
+        self.result_text, self.rate_text = message, ""
+
+    def update_status(self, msg):
+        self.status = msg
+
+    def notify(self, message):
+        self.update_status(message)
+        self.notifications.append(message)
+
+    def show_error(self, title, message):
+        self.errors.append((title, message))
+
+    def show_info(self, title, message):
+        self.notifications.append(f"{title}: {message}")
@@ -0,0 +1,155 @@
+# ============================================================================
+# view/rate_chart.py
+# ============================================================================
+
+"""
+Rate Chart - Canvas line chart with min/max downsampling and incremental appends
+"""
+
+import time
+import tkinter as tk
+from datetime import datetime
+
+import numpy as np
+
+
+def minmax_downsample(x, y, buckets: int):
+    """Reduce a series to a min and a max point per time bucket.
+
+    Keeps spikes visible while drawing at most 2 * buckets points, however
+    long the history is.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = ~np.isnan(y)
+    x, y = x[valid], y[valid]
+    if len(x) <= 2 * buckets or len(x) < 2 or x[-1] == x[0]:
+        return x, y
+
+    width = (x[-1] - x[0]) / buckets
+    ids = np.minimum(((x - x[0]) / width).astype(np.int64), buckets - 1)
+    bucket_ids, starts = np.unique(ids, return_index=True)
+    lows = np.minimum.reduceat(y, starts)
+    highs = np.maximum.reduceat(y, starts)
+    centers = x[0] + (bucket_ids + 0.5) * width
+
+    out_x = np.repeat(centers, 2)
+    out_y = np.empty(len(out_x))
+    out_y[0::2], out_y[1::2] = lows, highs
+    return out_x, out_y
+
+
+class RateChart:
+    """Line chart of one rate series drawn on a Tk canvas"""
+
+    PAD_LEFT, PAD_RIGHT, PAD_TOP, PAD_BOTTOM = 70, 20, 20, 30
+
+    def __init__(self, parent, width=600, height=320):
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg="white",
+                                highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self._domain = None  # (x_min, x_max, y_min, y_max) of the current drawing
+        self._last_point = None
+
+        self.last_redraw_ms = 0.0
+        self.drawn_points = 0
+        self.incremental_appends = 0
+
+    # -- data --------------------------------------------------------------
+
+    def set_series(self, x, y):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.redraw()
+
+    def append(self, x, y):
+        """Add one point; drawn as a single segment when it fits the current axes"""
+        if np.isnan(y):
+            return
+        self.x = np.append(self.x, x)
+        self.y = np.append(self.y, y)
+
+        domain, last = self._domain, self._last_point
+        if domain is None or last is None:
+            self.redraw()
+            return
+        x_min, x_max, y_min, y_max = domain
+        if not (x_min <= x <= x_max and y_min <= y <= y_max):
+            self.redraw()
+            return
+
+        start = time.perf_counter()
+        point = self.to_canvas(x, y)
+        self.canvas.create_line(*last, *point, fill="#007bff", width=2, tags="series")
+        self._last_point = point
+        self.incremental_appends += 1
+        self.last_redraw_ms = (time.perf_counter() - start) * 1000
+
+    # -- drawing -----------------------------------------------------------
+
+    def plot_size(self):
+        width = max(self.canvas.winfo_width(), int(self.canvas.cget("width")))
+        height = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        return width, height
+
+    def to_canvas(self, x, y):
+        x_min, x_max, y_min, y_max = self._domain
+        width, height = self.plot_size()
+        plot_w = width - self.PAD_LEFT - self.PAD_RIGHT
+        plot_h = height - self.PAD_TOP - self.PAD_BOTTOM
+        cx = self.PAD_LEFT + (x - x_min) / (x_max - x_min) * plot_w
+        cy = self.PAD_TOP + (y_max - y) / (y_max - y_min) * plot_h
+        return cx, cy
+
+    def redraw(self):
+        """Full redraw at one min/max pair per horizontal pixel"""
+        start = time.perf_counter()
+        self.canvas.delete("all")
+        width, height = self.plot_size()
+
+        x, y = minmax_downsample(self.x, self.y, max(1, width - self.PAD_LEFT - self.PAD_RIGHT))
+        if len(x) < 2:
+            self._domain, self._last_point = None, None
+            self.canvas.create_text(width / 2, height / 2, fill="#7f8c8d",
+                                    text="Not enough history for this pair yet")
+            self.drawn_points = len(x)
+            self.last_redraw_ms = (time.perf_counter() - start) * 1000
+            return
+
+        # Headroom lets new points be appended without rescaling
+        span = x[-1] - x[0]
+        y_lo, y_hi = float(y.min()), float(y.max())
+        margin = (y_hi - y_lo) * 0.1 or abs(y_hi) * 0.01 or 1.0
+        self._domain = (x[0], x[-1] + span * 0.05, y_lo - margin, y_hi + margin)
+
+        plot_w = width - self.PAD_LEFT - self.PAD_RIGHT
+        plot_h = height - self.PAD_TOP - self.PAD_BOTTOM
+        x_min, x_max, y_min, y_max = self._domain
+        cx = self.PAD_LEFT + (x - x_min) / (x_max - x_min) * plot_w
+        cy = self.PAD_TOP + (y_max - y) / (y_max - y_min) * plot_h
+        coords = np.empty(len(cx) * 2)
+        coords[0::2], coords[1::2] = cx, cy
+
+        self.draw_axes(width, height)
+        # One canvas item for the whole series
+        self.canvas.create_line(*coords.tolist(), fill="#007bff", width=2, tags="series")
+        self._last_point = (cx[-1], cy[-1])
+        self.drawn_points = len(x)
+        self.last_redraw_ms = (time.perf_counter() - start) * 1000
+
+    def draw_axes(self, width, height):
+        x_min, x_max, y_min, y_max = self._domain
+        left, bottom = self.PAD_LEFT, height - self.PAD_BOTTOM
+        self.canvas.create_line(left, self.PAD_TOP, left, bottom, fill="#bbb")
+        self.canvas.create_line(left, bottom, width - self.PAD_RIGHT, bottom, fill="#bbb")
+        for value, anchor_y in ((y_max, self.PAD_TOP), (y_min, bottom)):
+            self.canvas.create_text(left - 6, anchor_y, text=f"{value:.6g}", anchor="e",
+                                    fill="#444", font=("Arial", 8))
+        for value, anchor_x, anchor in ((x_min, left, "nw"), (x_max, width - self.PAD_RIGHT, "ne")):
+            self.canvas.create_text(anchor_x, bottom + 6, anchor=anchor, fill="#444",
+                                    font=("Arial", 8),
+                                    text=datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M"))
@@ -0,0 +1,100 @@
+# ============================================================================
+# view/send_panel.py
+# ============================================================================
+
+"""
+Send Panel - Multi-recipient transfer quotes in the Send tab
+"""
+
+import tkinter as tk
+from tkinter import filedialog, ttk
+
+from model.transfer_quotes import COLUMNS
+from view.virtual_table import VirtualTable
+
+FILE_TYPES = [("CSV / text", "*.csv *.tsv *.txt"), ("All files", "*.*")]
+TOTALS_SHOWN = 6
+
+
+class SendPanel:
+    """View: recipient input, quote table and export"""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.frame = tk.Frame(parent, bg="white")
+        self.frame.pack(expand=True, fill="both", padx=30, pady=20)
+        self.create_widgets()
+
+    def create_widgets(self):
+        tk.Label(
+            self.frame, text="Send Money", font=("Arial", 18, "bold"),
+            bg="white", fg="#0a2342"
+        ).pack(anchor="w", pady=(5, 2))
+        tk.Label(
+            self.frame, text="Paste recipients, one per line: recipient, amount, from, to",
+            font=("Arial", 10), bg="white", fg="#444"
+        ).pack(anchor="w", pady=(0, 5))
+
+        self.input_text = tk.Text(self.frame, height=6, relief="solid", bd=1,
+                                  font=("Courier", 10))
+        self.input_text.pack(fill="x")
+
+        buttons = tk.Frame(self.frame, bg="white")
+        buttons.pack(fill="x", pady=8)
+        self.load_btn = ttk.Button(buttons, text="Load File...")
+        self.load_btn.pack(side="left")
+        self.quote_btn = ttk.Button(buttons, text="Quote All", style="Round.TButton")
+        self.quote_btn.pack(side="left", padx=8)
+        self.export_btn = ttk.Button(buttons, text="Export CSV...", state="disabled")
+        self.export_btn.pack(side="right")
+
+        self.summary_label = tk.Label(self.frame, text="No quotes yet", font=("Arial", 10),
+                                      bg="white", fg="#2c3e50", anchor="w", justify="left",
+                                      wraplength=800)
+        self.summary_label.pack(fill="x", pady=(0, 5))
+
+        self.table = VirtualTable(self.frame, COLUMNS, visible_rows=12,
+                                  widths={"Recipient": 160, "Rate": 110, "Payout": 120})
+        self.table.frame.pack(fill="both", expand=True)
+
+    def bind_quote(self, callback):
+        self.quote_btn.config(command=callback)
+
+    def bind_load(self, callback):
+        self.load_btn.config(command=callback)
+
+    def bind_export(self, callback):
+        self.export_btn.config(command=callback)
+
+    def get_text(self) -> str:
+        return self.input_text.get("1.0", "end")
+
+    def ask_open_path(self):
+        return filedialog.askopenfilename(title="Load recipients", filetypes=FILE_TYPES)
+
+    def ask_save_path(self):
+        return filedialog.asksaveasfilename(title="Export quotes", defaultextension=".csv",
+                                            filetypes=FILE_TYPES)
+
+    def show_status(self, message):
+        self.summary_label.config(text=message)
+
+    def show_quotes(self, quotes, source):
+        self.table.set_source(len(quotes), quotes.rows)
+        self.export_btn.config(state="normal" if len(quotes) else "disabled")
+
+        totals = list(quotes.totals().items())
+        parts = [f"{total} {code}" for code, total in totals[:TOTALS_SHOWN]]
+        if len(totals) > TOTALS_SHOWN:
+            parts.append(f"+{len(totals) - TOTALS_SHOWN} more")
+        text = f"{len(quotes):,} recipients from {source}"
+        if quotes.failed:
+            text += f" • {quotes.failed:,} could not be quoted"
+        skipped = quotes.recipients.errors
+        if skipped:
+            text += f" • {len(skipped):,} lines skipped (first: line {skipped[0][0]})"
+        if parts:
+            text += "\nPayouts: " + ", ".join(parts)
+        if quotes.last_updated:
+            text += f"\nRates as of {quotes.last_updated}"
+        self.show_status(text)
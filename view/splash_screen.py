@@ -13,9 +13,12 @@ from tkinter import ttk
 class SplashScreen:
     """Elegant splash screen with loading animation"""
     
-    def __init__(self, duration=3):
-        self.duration = duration  # Duration in seconds
-        self.splash = tk.Tk()
+    def __init__(self, duration=3, ready=None, root=None):
+        self.duration = duration  # Maximum duration in seconds
+        self.ready = ready  # Optional callable; the splash closes once it returns True
+        # With an app root the splash is a Toplevel on it, so only one Tk interpreter starts
+        self.root = root
+        self.splash = tk.Toplevel(root) if root is not None else tk.Tk()
         self.splash.title("Loading...")
         
         # Window setup
@@ -114,7 +117,11 @@ class SplashScreen:
         delay = (self.duration * 1000) / steps  # milliseconds
         
         def animate(step=0):
-            if step <= steps:
+            if self.ready is not None and self.ready():
+                self.progress['value'] = 100
+                self.loading_label.config(text="Ready!")
+                self.splash.after(100, self.close)
+            elif step <= steps:
                 self.progress['value'] = step * increment
                 
                 # Update loading text
@@ -136,9 +143,12 @@ class SplashScreen:
         self.splash.destroy()
     
     def show(self):
-        """Display the splash screen"""
+        """Display the splash screen; returns once it has closed"""
         self.update_progress()
-        self.splash.mainloop()
+        if self.root is not None:
+            self.root.wait_window(self.splash)
+        else:
+            self.splash.mainloop()
 
 # MAIN ENTRY POINT WITH SPLASH SCREEN
 
@@ -0,0 +1,89 @@
+# ============================================================================
+# view/view_protocol.py
+# ============================================================================
+
+"""
+View Protocol - Everything CurrencyController needs from a view
+
+CurrencyView implements it with Tk widgets and HeadlessView without a
+display. The controller must only use the methods listed here: no widget
+attributes, no `root`, no dialogs.
+"""
+
+from typing import Callable, Iterable, Optional, Protocol
+
+Callback = Callable[[], None]
+
+
+class SendPanelProtocol(Protocol):
+    def bind_quote(self, callback: Callback) -> None: ...
+    def bind_load(self, callback: Callback) -> None: ...
+    def bind_export(self, callback: Callback) -> None: ...
+    def get_text(self) -> str: ...
+    def ask_open_path(self) -> Optional[str]: ...
+    def ask_save_path(self) -> Optional[str]: ...
+    def show_status(self, message: str) -> None: ...
+    def show_quotes(self, quotes, source: str) -> None: ...
+
+
+class ChartsPanelProtocol(Protocol):
+    def set_currencies(self, currencies: list) -> None: ...
+    def get_selection(self) -> tuple: ...
+    def bind_selection_changed(self, callback: Callback) -> None: ...
+    def show_series(self, timestamps, rates) -> None: ...
+    def append_points(self, timestamps, rates) -> None: ...
+    def last_timestamp(self) -> Optional[float]: ...
+    def show_status(self, message: str) -> None: ...
+
+
+class AlertsPanelProtocol(Protocol):
+    def bind_add(self, callback: Callback) -> None: ...
+    def bind_remove(self, callback: Callback) -> None: ...
+    def set_currencies(self, currencies: list) -> None: ...
+    def get_rule_input(self) -> tuple: ...
+    def show_rules(self, rules: Iterable) -> None: ...
+    def insert_rules(self, rules: Iterable) -> None: ...
+    def delete_rules(self, rule_ids: Iterable) -> None: ...
+    def update_rules(self, rules: Iterable) -> None: ...
+    def selected_rule_ids(self) -> list: ...
+    def add_fired(self, messages: list, when=None) -> None: ...
+
+
+class CurrencyViewProtocol(Protocol):
+    spinner_active: bool
+
+    # Event loop: callbacks always run on the UI thread
+    def after(self, ms: int, callback: Callback): ...
+    def after_idle(self, callback: Callback): ...
+
+    # User actions
+    def bind_convert(self, callback: Callback) -> None: ...
+    def bind_swap(self, callback: Callback) -> None: ...
+    def bind_input_changed(self, callback: Callback) -> None: ...
+    def bind_refresh(self, callback: Callback) -> None: ...
+
+    # Deferred tabs ("Send", "Charts", "Alerts")
+    def bind_page_built(self, tab_name: str, callback: Callable[[object], None]) -> None: ...
+    def page_panel(self, tab_name: str): ...
+    @property
+    def send_panel(self) -> SendPanelProtocol: ...
+    @property
+    def charts_panel(self) -> ChartsPanelProtocol: ...
+    @property
+    def alerts_panel(self) -> AlertsPanelProtocol: ...
+
+    # Input
+    def populate_currencies(self, currencies: list, index=None, favorites=()) -> None: ...
+    def get_amount(self) -> Optional[float]: ...
+    def get_from_currency(self) -> Optional[str]: ...
+    def get_to_currency(self) -> Optional[str]: ...
+    def swap_currencies(self) -> None: ...
+
+    # Output
+    def show_spinner(self) -> None: ...
+    def hide_spinner(self) -> None: ...
+    def display_result(self, amount, from_c, to_c, result, rate, digits=2) -> None: ...
+    def display_hint(self, message: str) -> None: ...
+    def update_status(self, msg: str) -> None: ...
+    def notify(self, message: str) -> None: ...
+    def show_error(self, title: str, message: str) -> None: ...
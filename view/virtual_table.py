@@ -0,0 +1,84 @@
+# ============================================================================
+# view/virtual_table.py
+# ============================================================================
+
+"""
+Virtual Table - Treeview window over a large row source
+
+Only the rows in view exist as Treeview items. Scrolling moves an offset into
+the source and re-fills the same items, so 50k rows cost as much as 15.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTable:
+    """Scrollable table that materializes only its visible rows"""
+
+    def __init__(self, parent, columns, visible_rows=15, widths=None):
+        self.frame = tk.Frame(parent, bg="white")
+        self.visible_rows = visible_rows
+        self.count = 0
+        self.fetch = None  # fetch(start, stop) -> list of row tuples
+        self.offset = 0
+        self.materialized = 0  # rows formatted so far (for benchmarks)
+        self._items = []
+
+        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings",
+                                 height=visible_rows, selectmode="none")
+        for column in columns:
+            self.tree.heading(column, text=column)
+            self.tree.column(column, width=(widths or {}).get(column, 90), anchor="w")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree.bind("<MouseWheel>", self.on_wheel)
+        self.tree.bind("<Button-4>", self.on_wheel)  # X11 wheel
+        self.tree.bind("<Button-5>", self.on_wheel)
+        self.tree.bind("<Prior>", lambda e: self.scroll_to(self.offset - self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self.scroll_to(self.offset + self.visible_rows))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0))
+        self.tree.bind("<End>", lambda e: self.scroll_to(self.count))
+
+    def set_source(self, count: int, fetch):
+        self.count = count
+        self.fetch = fetch
+        self.offset = 0
+        self.refresh()
+
+    def refresh(self):
+        """Re-fill the visible items from the source at the current offset"""
+        rows = self.fetch(self.offset, self.offset + self.visible_rows) if self.fetch else []
+        self.materialized += len(rows)
+        while len(self._items) < len(rows):
+            self._items.append(self.tree.insert("", "end"))
+        while len(self._items) > len(rows):
+            self.tree.delete(self._items.pop())
+        for iid, row in zip(self._items, rows):
+            self.tree.item(iid, values=row)
+
+        if self.count:
+            last = min(1.0, (self.offset + self.visible_rows) / self.count)
+            self.scrollbar.set(self.offset / self.count, last)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), self.count - self.visible_rows))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.count)
+        elif action == "scroll":
+            step = int(amount) * (self.visible_rows if unit == "pages" else 1)
+            self.scroll_to(self.offset + step)
+
+    def on_wheel(self, event):
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.scroll_to(self.offset + (-3 if up else 3))
+        return "break"